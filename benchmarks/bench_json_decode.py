@@ -0,0 +1,61 @@
+"""Compares parsing a bootstrap-static response with the old text round trip and the bytes backends.
+
+Usage: python benchmarks/bench_json_decode.py [PAYLOAD]
+
+PAYLOAD is a recorded `bootstrap-static/` response. Without it, the response is
+fetched once and recorded to `benchmarks/data/bootstrap-static.json`.
+"""
+from __future__ import annotations
+from fplpy.util.external.api import get_url
+from fplpy.util.external.http_cache import fetch_content
+from fplpy.util.external.json_backend import orjson_loads, stdlib_loads
+from typing import Any, Callable
+import json
+import os
+import sys
+import timeit
+
+
+RECORDED_PAYLOAD = os.path.join(os.path.dirname(__file__), "data", "bootstrap-static.json")
+
+
+def text_round_trip(content: bytes) -> Any:
+    """Decode path `call_api` used before parsing from bytes."""
+    utf8 = content.decode("utf8").encode("utf8")
+    json_data = utf8.decode("unicode_escape")
+
+    return json.loads(json_data)
+
+
+def load_payload(path: str) -> bytes:
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(fetch_content(get_url("BOOTSTRAP-STATIC")))
+
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def main() -> None:
+    content = load_payload(sys.argv[1] if len(sys.argv) > 1 else RECORDED_PAYLOAD)
+    print(f"payload: {len(content) / 1e6:.2f} MB")
+
+    candidates: dict[str, Callable[[bytes], Any]] = {
+        "text round trip": text_round_trip,
+        "stdlib bytes": stdlib_loads,
+    }
+    try:
+        orjson_loads(b"{}")
+        candidates["orjson bytes"] = orjson_loads
+    except ImportError:
+        print("orjson not installed, skipping")
+
+    for name, loads in candidates.items():
+        runs = 20
+        seconds = min(timeit.repeat(lambda: loads(content), number=runs, repeat=3)) / runs
+        print(f"{name:>16}: {seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Compares memory per `PlayerSummary`, and pickled size, with and without slots and interning.
+
+Usage: python benchmarks/bench_memory.py [N_SUMMARIES]
+
+"before" uses an unslotted copy of `PlayerSummaryModel`, built with `__init__` from
+CSV-like rows with no interning, wrapped in an element with an instance `__dict__`.
+"after" is the current `PlayerSummary` built with the model's decoder.
+"""
+from __future__ import annotations
+from fplpy.objects._element.decoder import model_decoder
+from fplpy.objects._element.schema import FieldKind, model_schema
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.objects.summary import ObjTypes
+from dataclasses import asdict, dataclass, fields, make_dataclass
+from typing import Any, Callable
+import pickle
+import sys
+import tracemalloc
+
+
+UnslottedSummaryModel = make_dataclass(
+    "UnslottedSummaryModel",
+    [(f.name, f.type) for f in fields(PlayerSummaryModel)],
+    frozen=True,
+    kw_only=True,
+)
+UnslottedSummaryModel.__module__ = __name__
+
+
+@dataclass
+class UnslottedElement:
+    value: Any
+
+
+def csv_rows(n: int) -> list[dict[str, str]]:
+    """Rows as a CSV reader returns them: a new string object for every value."""
+    rows = []
+    for i in range(n):
+        row: dict[str, str] = {}
+        for spec in model_schema(PlayerSummaryModel):
+            if spec.kind == FieldKind.BOOL:
+                row[spec.name] = "True" if i % 2 else "False"
+            elif spec.kind == FieldKind.STR and not spec.numeric_str:
+                row[spec.name] = "".join(["2024-08-", str(10 + i % 20), "T14:00:00Z"])
+            elif spec.numeric_str:
+                row[spec.name] = "".join([str(i % 7), ".0"])
+            else:
+                row[spec.name] = str(i % 100)
+        rows.append(row)
+
+    return rows
+
+
+def before(rows: list[dict[str, str]]) -> list[Any]:
+    converters = {int: int, float: float, bool: lambda v: v == "True"}
+    elements = []
+    for row in rows:
+        values = {f.name: converters.get(f.type, str)(row[f.name]) for f in fields(UnslottedSummaryModel)}
+        elements.append(UnslottedElement(UnslottedSummaryModel(**values)))
+
+    return elements
+
+
+def after(rows: list[dict[str, str]]) -> list[Any]:
+    return [ObjTypes.PlayerSummary(model) for model in model_decoder(PlayerSummaryModel).decode_many(rows, from_strings=True)]
+
+
+def measure(name: str, build: Callable[[list[dict[str, str]]], list[Any]], n: int) -> None:
+    rows = csv_rows(n)
+
+    tracemalloc.start()
+    elements = build(rows)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pickled = len(pickle.dumps(elements[:1000], protocol=pickle.HIGHEST_PROTOCOL)) / min(n, 1000)
+    print(f"{name:>7}: {allocated / n:8.0f} bytes per summary, {pickled:6.0f} bytes pickled")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{n} summaries, {len(fields(PlayerSummaryModel))} fields")
+
+    measure("before", before, n)
+    measure("after", after, n)
+
+    assert asdict(after(csv_rows(1))[0].value) == asdict(before(csv_rows(1))[0].value)
+
+
+if __name__ == "__main__":
+    main()
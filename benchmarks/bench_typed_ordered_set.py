@@ -0,0 +1,45 @@
+"""Times building, checking membership in and slicing a `TypedOrderedSet`.
+
+Usage: python benchmarks/bench_typed_ordered_set.py [SIZE ...]
+
+By default runs at 10k, 30k and 100k items. Building appends one item at a time, as
+`TypedOrderedSet(items)` did before `extend()`, and in bulk with `extend()` and
+`from_trusted()`.
+"""
+from __future__ import annotations
+from fplpy.util.typed_ordered_set import TypedOrderedSet
+from typing import Callable
+import sys
+import timeit
+
+
+def one_at_a_time(items: list[int]) -> TypedOrderedSet[int]:
+    s: TypedOrderedSet[int] = TypedOrderedSet([])
+    for item in items:
+        s.append(item)
+
+    return s
+
+
+def time(fn: Callable[[], object], number: int = 3) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=number))
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 30_000, 100_000]
+
+    for size in sizes:
+        items = list(range(size))
+        s = TypedOrderedSet(items)
+        probes = items[::10]
+
+        print(f"{size} items")
+        print(f"  append each   {time(lambda: one_at_a_time(items)):8.4f}s")
+        print(f"  constructor   {time(lambda: TypedOrderedSet(items)):8.4f}s")
+        print(f"  from_trusted  {time(lambda: TypedOrderedSet.from_trusted(items)):8.4f}s")
+        print(f"  {len(probes)} lookups {time(lambda: [p in s for p in probes]):8.4f}s")
+        print(f"  half slice    {time(lambda: s[: size // 2]):8.4f}s")
+
+
+if __name__ == "__main__":
+    main()
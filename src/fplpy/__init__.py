@@ -1,8 +1,17 @@
-from .repository_factory.presets import APIRepositoryFactory, GitHubRepositoryFactory, RepositoryFactory202425
+from .repository_factory.presets import APIRepositoryFactory, GitHubRepositoryFactory, RepositoryFactory202425, \
+    LocalRepositoryFactory
 from .repository_factory.template import RepositoryFactoryTemplate
+from .repository_factory.bulk import fetch_all_player_summaries
+from .util.external.mirror import sync_season
+from .storage.snapshot import save_snapshot, load_snapshot
+from .storage.stat_cube import StatCube, build_stat_cube
 
 from .objects.summary import ObjTypes, RepoTypes
 
 from .enrichment.player import PlayerEnricher, PlayerCostTracker
 from .enrichment.fixture import FixtureEnricher
 from .enrichment.player_summary import PlayerSummaryEnricher
+from .enrichment.price_matrix import PriceMatrix
+from .enrichment.fixture_matrix import FixtureMatrix
+
+from .optimization.squad import SquadConstraints, optimize_squad
@@ -1,6 +1,6 @@
 from .template import BaseEnricher
-from ..objects.summary import ObjTypes
-from typing import TypedDict, Optional
+from ..objects.summary import ObjTypes, RepoTypes
+from typing import TypedDict, Optional, Iterable
 
 
 class FixtureEnrichmentOutput(TypedDict):
@@ -11,18 +11,26 @@ class FixtureEnrichmentOutput(TypedDict):
 
 class FixtureEnricher(BaseEnricher[ObjTypes.Fixture, FixtureEnrichmentOutput]):
     def enrich(self, obj: ObjTypes.Fixture) -> FixtureEnrichmentOutput:
+        return self.enrich_many([obj])[0]
+
+    def enrich_many(self, objs: Iterable[ObjTypes.Fixture]) -> list[FixtureEnrichmentOutput]:
         team_repo = self._repo_factory.teams()
-        team_h = team_repo.get_by_id(obj.value.team_h)
-        team_a = team_repo.get_by_id(obj.value.team_a)
-        
-        if team_h is None or team_a is None:
-            raise Exception("Enriching home or away team returned None")
-        
         event_repo = self._repo_factory.events()
-        event = event_repo.get_by_id(obj.value.event)
-        
-        return {
-            "event": event,
-            "team_h": team_h,
-            "team_a": team_a
-        }
+
+        return [_enrich_fixture(obj, team_repo, event_repo) for obj in objs]
+
+
+def _enrich_fixture(obj: ObjTypes.Fixture, team_repo: RepoTypes.TeamRepo, event_repo: RepoTypes.EventRepo) -> FixtureEnrichmentOutput:
+    team_h = team_repo.get_by_id(obj.value.team_h)
+    team_a = team_repo.get_by_id(obj.value.team_a)
+
+    if team_h is None or team_a is None:
+        raise Exception("Enriching home or away team returned None")
+
+    event = event_repo.get_by_id(obj.value.event)
+
+    return {
+        "event": event,
+        "team_h": team_h,
+        "team_a": team_a
+    }
@@ -0,0 +1,241 @@
+from __future__ import annotations
+from ..objects.summary import ObjTypes
+from ..repository_factory.template import RepositoryFactoryTemplate
+from typing import Iterable, Sequence
+import numpy as np
+import numpy.typing as npt
+
+
+NO_OPPONENT = -1  # padding in `opponents` for teams with fewer fixtures in an event than the most any team has
+
+
+class FixtureMatrix:
+    """Fixtures of every team in every event, as teams x events arrays.
+
+    Rows are teams, keyed by `id`, and columns are events, keyed by `id`. Each cell
+    holds the team's number of fixtures in the event, 0 for a blank and 2 or more for
+    a double, their summed difficulty for that team, and how many are at home.
+    Fixtures without an event, such as postponed ones, are left out.
+    """
+    __team_ids: npt.NDArray[np.int64]
+    __event_ids: npt.NDArray[np.int64]
+    __counts: npt.NDArray[np.int64]
+    __difficulty: npt.NDArray[np.int64]
+    __home_counts: npt.NDArray[np.int64]
+    __opponents: npt.NDArray[np.int64]
+
+    def __init__(
+        self,
+        team_ids: npt.ArrayLike,
+        event_ids: npt.ArrayLike,
+        counts: npt.ArrayLike,
+        difficulty: npt.ArrayLike,
+        home_counts: npt.ArrayLike,
+        opponents: npt.ArrayLike
+    ) -> None:
+        self.__team_ids = np.asarray(team_ids, dtype=np.int64)
+        self.__event_ids = np.asarray(event_ids, dtype=np.int64)
+        self.__counts = np.array(counts, dtype=np.int64)
+        self.__difficulty = np.array(difficulty, dtype=np.int64)
+        self.__home_counts = np.array(home_counts, dtype=np.int64)
+        self.__opponents = np.array(opponents, dtype=np.int64)
+
+        shape = (len(self.__team_ids), len(self.__event_ids))
+        if self.__counts.shape != shape or self.__difficulty.shape != shape or self.__home_counts.shape != shape:
+            raise ValueError("counts, difficulty and home_counts must have shape (teams, events)")
+        if self.__opponents.shape[:2] != shape:
+            raise ValueError("opponents must have shape (teams, events, fixtures)")
+
+        for array in (self.__counts, self.__difficulty, self.__home_counts, self.__opponents):
+            array.flags.writeable = False
+
+        # team id -> row, so many team ids can be mapped to rows at once
+        self.__row_by_team = np.full(int(self.__team_ids.max(initial=0)) + 1, -1, dtype=np.int64)
+        self.__row_by_team[self.__team_ids] = np.arange(len(self.__team_ids))
+        self.__col_by_event = {int(event_id): col for col, event_id in enumerate(self.__event_ids)}
+
+    @classmethod
+    def from_fixtures(
+        cls,
+        teams: Sequence[ObjTypes.Team],
+        events: Sequence[ObjTypes.Event],
+        fixtures: Iterable[ObjTypes.Fixture]
+    ) -> "FixtureMatrix":
+        """Builds the matrix in one pass over `fixtures`.
+
+        Parameters
+        ----------
+        teams : Sequence[ObjTypes.Team]
+            Teams to include, one row each in this order.
+        events : Sequence[ObjTypes.Event]
+            Events to include, one column each in this order.
+        fixtures : Iterable[ObjTypes.Fixture]
+            Fixtures between any of `teams` in any of `events`. Others are ignored.
+        """
+        row_by_team = {team.id: row for row, team in enumerate(teams)}
+        col_by_event = {event.id: col for col, event in enumerate(events)}
+
+        # one entry per team per fixture, in fixture order
+        rows: list[int] = []
+        cols: list[int] = []
+        difficulties: list[int] = []
+        at_home: list[bool] = []
+        opponent_ids: list[int] = []
+        for fixture in fixtures:
+            fixture_value = fixture.value
+            col = col_by_event.get(fixture_value.event)
+            home_row = row_by_team.get(fixture_value.team_h)
+            away_row = row_by_team.get(fixture_value.team_a)
+            if col is None or home_row is None or away_row is None:
+                continue
+
+            rows += (home_row, away_row)
+            cols += (col, col)
+            difficulties += (fixture_value.team_h_difficulty, fixture_value.team_a_difficulty)
+            at_home += (True, False)
+            opponent_ids += (fixture_value.team_a, fixture_value.team_h)
+
+        shape = (len(teams), len(events))
+        counts = np.zeros(shape, dtype=np.int64)
+        difficulty = np.zeros(shape, dtype=np.int64)
+        home_counts = np.zeros(shape, dtype=np.int64)
+
+        cells = (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp))
+        np.add.at(counts, cells, 1)
+        np.add.at(difficulty, cells, np.array(difficulties, dtype=np.int64))
+        np.add.at(home_counts, cells, np.array(at_home, dtype=np.int64))
+
+        return cls(
+            team_ids=[team.id for team in teams],
+            event_ids=[event.id for event in events],
+            counts=counts,
+            difficulty=difficulty,
+            home_counts=home_counts,
+            opponents=_opponents(cells, np.array(opponent_ids, dtype=np.int64), shape, int(counts.max(initial=0))),
+        )
+
+    @classmethod
+    def from_repo_factory(cls, repo_factory: RepositoryFactoryTemplate) -> "FixtureMatrix":
+        """Builds the matrix for every team and event of `repo_factory`."""
+        return cls.from_fixtures(
+            repo_factory.teams().get_all(),
+            repo_factory.events().get_all(),
+            repo_factory.fixtures().get_all()
+        )
+
+    @property
+    def team_ids(self) -> npt.NDArray[np.int64]:
+        return self.__team_ids
+
+    @property
+    def event_ids(self) -> npt.NDArray[np.int64]:
+        return self.__event_ids
+
+    @property
+    def counts(self) -> npt.NDArray[np.int64]:
+        """Read-only teams x events array of the number of fixtures."""
+        return self.__counts
+
+    @property
+    def difficulty(self) -> npt.NDArray[np.int64]:
+        """Read-only teams x events array of summed fixture difficulty, 0 in blanks."""
+        return self.__difficulty
+
+    @property
+    def home_counts(self) -> npt.NDArray[np.int64]:
+        """Read-only teams x events array of the number of home fixtures."""
+        return self.__home_counts
+
+    @property
+    def away_counts(self) -> npt.NDArray[np.int64]:
+        return self.__counts - self.__home_counts
+
+    @property
+    def opponents(self) -> npt.NDArray[np.int64]:
+        """Read-only teams x events x fixtures array of opponent team ids, padded with `NO_OPPONENT`."""
+        return self.__opponents
+
+    @property
+    def blanks(self) -> npt.NDArray[np.bool_]:
+        blanks: npt.NDArray[np.bool_] = self.__counts == 0
+
+        return blanks
+
+    @property
+    def doubles(self) -> npt.NDArray[np.bool_]:
+        doubles: npt.NDArray[np.bool_] = self.__counts >= 2
+
+        return doubles
+
+    def team_rows(self, team_ids: npt.ArrayLike) -> npt.NDArray[np.int64]:
+        """Row of each of `team_ids`, e.g. players' `team`, to broadcast per team arrays to them.
+
+        Raises
+        ------
+        KeyError
+            If a team isn't in the matrix.
+        """
+        ids = np.asarray(team_ids, dtype=np.int64)
+        in_bounds = (ids >= 0) & (ids < len(self.__row_by_team))
+        rows = np.where(in_bounds, self.__row_by_team[np.where(in_bounds, ids, 0)], -1)
+
+        if (rows < 0).any():
+            raise KeyError(f"Teams not in the matrix: {sorted(set(ids[rows < 0].tolist()))}")
+
+        return rows
+
+    def next_counts(self, event_id: int, n: int) -> npt.NDArray[np.int64]:
+        """Number of fixtures of every team over the `n` events from `event_id`, in column order."""
+        counts: npt.NDArray[np.int64] = self.__counts[:, self.__next_columns(event_id, n)].sum(axis=1)
+
+        return counts
+
+    def next_difficulty(self, event_id: int, n: int) -> npt.NDArray[np.int64]:
+        """Summed difficulty of every team's fixtures over the `n` events from `event_id`."""
+        difficulty: npt.NDArray[np.int64] = self.__difficulty[:, self.__next_columns(event_id, n)].sum(axis=1)
+
+        return difficulty
+
+    def next_mean_difficulty(self, event_id: int, n: int) -> npt.NDArray[np.float64]:
+        """Mean difficulty per fixture of every team over the `n` events from `event_id`, NaN with no fixtures."""
+        counts = self.next_counts(event_id, n)
+        difficulty = self.next_difficulty(event_id, n)
+
+        mean: npt.NDArray[np.float64] = np.divide(difficulty, counts, out=np.full(len(counts), np.nan), where=counts > 0)
+
+        return mean
+
+    def for_players(self, players: Sequence[ObjTypes.Player], team_values: npt.ArrayLike) -> npt.NDArray[np.generic]:
+        """Broadcasts a per team array, e.g. from `next_difficulty()`, to `players` by their `team`."""
+        return np.asarray(team_values)[self.team_rows([player.value.team for player in players])]
+
+    def __next_columns(self, event_id: int, n: int) -> slice:
+        if n < 0:
+            raise ValueError("n must not be negative")
+
+        start = self.__col_by_event[event_id]
+        return slice(start, start + n)
+
+
+def _opponents(
+    cells: tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]],
+    opponent_ids: npt.NDArray[np.int64],
+    shape: tuple[int, int],
+    max_fixtures: int
+) -> npt.NDArray[np.int64]:
+    """Opponents in each cell, in the order they were given, padded with `NO_OPPONENT`."""
+    opponents = np.full((*shape, max_fixtures), NO_OPPONENT, dtype=np.int64)
+    if len(opponent_ids) == 0:
+        return opponents
+
+    rows, cols = cells
+    flat = rows * shape[1] + cols
+    order = np.argsort(flat, kind="stable")
+    sorted_flat = flat[order]
+
+    # position of each entry within its cell: its index minus the index of the cell's first entry
+    _, starts, cell_sizes = np.unique(sorted_flat, return_index=True, return_counts=True)
+    slots = np.arange(len(order)) - np.repeat(starts, cell_sizes)
+    opponents[rows[order], cols[order], slots] = opponent_ids[order]
+
+    return opponents
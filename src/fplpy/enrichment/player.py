@@ -1,7 +1,7 @@
 from .template import BaseEnricher
 from ..objects.summary import ObjTypes, RepoTypes
 from ..repository_factory.template import RepositoryFactoryTemplate
-from typing import TypedDict, Optional, TypeVar, Any
+from typing import TypedDict, Optional, TypeVar, Any, Iterable
 from .player_summary import PlayerSummaryEnricher
 
 
@@ -15,22 +15,30 @@ class PlayerEnrichmentOutput(TypedDict):
 
 class PlayerEnricher(BaseEnricher[ObjTypes.Player, PlayerEnrichmentOutput]):
     def enrich(self, obj: ObjTypes.Player) -> PlayerEnrichmentOutput:
+        return self.enrich_many([obj])[0]
+
+    def enrich_many(self, objs: Iterable[ObjTypes.Player]) -> list[PlayerEnrichmentOutput]:
         team_repo = self._repo_factory.teams()
-        team = team_repo.get_by_code(obj.value.team_code)
-        
-        if team is None:
-            raise Exception("Enriching player's team returned None")
-        
         position_repo = self._repo_factory.positions()
-        position = position_repo.get_by_id(obj.value.element_type)
-        
-        if position is None:
-            raise Exception("Enriching player's position returned None")
-        
-        return {
-            "team": team,
-            "position": position
-        }
+
+        return [_enrich_player(obj, team_repo, position_repo) for obj in objs]
+
+
+def _enrich_player(obj: ObjTypes.Player, team_repo: RepoTypes.TeamRepo, position_repo: RepoTypes.PositionRepo) -> PlayerEnrichmentOutput:
+    team = team_repo.get_by_code(obj.value.team_code)
+
+    if team is None:
+        raise Exception("Enriching player's team returned None")
+
+    position = position_repo.get_by_id(obj.value.element_type)
+
+    if position is None:
+        raise Exception("Enriching player's position returned None")
+
+    return {
+        "team": team,
+        "position": position
+    }
         
         
 class PlayerCostTracker:
@@ -96,9 +104,10 @@ def get_cost_at_event_unfilled(player: ObjTypes.Player, repo_factory: Repository
     player_summary_repo = repo_factory.player_summary(player)
     enrich_engine = PlayerSummaryEnricher(repo_factory)
 
-    for player_summary in player_summary_repo.get_all():
+    player_summaries = player_summary_repo.get_all()
+
+    for player_summary, player_summary_enriched in zip(player_summaries, enrich_engine.enrich_many(player_summaries)):
         cost = player_summary.value.value
-        player_summary_enriched = enrich_engine.enrich(player_summary)
         event = player_summary_enriched["event"]
             
         cost_at_event_unfilled[event] = cost
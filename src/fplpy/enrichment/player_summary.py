@@ -1,7 +1,7 @@
 from .template import BaseEnricher
 from ..objects.summary import ObjTypes
 from .fixture import FixtureEnricher
-from typing import TypedDict, Optional
+from typing import TypedDict, Iterable
 
 
 class PlayerSummaryEnrichmentOutput(TypedDict):
@@ -11,19 +11,36 @@ class PlayerSummaryEnrichmentOutput(TypedDict):
 
 class PlayerSummaryEnricher(BaseEnricher[ObjTypes.PlayerSummary, PlayerSummaryEnrichmentOutput]):
     def enrich(self, obj: ObjTypes.PlayerSummary) -> PlayerSummaryEnrichmentOutput:
+        return self.enrich_many([obj])[0]
+
+    def enrich_many(self, objs: Iterable[ObjTypes.PlayerSummary]) -> list[PlayerSummaryEnrichmentOutput]:
         fixture_repo = self._repo_factory.fixtures()
-        
-        fixture = fixture_repo.get_by_id(obj.value.fixture)
-        if fixture is None:
-            raise Exception("Enriching player_summary's fixture returned None")
-        
+
+        fixtures = []
+        for obj in objs:
+            fixture = fixture_repo.get_by_id(obj.value.fixture)
+            if fixture is None:
+                raise Exception("Enriching player_summary's fixture returned None")
+
+            fixtures.append(fixture)
+
+        # Each fixture is shared by many summaries, so only enrich each one once
+        unique_fixtures = list(dict.fromkeys(fixtures))
         fixture_enrich_engine = FixtureEnricher(self._repo_factory)
-        fixture_enriched = fixture_enrich_engine.enrich(fixture)
-        event = fixture_enriched["event"]
-        if event is None:
-            raise Exception("Enriching player_summary's event returned None")
-        
-        return {
-            "event": event,
-            "fixture": fixture
+        event_by_fixture = {
+            fixture: fixture_enriched["event"]
+            for fixture, fixture_enriched in zip(unique_fixtures, fixture_enrich_engine.enrich_many(unique_fixtures))
         }
+
+        res: list[PlayerSummaryEnrichmentOutput] = []
+        for fixture in fixtures:
+            event = event_by_fixture[fixture]
+            if event is None:
+                raise Exception("Enriching player_summary's event returned None")
+
+            res.append({
+                "event": event,
+                "fixture": fixture
+            })
+
+        return res
@@ -0,0 +1,188 @@
+from __future__ import annotations
+from ..objects.summary import ObjTypes
+from ..repository_factory.template import RepositoryFactoryTemplate
+from .player import PlayerCostTracker
+from typing import Iterable, Optional, Sequence
+import numpy as np
+import numpy.typing as npt
+
+
+class PriceMatrix:
+    """Cost of every player at the deadline of every event, as a players x events array.
+
+    Rows are players, keyed by `code`, and columns are events, keyed by `id`. Built
+    with the same assumptions as `PlayerCostTracker`: a summary's `value` is the cost
+    at the deadline of its fixture's event, and events with no summary carry the
+    previous event's cost forward.
+    """
+    __player_codes: npt.NDArray[np.int64]
+    __event_ids: npt.NDArray[np.int64]
+    __teams: npt.NDArray[np.int64]
+    __positions: npt.NDArray[np.int64]
+    __costs: npt.NDArray[np.int64]
+
+    def __init__(
+        self,
+        player_codes: npt.ArrayLike,
+        event_ids: npt.ArrayLike,
+        costs: npt.ArrayLike,
+        teams: npt.ArrayLike,
+        positions: npt.ArrayLike
+    ) -> None:
+        self.__player_codes = np.asarray(player_codes, dtype=np.int64)
+        self.__event_ids = np.asarray(event_ids, dtype=np.int64)
+        self.__costs = np.array(costs, dtype=np.int64)
+        self.__teams = np.asarray(teams, dtype=np.int64)
+        self.__positions = np.asarray(positions, dtype=np.int64)
+
+        if self.__costs.shape != (len(self.__player_codes), len(self.__event_ids)):
+            raise ValueError("costs must have shape (players, events)")
+
+        self.__costs.flags.writeable = False
+        self.__row_by_code = {int(code): row for row, code in enumerate(self.__player_codes)}
+        self.__col_by_event = {int(event_id): col for col, event_id in enumerate(self.__event_ids)}
+
+    @classmethod
+    def from_summaries(
+        cls,
+        players: Sequence[ObjTypes.Player],
+        events: Sequence[ObjTypes.Event],
+        fixtures: Iterable[ObjTypes.Fixture],
+        summaries: Iterable[ObjTypes.PlayerSummary],
+        default_cost: int = 0
+    ) -> "PriceMatrix":
+        """Builds the matrix in one pass over every player's summaries.
+
+        Parameters
+        ----------
+        players : Sequence[ObjTypes.Player]
+            Players to include, one row each in this order.
+        events : Sequence[ObjTypes.Event]
+            Events to include, one column each in this order.
+        fixtures : Iterable[ObjTypes.Fixture]
+            Fixtures, to find the event of each summary.
+        summaries : Iterable[ObjTypes.PlayerSummary]
+            Summaries of any of `players`. Others are ignored.
+        default_cost : int, optional
+            Cost before a player's first summary, by default 0.
+        """
+        row_by_id = {player.id: row for row, player in enumerate(players)}
+        col_by_event = {event.id: col for col, event in enumerate(events)}
+        col_by_fixture = {
+            fixture.id: col_by_event[fixture.value.event]
+            for fixture in fixtures
+            if fixture.value.event in col_by_event
+        }
+
+        rows: list[int] = []
+        cols: list[int] = []
+        values: list[int] = []
+        for summary in summaries:
+            row = row_by_id.get(summary.value.element)
+            col = col_by_fixture.get(summary.value.fixture)
+            if row is None or col is None:
+                continue
+
+            rows.append(row)
+            cols.append(col)
+            values.append(summary.value.value)
+
+        shape = (len(players), len(events))
+        costs = np.zeros(shape, dtype=np.int64)
+        known = np.zeros(shape, dtype=bool)
+        costs[rows, cols] = values
+        known[rows, cols] = True
+
+        return cls(
+            player_codes=[player.code for player in players],
+            event_ids=[event.id for event in events],
+            costs=forward_fill(costs, known, default_cost),
+            teams=[player.value.team for player in players],
+            positions=[player.value.element_type for player in players],
+        )
+
+    @classmethod
+    def from_repo_factory(
+        cls,
+        repo_factory: RepositoryFactoryTemplate,
+        players: Optional[Sequence[ObjTypes.Player]] = None,
+        default_cost: int = 0
+    ) -> "PriceMatrix":
+        """Builds the matrix for `players`, by default every player, from `repo_factory`.
+
+        Summaries are read with `repo_factory.player_summary()` for each player. With the
+        API, `fetch_all_player_summaries()` can fetch them all concurrently beforehand.
+        """
+        if players is None:
+            players = repo_factory.players().get_all()
+
+        summaries = (
+            summary
+            for player in players
+            for summary in repo_factory.player_summary(player).get_all()
+        )
+
+        return cls.from_summaries(
+            players,
+            repo_factory.events().get_all(),
+            repo_factory.fixtures().get_all(),
+            summaries,
+            default_cost
+        )
+
+    @property
+    def costs(self) -> npt.NDArray[np.int64]:
+        """Read-only players x events array of costs."""
+        return self.__costs
+
+    @property
+    def player_codes(self) -> npt.NDArray[np.int64]:
+        return self.__player_codes
+
+    @property
+    def event_ids(self) -> npt.NDArray[np.int64]:
+        return self.__event_ids
+
+    def cost(self, player_code: int, event_id: int) -> int:
+        return int(self.__costs[self.__row_by_code[player_code], self.__col_by_event[event_id]])
+
+    def for_team(self, team_id: int) -> "PriceMatrix":
+        """Rows of players whose `team` is `team_id`."""
+        return self.__select_rows(self.__teams == team_id)
+
+    def for_position(self, element_type: int) -> "PriceMatrix":
+        """Rows of players whose `element_type` is `element_type`."""
+        return self.__select_rows(self.__positions == element_type)
+
+    def tracker(self, player: ObjTypes.Player, events: Iterable[ObjTypes.Event]) -> PlayerCostTracker:
+        """`PlayerCostTracker` for `player`, read from the matrix rather than rebuilt from summaries."""
+        costs = self.__costs[self.__row_by_code[player.code]]
+
+        return PlayerCostTracker(player, {
+            event: int(costs[self.__col_by_event[event.id]])
+            for event in events
+            if event.id in self.__col_by_event
+        })
+
+    def __select_rows(self, mask: npt.NDArray[np.bool_]) -> "PriceMatrix":
+        return PriceMatrix(
+            self.__player_codes[mask],
+            self.__event_ids,
+            self.__costs[mask],
+            self.__teams[mask],
+            self.__positions[mask],
+        )
+
+
+def forward_fill(values: npt.NDArray[np.int64], known: npt.NDArray[np.bool_], default: int) -> npt.NDArray[np.int64]:
+    """Replaces unknown cells with the last known value to their left in the same row.
+
+    Cells with no known value to their left are set to `default`.
+    """
+    n_cols = values.shape[1]
+    last_known = np.where(known, np.arange(n_cols), -1)
+    np.maximum.accumulate(last_known, axis=1, out=last_known)
+
+    filled = np.take_along_axis(values, np.maximum(last_known, 0), axis=1)
+
+    return np.where(last_known >= 0, filled, default)
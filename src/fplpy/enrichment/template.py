@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, Iterable
 from abc import ABC, abstractmethod
 from ..repository_factory.template import RepositoryFactoryTemplate
 
@@ -15,3 +15,10 @@ class BaseEnricher(Generic[T_input, T_output]):
     @abstractmethod
     def enrich(self, obj: T_input) -> T_output:
         ...
+
+    def enrich_many(self, objs: Iterable[T_input]) -> list[T_output]:
+        """Enriches a batch of objects, in order.
+
+        Subclasses override this to build their lookup repositories once per batch.
+        """
+        return [self.enrich(obj) for obj in objs]
@@ -0,0 +1,266 @@
+from __future__ import annotations
+from .model import T_model
+from .schema import FieldKind, FieldSpec, model_schema
+from .decoder import is_missing, is_missing_str, to_bool, to_int
+from .source import DataSourceModel
+from ...util.dt import parse_iso_datetimes
+from dataclasses import asdict
+from typing import Any, Generic, Iterable, Iterator, Mapping, Optional, Sequence, Type, Union
+import math
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+
+class ColumnStore(Generic[T_model]):
+    """Rows of one model type stored as one typed NumPy array per field.
+
+    - int and bool fields are int64/bool arrays, with a mask for missing values.
+    - float fields are float64 arrays with NaN for missing values.
+    - str fields are dictionary encoded: int32 codes into a list of distinct values, -1 for None.
+      Fields marked `NUMERIC_STR` are parsed to float64 when asked for, see `numbers()`.
+    - Anything else (lists) is kept in an object array.
+
+    Model objects are only built when rows are asked for.
+    """
+    __model_cls: Type[T_model]
+    __length: int
+    __values: dict[str, npt.NDArray[Any]]
+    __masks: dict[str, npt.NDArray[np.bool_]]
+    __categories: dict[str, list[str]]
+
+    def __init__(
+        self,
+        model_cls: Type[T_model],
+        values: dict[str, npt.NDArray[Any]],
+        masks: Optional[dict[str, npt.NDArray[np.bool_]]] = None,
+        categories: Optional[dict[str, list[str]]] = None
+    ) -> None:
+        self.__model_cls = model_cls
+        self.__values = values
+        self.__masks = masks or {}
+        self.__categories = categories or {}
+        self.__numbers: dict[str, npt.NDArray[np.float64]] = {}
+
+        lengths = {len(column) for column in values.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        self.__length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(cls, model_cls: Type[T_model], rows: Iterable[Mapping[str, Any]]) -> "ColumnStore[T_model]":
+        """Builds a store from raw rows, such as API JSON objects or GitHub CSV rows (all strings).
+
+        Keys that aren't fields of `model_cls` are ignored, missing keys are stored as missing values.
+        Values stand for no value as they do for `ModelDecoder`, e.g. "None" in a str field.
+        """
+        schema = model_schema(model_cls)
+        raw: dict[str, list[Any]] = {spec.name: [] for spec in schema}
+
+        for row in rows:
+            for spec in schema:
+                value = row.get(spec.name)
+                if spec.kind == FieldKind.STR and is_missing_str(value):
+                    value = None
+                raw[spec.name].append(value)
+
+        return cls.__from_raw_columns(model_cls, raw)
+
+    @classmethod
+    def from_models(cls, model_cls: Type[T_model], models: Iterable[T_model]) -> "ColumnStore[T_model]":
+        models = list(models)
+        raw = {spec.name: [getattr(model, spec.name) for model in models] for spec in model_schema(model_cls)}
+
+        return cls.__from_raw_columns(model_cls, raw)
+
+    @classmethod
+    def from_source(cls, model_cls: Type[T_model], source: DataSourceModel[T_model]) -> "ColumnStore[T_model]":
+        """Builds a store from the models a data source streams, see `DataSourceModel.iter()`."""
+        return cls.from_models(model_cls, source.iter())
+
+    @classmethod
+    def __from_raw_columns(cls, model_cls: Type[T_model], raw: dict[str, list[Any]]) -> "ColumnStore[T_model]":
+        values: dict[str, npt.NDArray[Any]] = {}
+        masks: dict[str, npt.NDArray[np.bool_]] = {}
+        categories: dict[str, list[str]] = {}
+
+        for spec in model_schema(model_cls):
+            column = raw[spec.name]
+
+            if spec.kind == FieldKind.FLOAT:
+                values[spec.name] = np.array([_to_float(v) for v in column], dtype=np.float64)
+
+            elif spec.kind in (FieldKind.INT, FieldKind.BOOL):
+                convert = to_int if spec.kind == FieldKind.INT else to_bool
+                mask = np.array([is_missing(v) for v in column], dtype=bool)
+                values[spec.name] = np.array(
+                    [0 if missing else convert(v) for v, missing in zip(column, mask)],
+                    dtype=np.int64 if spec.kind == FieldKind.INT else bool
+                )
+                if mask.any():
+                    masks[spec.name] = mask
+
+            elif spec.kind == FieldKind.STR:
+                codes, categories[spec.name] = _dictionary_encode(column)
+                values[spec.name] = codes
+
+            else:
+                values[spec.name] = np.empty(len(column), dtype=object)
+                values[spec.name][:] = column
+
+        return cls(model_cls, values, masks, categories)
+
+    @property
+    def model_cls(self) -> Type[T_model]:
+        return self.__model_cls
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def column(self, name: str) -> npt.NDArray[Any]:
+        """Array backing a field. For dictionary encoded fields these are the codes, see `categories()`."""
+        return self.__values[name]
+
+    def mask(self, name: str) -> Optional[npt.NDArray[np.bool_]]:
+        """Missing value mask of an int or bool field, None if no value is missing."""
+        return self.__masks.get(name)
+
+    def categories(self, name: str) -> Optional[list[str]]:
+        """Distinct values of a dictionary encoded field, None for other fields."""
+        return self.__categories.get(name)
+
+    def datetimes(self, name: str) -> npt.NDArray[np.datetime64]:
+        """A dictionary encoded field parsed as ISO datetimes, see `parse_iso_datetimes()`.
+
+        Only the distinct values are parsed. Returns `datetime64[us]` in UTC, NaT for
+        missing or unparseable values.
+        """
+        categories = self.__categories.get(name)
+        if categories is None:
+            raise ValueError(f"{name} is not a dictionary encoded field")
+
+        parsed = parse_iso_datetimes([*categories, None])
+        # code -1, for None, picks the NaT appended last
+        datetimes: npt.NDArray[np.datetime64] = parsed[self.__values[name]]
+
+        return datetimes
+
+    def numbers(self, name: str) -> npt.NDArray[np.float64]:
+        """A dictionary encoded field parsed as numbers, e.g. a `NUMERIC_STR` field.
+
+        Only the distinct values are parsed, once per field. Returns float64, NaN for
+        missing or unparseable values.
+        """
+        numbers = self.__numbers.get(name)
+        if numbers is not None:
+            return numbers
+
+        categories = self.__categories.get(name)
+        if categories is None:
+            raise ValueError(f"{name} is not a dictionary encoded field")
+
+        parsed: npt.NDArray[np.float64] = pd.to_numeric(pd.Series([*categories, None], dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+        # code -1, for None, picks the NaN appended last
+        self.__numbers[name] = parsed[self.__values[name]]
+
+        return self.__numbers[name]
+
+    def row(self, index: int) -> T_model:
+        """Builds the model for one row."""
+        return self.__model_cls(**{
+            spec.name: self.__value(spec, index)
+            for spec in model_schema(self.__model_cls)
+        })
+
+    def rows(self) -> Iterator[T_model]:
+        for index in range(self.__length):
+            yield self.row(index)
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """DataFrame over the column arrays, avoiding copies where pandas allows.
+
+        int and bool fields with missing values become nullable `Int64`/`boolean` columns,
+        `NUMERIC_STR` fields float64 columns, see `numbers()`, and other dictionary encoded
+        fields categoricals.
+        """
+        specs = model_schema(self.__model_cls)
+        if columns is not None:
+            spec_by_name = {spec.name: spec for spec in specs}
+            specs = tuple(spec_by_name[name] for name in columns)
+
+        data: dict[str, Any] = {}
+        for spec in specs:
+            values = self.__values[spec.name]
+            mask = self.__masks.get(spec.name)
+
+            if spec.numeric_str:
+                data[spec.name] = self.numbers(spec.name)
+            elif spec.name in self.__categories:
+                data[spec.name] = pd.Categorical.from_codes(values, categories=self.__categories[spec.name])
+            elif mask is not None and spec.kind == FieldKind.INT:
+                data[spec.name] = pd.arrays.IntegerArray(values, mask)
+            elif mask is not None and spec.kind == FieldKind.BOOL:
+                data[spec.name] = pd.arrays.BooleanArray(values, mask)
+            else:
+                data[spec.name] = values
+
+        return pd.DataFrame(data, copy=False)
+
+    def __value(self, spec: FieldSpec, index: int) -> Any:
+        value = self.__values[spec.name][index]
+
+        if spec.name in self.__categories:
+            return None if value < 0 else self.__categories[spec.name][value]
+
+        if spec.kind in (FieldKind.INT, FieldKind.BOOL):
+            mask = self.__masks.get(spec.name)
+            if mask is not None and mask[index]:
+                return None
+
+            return int(value) if spec.kind == FieldKind.INT else bool(value)
+
+        if spec.kind == FieldKind.FLOAT:
+            return None if spec.optional and math.isnan(value) else float(value)
+
+        return value
+
+
+class ColumnStoreDataSource(DataSourceModel[T_model], Generic[T_model]):
+    """Data source building models from a `ColumnStore`, so a store can back a repository.
+
+    `rows` restricts the source to those row indexes of the store, in that order, given
+    as a sequence or an integer array such as the result of `np.flatnonzero()`.
+    """
+
+    def __init__(self, store: ColumnStore[T_model], rows: Optional[Union[Sequence[int], npt.NDArray[np.integer[Any]]]] = None) -> None:
+        self.__store = store
+        self.__rows = rows
+
+    def get(self) -> list[T_model]:
+        return list(self.iter())
+
+    def iter(self) -> Iterator[T_model]:
+        if self.__rows is None:
+            return self.__store.rows()
+
+        return (self.__store.row(int(index)) for index in self.__rows)
+
+    def _get_raw_data(self) -> list[dict[str, Any]]:
+        return [asdict(model) for model in self.iter()]
+
+
+def _to_float(value: Any) -> float:
+    return math.nan if is_missing(value) else float(value)
+
+
+def _dictionary_encode(column: list[Any]) -> tuple[npt.NDArray[np.int32], list[str]]:
+    code_by_value: dict[str, int] = {}
+    codes = np.empty(len(column), dtype=np.int32)
+
+    for i, value in enumerate(column):
+        if value is None:
+            codes[i] = -1
+        else:
+            codes[i] = code_by_value.setdefault(value, len(code_by_value))
+
+    return codes, list(code_by_value)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from .model import T_model
+from .schema import FieldKind, model_schema
+from dataclasses import fields
+from typing import Any, Callable, Generic, Iterable, Mapping, Optional, Type, get_origin
+import sys
+
+
+Converter = Callable[[Any], Any]
+Setter = Callable[[Any, Any], None]
+
+
+class ModelDecoder(Generic[T_model]):
+    """Builds models of one class from raw rows, with the field work done once per class.
+
+    - `decode()` is for typed rows, such as API JSON: unknown keys are dropped and
+      missing keys are left to the field defaults.
+    - `decode_strings()` is for CSV rows, where every value is a string: values are
+      also converted to the field's type, including `Optional` fields. Missing values
+      become None, see `is_missing()`, but str fields keep "" and only map "None" to
+      None, see `is_missing_str()`.
+    - `build_trusted()` skips both steps, for rows already holding exactly the model's
+      fields with the right types.
+
+    Strings are interned when decoded, so values repeated across rows (statuses, team
+    names, kickoff times) are stored once. Rows holding every field are built by
+    setting the slots directly rather than through the dataclass `__init__`.
+    Use `model_decoder()` to get the shared decoder of a model class.
+    """
+    __model_cls: Type[T_model]
+    __names: frozenset[str]
+    __fields: tuple[tuple[str, Converter, Converter, Setter], ...]
+
+    def __init__(self, model_cls: Type[T_model]) -> None:
+        self.__model_cls = model_cls
+        self.__names = frozenset(spec.name for spec in model_schema(model_cls))
+
+        is_list = {f.name: f.type is list or get_origin(f.type) is list for f in fields(model_cls)}
+        self.__fields = tuple(
+            (
+                spec.name,
+                _intern if spec.kind == FieldKind.STR else _same,
+                _list if is_list[spec.name] else _CONVERTERS.get(spec.kind, _keep),
+                getattr(model_cls, spec.name).__set__,  # slot descriptor
+            )
+            for spec in model_schema(model_cls)
+        )
+
+    @property
+    def model_cls(self) -> Type[T_model]:
+        return self.__model_cls
+
+    def decode(self, row: Mapping[str, Any]) -> T_model:
+        if not self.__names <= row.keys():  # let __init__ fill in defaults, or complain
+            return self.__model_cls(**{
+                name: intern(row[name]) for name, intern, _, _ in self.__fields if name in row
+            })
+
+        model = object.__new__(self.__model_cls)
+        for name, intern, _, set_value in self.__fields:
+            set_value(model, intern(row[name]))
+
+        return model
+
+    def decode_strings(self, row: Mapping[str, Any]) -> T_model:
+        get = row.get
+
+        model = object.__new__(self.__model_cls)
+        for name, _, convert, set_value in self.__fields:
+            set_value(model, convert(get(name)))
+
+        return model
+
+    def decode_many(self, rows: Iterable[Mapping[str, Any]], from_strings: bool = False) -> list[T_model]:
+        decode = self.decode_strings if from_strings else self.decode
+
+        return [decode(row) for row in rows]
+
+    def build_trusted(self, rows: Iterable[Mapping[str, Any]]) -> list[T_model]:
+        """Builds models without filtering, converting or checking anything.
+
+        Every row must hold exactly the model's fields with the right types, e.g. rows
+        made by `dataclasses.asdict()` or by this decoder.
+        """
+        return [self.__construct(row) for row in rows]
+
+    def __construct(self, values: Mapping[str, Any]) -> T_model:
+        model = object.__new__(self.__model_cls)
+        for name, _, _, set_value in self.__fields:
+            set_value(model, values[name])
+
+        return model
+
+
+# keyed by class in a plain dict, as slotted model classes aren't `Hashable` to the type checker
+__DECODERS: dict[type, ModelDecoder[Any]] = {}
+
+
+def model_decoder(model_cls: Type[T_model]) -> ModelDecoder[T_model]:
+    """Shared decoder of `model_cls`, compiled the first time it is asked for."""
+    decoder: Optional[ModelDecoder[T_model]] = __DECODERS.get(model_cls)
+    if decoder is None:
+        decoder = __DECODERS[model_cls] = ModelDecoder(model_cls)
+
+    return decoder
+
+
+def is_missing(value: Any) -> bool:
+    """Whether a raw value stands for no value, as None, "" or "None" do in the CSVs."""
+    return value is None or value == "" or value == "None"
+
+
+def is_missing_str(value: Any) -> bool:
+    """Whether a raw value of a str field stands for no value. Unlike `is_missing()`, "" is kept."""
+    return value is None or value == "None"
+
+
+def to_int(value: Any) -> int:
+    try:
+        return int(value)
+    except ValueError:  # e.g. "3.0"
+        return int(float(value))
+
+
+def to_bool(value: Any) -> bool:
+    return value.lower() == "true" if isinstance(value, str) else bool(value)
+
+
+# Converters from raw values, run once per field per row
+
+def _int(value: Any) -> Optional[int]:
+    if is_missing(value):
+        return None
+
+    return to_int(value) if isinstance(value, str) else int(value)
+
+
+def _float(value: Any) -> Optional[float]:
+    if is_missing(value):
+        return None
+
+    return float(value)
+
+
+def _bool(value: Any) -> Optional[bool]:
+    return None if is_missing(value) else to_bool(value)
+
+
+def _str(value: Any) -> Optional[str]:
+    if is_missing_str(value):
+        return None
+
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _same(value: Any) -> Any:
+    return value
+
+
+def _list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _keep(value: Any) -> Any:
+    return None if is_missing(value) else value
+
+
+_CONVERTERS: dict[FieldKind, Converter] = {
+    FieldKind.INT: _int,
+    FieldKind.FLOAT: _float,
+    FieldKind.BOOL: _bool,
+    FieldKind.STR: _str,
+}
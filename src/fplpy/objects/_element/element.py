@@ -7,19 +7,46 @@ from dataclasses import asdict
 
 
 class Element(ElementTemplate[T_model], ABC, Generic[T_model]):
+    """Wraps a model, compared and hashed by `values_to_hash_and_eq()`.
+
+    Elements are immutable: the key and its hash are computed the first time they
+    are needed and cached, so `value` must not be reassigned afterwards.
+    """
+    __slots__ = ("value", "_key", "_hash")
     value: T_model
+    _key: tuple[Hashable, ...]
+    _hash: int
 
     def __init__(self, attributes: T_model) -> None:
         self.value = attributes
-        
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # only the model, which pickles as its field values
+        return type(self), (self.value,)
+
     def __hash__(self) -> int:
-        return hash(self.values_to_hash_and_eq())
-    
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self.identity_key())
+            return self._hash
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if isinstance(other, Element):
-            return self.values_to_hash_and_eq() == other.values_to_hash_and_eq()
+            return self.identity_key() == other.identity_key()
 
         return False
+
+    def identity_key(self) -> tuple[Hashable, ...]:
+        """`values_to_hash_and_eq()`, computed once."""
+        try:
+            return self._key
+        except AttributeError:
+            self._key = self.values_to_hash_and_eq()
+            return self._key
     
     def to_dict(self) -> dict[str, Any]:
         return asdict(self.value)
@@ -30,8 +57,8 @@ class Element(ElementTemplate[T_model], ABC, Generic[T_model]):
 
 
 class ElementWithID(Element[T_model], ElementTemplateWithID[T_model], ABC, Generic[T_model]):
-    ...
+    __slots__ = ()
     
     
 class ElementWithIDandCode(Element[T_model], ElementTemplateWithIDandCode[T_model], ABC, Generic[T_model]):
-    ...
+    __slots__ = ()
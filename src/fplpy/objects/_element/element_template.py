@@ -11,11 +11,15 @@ T_element_with_id_and_code = TypeVar("T_element_with_id_and_code", bound="Elemen
 
 
 class SingleArgumentInitialisable(ABC, Generic[T]):
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, attr: T) -> None: ...
 
 
 class Representable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __repr__(self) -> str: ...
 
@@ -24,16 +28,22 @@ class Representable(ABC):
 
 
 class Comparable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __eq__(self, other: object) -> bool: ...
 
 
 class Hashable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __hash__(self) -> int: ...
     
     
 class Serialisable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
         ...
@@ -45,24 +55,29 @@ class Serialisable(ABC):
 
 
 class HasID(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> int: ...
     
 
 class HasCode(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def code(self) -> int: ...
 
 
 class ElementTemplate(SingleArgumentInitialisable[T_model], Serialisable, Representable, Comparable, Hashable, ABC, Generic[T_model]):
-    ...
+    __slots__ = ()
+    value: T_model  # the wrapped model, stored by subclasses
 
 
 class ElementTemplateWithID(ElementTemplate[T_model], HasID, ABC, Generic[T_model]):
-    ...
+    __slots__ = ()
     
 
 class ElementTemplateWithIDandCode(ElementTemplateWithID[T_model], HasCode, ABC, Generic[T_model]):
-    ...
+    __slots__ = ()
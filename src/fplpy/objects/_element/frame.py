@@ -0,0 +1,105 @@
+from __future__ import annotations
+from .model import Model
+from .schema import FieldKind, FieldSpec, model_schema
+from ...util.dt import parse_iso_datetimes
+from typing import Any, Optional, Sequence, Type
+import numpy as np
+import pandas as pd
+
+
+# str columns with at most this fraction of distinct values become categoricals
+CATEGORICAL_MAX_UNIQUE_RATIO = 0.5
+
+
+def models_to_df(
+    model_cls: Type[Model],
+    models: Sequence[Model],
+    columns: Optional[Sequence[str]] = None,
+    categorize: bool = True
+) -> pd.DataFrame:
+    """Builds a DataFrame with one typed column per model field, read straight from the attributes.
+
+    - `Optional[int]`/`Optional[bool]` fields, or ones holding None, become nullable `Int64`/`boolean`.
+    - str fields marked `NUMERIC_STR` become float64 and ones marked `DATETIME` become UTC datetimes.
+    - Other str fields become categoricals when few of their values are distinct.
+
+    Parameters
+    ----------
+    model_cls : Type[Model]
+        Class of `models`.
+    models : Sequence[Model]
+        Rows of the DataFrame.
+    columns : Sequence[str], optional
+        Fields to include, in order, by default every field.
+    categorize : bool, optional
+        Whether to turn str fields into categoricals, by default True.
+    """
+    specs = _select(model_cls, columns)
+    data = {
+        spec.name: _build_column(spec, [getattr(model, spec.name) for model in models], categorize)
+        for spec in specs
+    }
+
+    return pd.DataFrame(data, columns=[spec.name for spec in specs], copy=False)
+
+
+def concat_frames(model_cls: Type[Model], frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Stacks frames built by `models_to_df(..., categorize=False)`, then turns str fields into
+    categoricals as `models_to_df()` would have for all the rows at once.
+    """
+    df = pd.concat(frames, ignore_index=True)
+
+    for spec in _select(model_cls, df.columns):
+        if _is_plain_str(spec) and _few_distinct(df[spec.name].nunique(dropna=False), len(df)):
+            df[spec.name] = df[spec.name].astype("category")
+
+    return df
+
+
+def _select(model_cls: Type[Model], columns: Optional[Sequence[str]]) -> tuple[FieldSpec, ...]:
+    specs = model_schema(model_cls)
+    if columns is None:
+        return specs
+
+    spec_by_name = {spec.name: spec for spec in specs}
+    return tuple(spec_by_name[name] for name in columns)
+
+
+def _is_plain_str(spec: FieldSpec) -> bool:
+    return spec.kind == FieldKind.STR and not spec.numeric_str and not spec.datetime
+
+
+def _few_distinct(n_distinct: int, n_values: int) -> bool:
+    return n_distinct <= CATEGORICAL_MAX_UNIQUE_RATIO * n_values
+
+
+def _build_column(spec: FieldSpec, values: list[Any], categorize: bool) -> Any:
+    if spec.kind == FieldKind.INT:
+        if spec.optional or None in values:
+            return pd.array(values, dtype="Int64")
+
+        return np.array(values, dtype=np.int64)
+
+    if spec.kind == FieldKind.BOOL:
+        if spec.optional or None in values:
+            return pd.array(values, dtype="boolean")
+
+        return np.array(values, dtype=bool)
+
+    if spec.kind == FieldKind.FLOAT:
+        return np.array(values, dtype=np.float64)
+
+    if spec.kind == FieldKind.STR:
+        if spec.numeric_str:
+            return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+
+        if spec.datetime:
+            return pd.to_datetime(parse_iso_datetimes(values), utc=True)
+
+        if categorize and _few_distinct(len(set(values)), len(values)):
+            return pd.Categorical(values)
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+
+    return column
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from .element_template import ElementTemplateWithID, T_element, T_element_with_id
+from threading import Lock
+from typing import Any, Hashable, Iterable, cast
+
+
+class IdentityMap:
+    """One shared instance of each entity, for the repositories of a factory.
+
+    Only elements with an id, such as teams, events, players and fixtures, are kept,
+    keyed by their type and id. Others, such as player summaries, are returned as
+    they are, so the map doesn't grow with every row read. The first element seen for
+    a key becomes its canonical instance. An element whose model has changed since,
+    e.g. an event with a new deadline after a refresh, replaces it, so later
+    repositories share the new one.
+    """
+
+    def __init__(self) -> None:
+        self.__elements: dict[tuple[Hashable, ...], Any] = {}
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__elements)
+
+    def canonical(self, element: T_element) -> T_element:
+        """The shared instance equal to `element`, storing `element` if there isn't one.
+
+        Elements without an id are returned unchanged.
+        """
+        if not isinstance(element, ElementTemplateWithID):
+            return element
+
+        with self.__lock:
+            return self.__canonical(element)
+
+    def canonical_many(self, elements: Iterable[T_element]) -> list[T_element]:
+        """`canonical()` of each element, which are all of one type."""
+        elements = list(elements)
+        if not elements or not isinstance(elements[0], ElementTemplateWithID):
+            return elements
+
+        keyed = cast(list[ElementTemplateWithID[Any]], elements)
+        with self.__lock:
+            return cast(list[T_element], [self.__canonical(element) for element in keyed])
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__elements = {}
+
+    def __canonical(self, element: T_element_with_id) -> T_element_with_id:
+        key = (type(element), element.id)
+        existing = self.__elements.get(key)
+
+        if existing is not None and (existing.value is element.value or existing.value == element.value):
+            return cast(T_element_with_id, existing)
+
+        self.__elements[key] = element
+        return element
+
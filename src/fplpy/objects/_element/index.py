@@ -0,0 +1,76 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Generic, Callable, Optional, Iterable, Hashable, TypeVar, Any
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class UniqueIndex(Generic[K, V]):
+    """Dictionary index over a key expected to be unique.
+
+    Keys seen more than once are remembered so lookups on them can still raise,
+    matching the behaviour of the scan based lookups.
+    """
+    __items: dict[K, V]
+    __duplicates: set[K]
+
+    def __init__(self, items: Iterable[V], key_fn: Callable[[V], K]) -> None:
+        self.__items = {}
+        self.__duplicates = set()
+
+        for item in items:
+            key = key_fn(item)
+            if key in self.__items:
+                self.__duplicates.add(key)
+            else:
+                self.__items[key] = item
+
+    def get(self, key: K, method_name: str) -> Optional[V]:
+        if key in self.__duplicates:
+            raise ValueError(f"{method_name}() expected 1 or 0 results, obtained more than 1 result")
+
+        return self.__items.get(key)
+
+
+class HashIndex(Generic[V]):
+    """Groups items by the value of a key, keeping the original order within each group.
+
+    Raises `TypeError` on construction if any key is unhashable.
+    """
+    __buckets: dict[Any, list[V]]
+
+    def __init__(self, items: Iterable[V], key_fn: Callable[[V], Any]) -> None:
+        self.__buckets = {}
+
+        for item in items:
+            self.__buckets.setdefault(key_fn(item), []).append(item)
+
+    def get(self, key: Any) -> list[V]:
+        return self.__buckets.get(key, [])
+
+
+class RangeIndex(Generic[V]):
+    """Items sorted by the value of a key, queried with bisect.
+
+    Items whose key is None are left out. Raises `TypeError` on construction if
+    the keys cannot be ordered.
+    """
+    __keys: list[Any]
+    __items: list[V]
+
+    def __init__(self, items: Iterable[V], key_fn: Callable[[V], Any]) -> None:
+        keyed = [(key_fn(item), item) for item in items]
+        keyed = [pair for pair in keyed if pair[0] is not None]
+        keyed.sort(key=lambda pair: pair[0])
+
+        self.__keys = [key for key, _ in keyed]
+        self.__items = [item for _, item in keyed]
+
+    def between(self, low: Optional[Any] = None, high: Optional[Any] = None) -> list[V]:
+        """Items with `low <= key <= high`, in key order. A bound of None is open."""
+        start = 0 if low is None else bisect_left(self.__keys, low)
+        end = len(self.__keys) if high is None else bisect_right(self.__keys, high)
+
+        return self.__items[start:end]
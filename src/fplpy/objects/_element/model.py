@@ -1,10 +1,32 @@
-from dataclasses import dataclass
-from typing import TypeVar
+from __future__ import annotations
+from dataclasses import dataclass, fields
+from typing import Any, TypeVar, Type
 
 
 T_model = TypeVar("T_model", bound="Model")
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class Model:
-    pass
+    def __reduce__(self) -> tuple[Any, ...]:
+        # field values only, without the field names or a state dict
+        return _restore_model, (type(self), tuple([getattr(self, name) for name in field_names(type(self))]))
+
+
+__FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def field_names(model_cls: Type[Model]) -> tuple[str, ...]:
+    names = __FIELD_NAMES.get(model_cls)
+    if names is None:
+        names = __FIELD_NAMES[model_cls] = tuple(f.name for f in fields(model_cls))
+
+    return names
+
+
+def _restore_model(model_cls: Type[T_model], values: tuple[Any, ...]) -> T_model:
+    model = object.__new__(model_cls)
+    for name, value in zip(field_names(model_cls), values):
+        object.__setattr__(model, name, value)
+
+    return model
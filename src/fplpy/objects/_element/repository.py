@@ -1,44 +1,282 @@
 from __future__ import annotations
 from .source import T_source
 from abc import ABC
-from typing import Generic, Callable, Optional, Type
+from .index import UniqueIndex, HashIndex, RangeIndex
+from .frame import concat_frames, models_to_df
+from .identity_map import IdentityMap
+from .model import Model
+from dataclasses import is_dataclass
+from itertools import islice
+from typing import Generic, Callable, Optional, Type, Iterable, Iterator, Any, Sequence, cast, get_args
 from .element_template import T_element_with_id, T_element, \
     T_element_with_id_and_code
+import pandas as pd
 
 
 class Repository(ABC, Generic[T_element, T_source]):
-    def __init__(self, element_cls: Type[T_element], source: T_source) -> None:
+    """Collection of elements built from a data source.
+
+    Elements are built from the source the first time they are needed and kept
+    until `refresh()` is called, or until the source reports it is stale, e.g. an
+    API source after its factory's `refresh()`. Indexes on model fields used by `where()` and
+    `range()` are built the first time each field is queried.
+
+    With an `identity_map`, usually the factory's, built elements are replaced by the
+    map's canonical instances, so repositories sharing the map share their elements.
+    Elements streamed by `iter_all()` before the repository is built are not.
+    """
+    __elements: Optional[list[T_element]]
+    __hash_indexes: dict[str, Optional[HashIndex[T_element]]]
+    __range_indexes: dict[str, Optional[RangeIndex[T_element]]]
+
+    def __init__(self, element_cls: Type[T_element], source: T_source, identity_map: Optional[IdentityMap] = None) -> None:
         self.__model_wrapper_cls = element_cls
         self.__source = source
+        self.__identity_map = identity_map
+        self.__elements = None
+        self.__hash_indexes = {}
+        self.__range_indexes = {}
+
+    def refresh(self) -> None:
+        """Rebuilds every element and index from the data source."""
+        elements = [self.__model_wrapper_cls(item) for item in self.__source.get()]
+        if self.__identity_map is not None:
+            elements = self.__identity_map.canonical_many(elements)
+
+        self._build_indexes(elements)
+        self.__elements = elements
+
+    def _build_indexes(self, elements: list[T_element]) -> None:
+        """Hook for subclasses to (re)build indexes over freshly built elements."""
+        self.__hash_indexes = {}
+        self.__range_indexes = {}
+
+    def _elements(self) -> list[T_element]:
+        if self.__elements is None or self.__source.is_stale():
+            self.refresh()
+
+        assert self.__elements is not None
+        return self.__elements
 
     def get_all(self) -> list[T_element]:
-        return [self.__model_wrapper_cls(item) for item in self.__source.get()]
+        return self._elements().copy()
+
+    def iter_all(self) -> Iterator[T_element]:
+        """Elements one at a time.
+
+        Once the repository is built this iterates over its elements. Before that, elements
+        are built lazily from the source's `iter()` and aren't kept.
+        """
+        if self.__elements is not None and not self.__source.is_stale():
+            return iter(self.__elements)
+
+        # not put through the identity map, which would keep every streamed element
+        element_cls = self.__model_wrapper_cls
+        return (element_cls(model) for model in self.__source.iter())
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[list[T_element]]:
+        """Elements from `iter_all()` in lists of at most `chunk_size`."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        elements = self.iter_all()
+        while chunk := list(islice(elements, chunk_size)):
+            yield chunk
+
+    def get_filtered(self, filter_fn: Callable[[T_element], bool], limit: Optional[int] = None) -> list[T_element]:
+        """Elements passing `filter_fn`, in repository order.
+
+        With a `limit`, stops after that many matches, streaming from the source if the
+        repository isn't built yet.
+        """
+        if limit is None:
+            return [item for item in self._elements() if filter_fn(item)]
+
+        return list(islice((item for item in self.iter_all() if filter_fn(item)), limit))
+
+    def as_df(self, columns: Optional[Sequence[str]] = None, chunk_size: Optional[int] = None) -> pd.DataFrame:
+        """One row per element, with a typed column per model field.
+
+        See `models_to_df()` for the column dtypes.
+
+        Parameters
+        ----------
+        columns : Sequence[str], optional
+            Fields to include, in order, by default every field.
+        chunk_size : int, optional
+            Build the frame from `stream(chunk_size)`, so at most `chunk_size` elements are
+            held at once if the repository isn't built yet. By default from every element.
+        """
+        if chunk_size is not None:
+            frames = []
+            for chunk in self.stream(chunk_size):
+                model_cls = type(chunk[0].value)
+                frames.append(models_to_df(model_cls, [item.value for item in chunk], columns, categorize=False))
+
+            return concat_frames(model_cls, frames) if frames else self.__empty_df(columns)
+
+        elements = self._elements()
+        if not elements:
+            return self.__empty_df(columns)
+
+        return models_to_df(type(elements[0].value), [item.value for item in elements], columns)
+
+    def __empty_df(self, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+        """Frame with no rows but the typed columns `as_df()` gives, so columns can still be selected."""
+        model_cls = _model_cls(self.__model_wrapper_cls)
+        if model_cls is None:
+            return pd.DataFrame(columns=list(columns) if columns is not None else None)
+
+        return models_to_df(model_cls, [], columns)
+
+    def where(self, **criteria: Any) -> list[T_element]:
+        """Elements whose model fields match every criterion.
+
+        A criterion is either a value the field must equal, e.g. `where(team=3, element_type=2)`,
+        or a callable taking the field value and returning a bool. Equality criteria use
+        a hash index on the field, other criteria are checked by scanning.
+
+        Returns
+        -------
+        list[T_element]
+            Matching elements, in repository order.
+        """
+        candidates = self._elements()
+
+        for field_name, value in criteria.items():
+            if callable(value):
+                continue
+
+            index = self.__hash_index(field_name)
+            if index is None:
+                continue
+
+            try:
+                bucket = index.get(value)
+            except TypeError:  # unhashable value, fall back to scanning
+                continue
+
+            if len(bucket) < len(candidates):
+                candidates = bucket
 
-    def get_filtered(self, filter_fn: Callable[[T_element], bool]) -> list[T_element]:
-        return [item for item in self.get_all() if filter_fn(item)]
+        return [item for item in candidates if _matches(item, criteria)]
+
+    def range(self, field_name: str, low: Optional[Any] = None, high: Optional[Any] = None) -> list[T_element]:
+        """Elements with `low <= field <= high`, using a sorted index on the field.
+
+        A bound of None leaves that side open. Elements whose field is None are excluded.
+
+        Returns
+        -------
+        list[T_element]
+            Matching elements, sorted by the field.
+        """
+        index = self.__range_index(field_name)
+        if index is not None:
+            return index.between(low, high)
+
+        return [
+            item for item in self._elements()
+            if _in_range(getattr(item.value, field_name), low, high)
+        ]
+
+    def __hash_index(self, field_name: str) -> Optional[HashIndex[T_element]]:
+        elements = self._elements()
+
+        if field_name not in self.__hash_indexes:
+            try:
+                self.__hash_indexes[field_name] = HashIndex(elements, lambda x: getattr(x.value, field_name))
+            except TypeError:  # unhashable field values
+                self.__hash_indexes[field_name] = None
+
+        return self.__hash_indexes[field_name]
+
+    def __range_index(self, field_name: str) -> Optional[RangeIndex[T_element]]:
+        elements = self._elements()
+
+        if field_name not in self.__range_indexes:
+            try:
+                self.__range_indexes[field_name] = RangeIndex(elements, lambda x: getattr(x.value, field_name))
+            except TypeError:  # values can't be ordered
+                self.__range_indexes[field_name] = None
+
+        return self.__range_indexes[field_name]
+
+
+__MODEL_CLASSES: dict[type, Optional[Type[Model]]] = {}
+
+
+def _model_cls(element_cls: type) -> Optional[Type[Model]]:
+    """Model class an element class wraps, e.g. `TeamModel` for `Team(ElementWithIDandCode[TeamModel])`."""
+    if element_cls not in __MODEL_CLASSES:
+        __MODEL_CLASSES[element_cls] = _find_model_cls(element_cls)
+
+    return __MODEL_CLASSES[element_cls]
+
+
+def _find_model_cls(element_cls: type) -> Optional[Type[Model]]:
+    for cls in element_cls.__mro__:
+        for base in getattr(cls, "__orig_bases__", ()):
+            for arg in get_args(base):
+                if isinstance(arg, type) and is_dataclass(arg):
+                    return cast(Type[Model], arg)
+
+    return None
+
+
+def _matches(item: Any, criteria: dict[str, Any]) -> bool:
+    for field_name, expected in criteria.items():
+        value = getattr(item.value, field_name)
+
+        if callable(expected):
+            if not expected(value):
+                return False
+        elif value != expected:
+            return False
+
+    return True
+
+
+def _in_range(value: Any, low: Optional[Any], high: Optional[Any]) -> bool:
+    if value is None:
+        return False
+
+    return (low is None or low <= value) and (high is None or value <= high)
 
 
 class RepositoryWithID(Repository[T_element_with_id, T_source], ABC, Generic[T_element_with_id, T_source]):
+    __by_id: UniqueIndex[int, T_element_with_id]
+
+    def _build_indexes(self, elements: list[T_element_with_id]) -> None:
+        super()._build_indexes(elements)
+        self.__by_id = UniqueIndex(elements, lambda x: x.id)
+
     def get_by_id(self, unique_id: int) -> Optional[T_element_with_id]:
-        res = self.get_filtered(lambda x: x.id == unique_id)
+        self._elements()
+
+        return self.__by_id.get(unique_id, "get_by_id")
 
-        if len(res) == 1:
-            return res[0]
-        
-        if len(res) == 0:
-            return None
+    def get_many(self, unique_ids: Iterable[int]) -> list[Optional[T_element_with_id]]:
+        """Looks up several ids at once, returning results in the same order as `unique_ids`."""
+        self._elements()
 
-        raise ValueError(f"get_by_id() expected 1 or 0 results, obtained {len(res)} results")
+        return [self.__by_id.get(unique_id, "get_by_id") for unique_id in unique_ids]
 
 
 class RepositoryWithIDandCode(RepositoryWithID[T_element_with_id_and_code, T_source], ABC, Generic[T_element_with_id_and_code, T_source]):
+    __by_code: UniqueIndex[int, T_element_with_id_and_code]
+
+    def _build_indexes(self, elements: list[T_element_with_id_and_code]) -> None:
+        super()._build_indexes(elements)
+        self.__by_code = UniqueIndex(elements, lambda x: x.code)
+
     def get_by_code(self, code: int) -> Optional[T_element_with_id_and_code]:
-        res = self.get_filtered(lambda x: x.code == code)
+        self._elements()
+
+        return self.__by_code.get(code, "get_by_code")
 
-        if len(res) == 1:
-            return res[0]
-        
-        if len(res) == 0:
-            return None
+    def get_many_by_code(self, codes: Iterable[int]) -> list[Optional[T_element_with_id_and_code]]:
+        """Looks up several codes at once, returning results in the same order as `codes`."""
+        self._elements()
 
-        raise ValueError(f"get_by_code() expected 1 or 0 results, obtained {len(res)} results")
+        return [self.__by_code.get(code, "get_by_code") for code in codes]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from .model import Model
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Any, Optional, Type, Union, get_args, get_origin
+import types
+
+
+# Field metadata for `str` fields whose values are numbers, e.g. `influence: str = field(metadata=NUMERIC_STR)`
+NUMERIC_STR = {"numeric_str": True}
+# Field metadata for `str` fields holding ISO 8601 dates or datetimes
+DATETIME = {"datetime": True}
+
+
+class FieldKind(str, Enum):
+    INT = "int"
+    FLOAT = "float"
+    BOOL = "bool"
+    STR = "str"
+    OTHER = "other"  # lists and anything else kept as Python objects
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    name: str
+    kind: FieldKind
+    optional: bool
+    numeric_str: bool
+    datetime: bool
+
+
+__KINDS = {int: FieldKind.INT, float: FieldKind.FLOAT, bool: FieldKind.BOOL, str: FieldKind.STR}
+# keyed by class in a plain dict, as slotted model classes aren't `Hashable` to the type checker
+__SCHEMAS: dict[type, tuple[FieldSpec, ...]] = {}
+
+
+def _unwrap_optional(tp: Any) -> tuple[Any, bool]:
+    if get_origin(tp) in (Union, types.UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0], True
+
+    return tp, False
+
+
+def model_schema(model_cls: Type[Model]) -> tuple[FieldSpec, ...]:
+    """Kind of every field of `model_cls`, worked out once per class."""
+    schema = __SCHEMAS.get(model_cls)
+    if schema is None:
+        schema = __SCHEMAS[model_cls] = _build_schema(model_cls)
+
+    return schema
+
+
+def _build_schema(model_cls: Type[Model]) -> tuple[FieldSpec, ...]:
+    specs = []
+    for f in fields(model_cls):
+        tp, optional = _unwrap_optional(f.type)
+        specs.append(FieldSpec(
+            name=f.name,
+            kind=__KINDS.get(tp, FieldKind.OTHER),
+            optional=optional,
+            numeric_str=bool(f.metadata.get("numeric_str", False)),
+            datetime=bool(f.metadata.get("datetime", False)),
+        ))
+
+    return tuple(specs)
+
+
+def field_spec(model_cls: Type[Model], name: str) -> Optional[FieldSpec]:
+    for spec in model_schema(model_cls):
+        if spec.name == name:
+            return spec
+
+    return None
@@ -1,8 +1,8 @@
 from .model import T_model
-from typing import TypeVar, Generic, Sequence, Any, Type
+from typing import TypeVar, Generic, Sequence, Any, Type, Iterable, Iterator
 from abc import ABC, abstractmethod
-from ...util.other import filter_dict
-from dataclasses import fields
+from .decoder import model_decoder
+from ...util.local import iter_csv
 
 
 T_source = TypeVar("T_source", bound="DataSourceModel[Any]")
@@ -21,6 +21,18 @@ class DataSourceModel(ABC, Generic[T_model]):
     @abstractmethod
     def _get_raw_data(self) -> Sequence[dict[str, Any]]: ...
 
+    def iter(self) -> Iterator[T_model]:
+        """Models one at a time, for sources that can build them lazily. By default from `get()`."""
+        return iter(self.get())
+
+    def is_stale(self) -> bool:
+        """Whether the data has changed since it was last read. By default it never does."""
+        return False
+
+    def _iter_raw_data(self) -> Iterator[dict[str, Any]]:
+        """Raw rows one at a time, for sources that can read them lazily. By default from `_get_raw_data()`."""
+        return iter(self._get_raw_data())
+
 
 class APIDataSourceModel(DataSourceModel[T_model], ABC, Generic[T_model]):
     def __init__(self, model_cls: Type[T_model]) -> None:
@@ -30,17 +42,12 @@ class APIDataSourceModel(DataSourceModel[T_model], ABC, Generic[T_model]):
     def _get_raw_data(self) -> list[dict[str, Any]]: ...
 
     def get(self) -> list[T_model]:
-        data = self._get_raw_data()
+        return build_models(self.__model_cls, self._get_raw_data())
 
-        # Define the expected fields for LabelModelBase
-        expected_keys = {f.name for f in self.__model_cls.__dataclass_fields__.values()}
+    def iter(self) -> Iterator[T_model]:
+        decode = model_decoder(self.__model_cls).decode
 
-        required_data = []
-        for item in data:
-            item_filtered = filter_dict(item, list(expected_keys))
-            required_data.append(self.__model_cls(**item_filtered))
-
-        return required_data
+        return (decode(row) for row in self._iter_raw_data())
 
 
 class GitHubDataSourceModel(DataSourceModel[T_model], ABC, Generic[T_model]):
@@ -59,34 +66,37 @@ class GitHubDataSourceModel(DataSourceModel[T_model], ABC, Generic[T_model]):
     def _get_raw_data(self) -> list[dict[str, Any]]: ...
 
     def get(self) -> list[T_model]:
-        data = self._get_raw_data()
-
-        # Define the expected fields for LabelModelBase
-        expected_keys = {f.name for f in self.__model_cls.__dataclass_fields__.values()}
-
-        required_data = []
-        for item in data:
-            item_filtered = filter_dict(item, list(expected_keys))
-            item_typed = coerce_types(self.__model_cls, item_filtered)  # csv has all values as string
-            required_data.append(self.__model_cls(**item_typed))
-
-        return required_data
-
-
-def coerce_types(model_cls: Type[T_model], data: dict[str, Any]) -> dict[str, Any]:
-    coerced: dict[str, Any] = {}
-    for f in fields(model_cls):
-        value = data.get(f.name)
-        if (value is None) or (value == "None"):
-            coerced[f.name] = None
-        elif f.type == int:
-            coerced[f.name] = int(value)
-        elif f.type == float:
-            coerced[f.name] = float(value)
-        elif f.type == bool:
-            coerced[f.name] = value.lower() == "true" if isinstance(value, str) else bool(value)
-        elif f.type == list[dict[str, Any]]:
-            coerced[f.name] = value if isinstance(value, list) else []
-        else:
-            coerced[f.name] = value
-    return coerced
+        # csv has all values as strings
+        return model_decoder(self.__model_cls).decode_many(self._get_raw_data(), from_strings=True)
+
+    def iter(self) -> Iterator[T_model]:
+        decode = model_decoder(self.__model_cls).decode_strings
+
+        return (decode(row) for row in self._iter_raw_data())
+
+
+def build_models(model_cls: Type[T_model], data: Iterable[dict[str, Any]]) -> list[T_model]:
+    """Builds models from already typed rows (e.g. JSON), ignoring unknown keys."""
+    return model_decoder(model_cls).decode_many(data)
+
+
+class LocalCSVDataSourceModel(GitHubDataSourceModel[T_model], ABC, Generic[T_model]):
+    """Reads a file from a local mirror of the vaastav repository, see `sync_season()`."""
+
+    def __init__(self, model_cls: Type[T_model], root: str, season: str) -> None:
+        super().__init__(model_cls, season)
+
+        self.__root = root
+
+    @property
+    def root(self) -> str:
+        return self.__root
+
+    @abstractmethod
+    def _csv_path(self) -> str: ...
+
+    def _get_raw_data(self) -> list[dict[str, Any]]:
+        return list(self._iter_raw_data())
+
+    def _iter_raw_data(self) -> Iterator[dict[str, Any]]:
+        return iter_csv(self._csv_path())
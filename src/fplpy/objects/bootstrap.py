@@ -0,0 +1,137 @@
+from __future__ import annotations
+from ._element.model import T_model
+from ._element.source import APIDataSourceModel, build_models
+from .chip.model import ChipModel
+from .event.model import EventModel
+from .game_settings.model import GameSettingsModel
+from .label.model import LabelModel
+from .player.model import PlayerModel
+from .position.model import PositionModel
+from .team.model import TeamModel
+from ..util.external.api import call_api, get_url
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, Callable, Generic, Iterator, Optional, Sequence, Type
+import json
+
+
+@dataclass(frozen=True)
+class BootstrapSnapshot:
+    """Every entity from one bootstrap-static response, parsed once.
+
+    All API data sources backed by bootstrap-static read from a snapshot, so
+    repositories built from the same snapshot always agree with each other.
+    """
+    players: tuple[PlayerModel, ...]
+    events: tuple[EventModel, ...]
+    teams: tuple[TeamModel, ...]
+    positions: tuple[PositionModel, ...]
+    chips: tuple[ChipModel, ...]
+    labels: tuple[LabelModel, ...]
+    game_settings: tuple[GameSettingsModel, ...]
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "BootstrapSnapshot":
+        return cls(
+            players=tuple(build_models(PlayerModel, payload["elements"])),
+            events=tuple(build_models(EventModel, payload["events"])),
+            teams=tuple(build_models(TeamModel, payload["teams"])),
+            positions=tuple(build_models(PositionModel, payload["element_types"])),
+            chips=tuple(build_models(ChipModel, payload["chips"])),
+            labels=tuple(build_models(LabelModel, payload["element_stats"])),
+            game_settings=tuple(build_models(GameSettingsModel, [payload["game_settings"]])),
+        )
+
+
+def fetch_bootstrap_static(use_cache: bool) -> dict[str, Any]:
+    data: dict[str, Any] = call_api(get_url("BOOTSTRAP-STATIC"), use_cache=use_cache)
+
+    return data
+
+
+def bootstrap_file_fetcher(file_path: str) -> Callable[[bool], dict[str, Any]]:
+    """Fetch function for `BootstrapSnapshotProvider` reading a saved bootstrap-static response."""
+    def fetch(use_cache: bool) -> dict[str, Any]:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data: dict[str, Any] = json.load(f)
+
+        return data
+
+    return fetch
+
+
+class BootstrapSnapshotProvider:
+    """Holds the current `BootstrapSnapshot`.
+
+    The first snapshot is fetched on demand. `refresh()` fetches and parses a new
+    snapshot before swapping it in, so readers only ever see a complete snapshot.
+    Each repository factory owns one, shared only by the repositories it builds.
+    """
+    __snapshot: Optional[BootstrapSnapshot]
+
+    def __init__(self, fetch: Callable[[bool], dict[str, Any]] = fetch_bootstrap_static) -> None:
+        self.__fetch = fetch
+        self.__snapshot = None
+        self.__lock = Lock()
+
+    def current(self) -> BootstrapSnapshot:
+        snapshot = self.__snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self.__lock:
+            if self.__snapshot is None:
+                self.__snapshot = BootstrapSnapshot.from_payload(self.__fetch(True))
+
+            return self.__snapshot
+
+    def refresh(self) -> BootstrapSnapshot:
+        snapshot = BootstrapSnapshot.from_payload(self.__fetch(False))
+
+        with self.__lock:
+            self.__snapshot = snapshot
+
+        return snapshot
+
+
+class BootstrapAPIDataSource(APIDataSourceModel[T_model], ABC, Generic[T_model]):
+    """API data source serving its models from the current snapshot of a `BootstrapSnapshotProvider`.
+
+    Without a `snapshot_provider` the source gets its own. The source is stale once
+    the provider has swapped in a snapshot newer than the one last read from it.
+    """
+    __read: Optional[BootstrapSnapshot]
+
+    def __init__(self, model_cls: Type[T_model], snapshot_provider: Optional[BootstrapSnapshotProvider] = None) -> None:
+        super().__init__(model_cls)
+
+        if snapshot_provider is None:
+            snapshot_provider = BootstrapSnapshotProvider()
+        self.__snapshot_provider = snapshot_provider
+        self.__read = None
+
+    @property
+    def snapshot(self) -> BootstrapSnapshot:
+        return self.__snapshot_provider.current()
+
+    @abstractmethod
+    def _select(self, snapshot: BootstrapSnapshot) -> Sequence[T_model]: ...
+
+    def get(self) -> list[T_model]:
+        return list(self.__models())
+
+    def iter(self) -> Iterator[T_model]:
+        return iter(self.__models())
+
+    def is_stale(self) -> bool:
+        return self.__read is not None and self.__read is not self.snapshot
+
+    def _get_raw_data(self) -> list[dict[str, Any]]:
+        return [asdict(model) for model in self.__models()]
+
+    def __models(self) -> Sequence[T_model]:
+        snapshot = self.snapshot
+        self.__read = snapshot
+
+        return self._select(snapshot)
@@ -1,14 +1,11 @@
-from ..._element.source import APIDataSourceModel
-from ....util.external.api import call_api, get_url
+from ...bootstrap import BootstrapAPIDataSource, BootstrapSnapshot, BootstrapSnapshotProvider
 from ..model import ChipModel
-from typing import Any
+from typing import Optional
 
 
-class ChipAPIDataSource(APIDataSourceModel[ChipModel]):
-    def __init__(self) -> None:
-        super().__init__(ChipModel)
+class ChipAPIDataSource(BootstrapAPIDataSource[ChipModel]):
+    def __init__(self, snapshot_provider: Optional[BootstrapSnapshotProvider] = None) -> None:
+        super().__init__(ChipModel, snapshot_provider)
 
-    def _get_raw_data(self) -> list[dict[str, Any]]:
-        data: dict[str, list[dict[str, Any]]] = call_api(get_url("BOOTSTRAP-STATIC"))
-
-        return data["chips"]
+    def _select(self, snapshot: BootstrapSnapshot) -> tuple[ChipModel, ...]:
+        return snapshot.chips
@@ -8,6 +8,8 @@ T_chip = TypeVar("T_chip", bound="Chip")
 
 
 class Chip(ElementWithID[ChipModel]):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         fields = [
             f"ID={self.id}",
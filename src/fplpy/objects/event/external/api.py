@@ -1,14 +1,11 @@
-from ..._element.source import APIDataSourceModel
-from ....util.external.api import call_api, get_url
+from ...bootstrap import BootstrapAPIDataSource, BootstrapSnapshot, BootstrapSnapshotProvider
 from ..model import EventModel
-from typing import Any
+from typing import Optional
 
 
-class EventAPIDataSource(APIDataSourceModel[EventModel]):
-    def __init__(self) -> None:
-        super().__init__(EventModel)
+class EventAPIDataSource(BootstrapAPIDataSource[EventModel]):
+    def __init__(self, snapshot_provider: Optional[BootstrapSnapshotProvider] = None) -> None:
+        super().__init__(EventModel, snapshot_provider)
 
-    def _get_raw_data(self) -> list[dict[str, Any]]:
-        data: dict[str, list[dict[str, Any]]] = call_api(get_url("BOOTSTRAP-STATIC"))
-
-        return data["events"]
+    def _select(self, snapshot: BootstrapSnapshot) -> tuple[EventModel, ...]:
+        return snapshot.events
@@ -1,19 +1,20 @@
 from .._element.model import Model
+from .._element.schema import DATETIME
 from typing import Optional
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ChipPlay:
     chip_name: str
     num_played: int
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class EventModel(Model):
     id: int
     name: str
-    deadline_time: Optional[str]
+    deadline_time: Optional[str] = field(metadata=DATETIME)
     finished: bool
     data_checked: bool
     average_entry_score: Optional[int]
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from .._element.element import ElementWithID
 from .model import EventModel
-from datetime import datetime
-from ...util.dt import string_to_datetime
+from datetime import datetime, timezone
+from ...util.dt import MAX_DATETIME, parse_iso_datetime
 from typing import TypeVar, Hashable, Any
 
 
@@ -10,6 +10,9 @@ T_event = TypeVar("T_event", bound="Event")
 
 
 class Event(ElementWithID[EventModel]):
+    __slots__ = ("_deadline_time",)
+    _deadline_time: datetime
+
     def __repr__(self) -> str:
         fields = [
             f"ID={self.id}",
@@ -29,23 +32,29 @@ class Event(ElementWithID[EventModel]):
 
     @property
     def deadline_time(self) -> datetime:
-        if self.value.deadline_time is None:
-            return datetime.max
+        """Deadline in UTC, parsed once. `MAX_DATETIME` if there isn't one."""
+        try:
+            return self._deadline_time
+        except AttributeError:
+            if self.value.deadline_time is None:
+                self._deadline_time = MAX_DATETIME
+            else:
+                self._deadline_time = parse_iso_datetime(self.value.deadline_time)
 
-        return string_to_datetime(self.value.deadline_time)
+            return self._deadline_time
 
     @property
     def has_started(self) -> bool:
         """Has the gameweek started?
 
-        Uses `datetime.now()`.
+        Uses `datetime.now()` in UTC.
 
         Returns
         -------
         bool
             True if gameweek has started, False otherwise.
         """
-        return datetime.now() > self.deadline_time
+        return datetime.now(timezone.utc) > self.deadline_time
     
     def values_to_hash_and_eq(self) -> tuple[Hashable, ...]:
         return (
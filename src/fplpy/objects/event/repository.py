@@ -2,13 +2,40 @@ from .._element.repository import RepositoryWithID
 from .._element.source import DataSourceModel
 from .model import EventModel
 from .object import T_event
+from .timeline import EventTimeline
+from datetime import datetime
 from typing import Generic, Optional
 from abc import ABC
 
 
 class EventRepository(RepositoryWithID[T_event, DataSourceModel[EventModel]], ABC, Generic[T_event]):
+    __timeline: Optional[EventTimeline[T_event]]
+
+    def _build_indexes(self, elements: list[T_event]) -> None:
+        super()._build_indexes(elements)
+        self.__timeline = None
+
+    def timeline(self) -> EventTimeline[T_event]:
+        """Events sorted by deadline, built the first time it's needed."""
+        elements = self._elements()
+
+        if self.__timeline is None:
+            self.__timeline = EventTimeline(elements)
+
+        return self.__timeline
+
     def get_next_event(self, event: T_event) -> Optional[T_event]:
-        return self.get_by_id(event.id + 1)
-    
+        """The event with the next deadline."""
+        return self.timeline().next_event(event)
+
     def get_previous_event(self, event: T_event) -> Optional[T_event]:
-        return self.get_by_id(event.id - 1)
+        """The event with the previous deadline."""
+        return self.timeline().previous_event(event)
+
+    def current_event(self, now: Optional[datetime] = None) -> Optional[T_event]:
+        """See `EventTimeline.current_event()`."""
+        return self.timeline().current_event(now)
+
+    def event_at(self, dt: datetime) -> Optional[T_event]:
+        """See `EventTimeline.event_at()`."""
+        return self.timeline().event_at(dt)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+from .object import T_event
+from ...util.dt import as_utc
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Generic, Iterable, Optional
+
+
+class EventTimeline(Generic[T_event]):
+    """Events sorted by deadline, queried with bisect.
+
+    Events without a deadline sort last, by id. Datetimes without a timezone are
+    taken to be in UTC.
+    """
+    __events: list[T_event]
+    __deadlines: list[datetime]
+    __positions: dict[int, int]
+
+    def __init__(self, events: Iterable[T_event]) -> None:
+        self.__events = sorted(events, key=lambda event: (event.deadline_time, event.id))
+        self.__deadlines = [event.deadline_time for event in self.__events]
+        self.__positions = {event.id: i for i, event in enumerate(self.__events)}
+
+    def events(self) -> list[T_event]:
+        return self.__events.copy()
+
+    def event_at(self, dt: datetime) -> Optional[T_event]:
+        """The gameweek under way at `dt`: the last event whose deadline is at or before `dt`.
+
+        None before the first deadline.
+        """
+        i = bisect_right(self.__deadlines, as_utc(dt))
+
+        return self.__events[i - 1] if i > 0 else None
+
+    def current_event(self, now: Optional[datetime] = None) -> Optional[T_event]:
+        """`event_at()` the current time, or `now` if given."""
+        return self.event_at(datetime.now(timezone.utc) if now is None else now)
+
+    def next_deadline_event(self, dt: datetime) -> Optional[T_event]:
+        """The first event whose deadline is after `dt`."""
+        i = bisect_right(self.__deadlines, as_utc(dt))
+
+        return self.__events[i] if i < len(self.__events) else None
+
+    def next_event(self, event: T_event) -> Optional[T_event]:
+        """The event after `event` in deadline order, None if it is the last or not in the timeline."""
+        i = self.__positions.get(event.id)
+        if i is None or i + 1 >= len(self.__events):
+            return None
+
+        return self.__events[i + 1]
+
+    def previous_event(self, event: T_event) -> Optional[T_event]:
+        """The event before `event` in deadline order, None if it is the first or not in the timeline."""
+        i = self.__positions.get(event.id)
+        if i is None or i == 0:
+            return None
+
+        return self.__events[i - 1]
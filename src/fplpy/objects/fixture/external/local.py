@@ -0,0 +1,11 @@
+from ..._element.source import LocalCSVDataSourceModel
+from ..model import FixtureModel
+from ....util.external.github import get_vaastav_path, get_vaastav_url
+
+
+class FixtureLocalDataSource(LocalCSVDataSourceModel[FixtureModel]):
+    def __init__(self, root: str, season: str) -> None:
+        super().__init__(FixtureModel, root, season)
+
+    def _csv_path(self) -> str:
+        return get_vaastav_path(self.root, get_vaastav_url("FIXTURES", self.season))
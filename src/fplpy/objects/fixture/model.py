@@ -1,11 +1,12 @@
 from .._element.model import Model
+from .._element.schema import DATETIME
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class FixtureModel(Model):
-    kickoff_time: Optional[str]
+    kickoff_time: Optional[str] = field(metadata=DATETIME)
     id: int
     event: int
     code: int
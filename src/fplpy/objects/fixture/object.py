@@ -3,13 +3,16 @@ from .._element.element import ElementWithIDandCode
 from .model import FixtureModel
 from typing import Hashable, TypeVar, Any
 from datetime import datetime
-from ...util.dt import string_to_datetime
+from ...util.dt import MAX_DATETIME, parse_iso_datetime
 
 
 T_fixture = TypeVar("T_fixture", bound="Fixture")
 
 
 class Fixture(ElementWithIDandCode[FixtureModel]):
+    __slots__ = ("_kickoff_time",)
+    _kickoff_time: datetime
+
     def __repr__(self) -> str:
         fields = [
             f"ID={self.id}",
@@ -30,10 +33,16 @@ class Fixture(ElementWithIDandCode[FixtureModel]):
     
     @property
     def kickoff_time(self) -> datetime:
-        if self.value.kickoff_time is None:
-            return datetime.max
+        """Kickoff in UTC, parsed once. `MAX_DATETIME` if not scheduled yet."""
+        try:
+            return self._kickoff_time
+        except AttributeError:
+            if self.value.kickoff_time is None:
+                self._kickoff_time = MAX_DATETIME
+            else:
+                self._kickoff_time = parse_iso_datetime(self.value.kickoff_time)
 
-        return string_to_datetime(self.value.kickoff_time)
+            return self._kickoff_time
     
     def values_to_hash_and_eq(self) -> tuple[Hashable, ...]:
         return (
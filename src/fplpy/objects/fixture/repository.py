@@ -2,9 +2,32 @@ from .._element.repository import RepositoryWithIDandCode
 from .._element.source import DataSourceModel
 from .model import FixtureModel
 from .object import T_fixture
-from typing import Generic
+from .timeline import FixtureTimeline
+from datetime import datetime
+from typing import Generic, Optional
 from abc import ABC
 
 
 class FixtureRepository(RepositoryWithIDandCode[T_fixture, DataSourceModel[FixtureModel]], ABC, Generic[T_fixture]):
-    pass
+    __timeline: Optional[FixtureTimeline[T_fixture]]
+
+    def _build_indexes(self, elements: list[T_fixture]) -> None:
+        super()._build_indexes(elements)
+        self.__timeline = None
+
+    def timeline(self) -> FixtureTimeline[T_fixture]:
+        """Fixtures sorted by kickoff, built the first time it's needed."""
+        elements = self._elements()
+
+        if self.__timeline is None:
+            self.__timeline = FixtureTimeline(elements)
+
+        return self.__timeline
+
+    def fixtures_in_window(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> list[T_fixture]:
+        """See `FixtureTimeline.fixtures_in_window()`."""
+        return self.timeline().fixtures_in_window(start, end)
+
+    def next_fixtures(self, team_id: int, n: int, now: Optional[datetime] = None) -> list[T_fixture]:
+        """See `FixtureTimeline.next_fixtures()`."""
+        return self.timeline().next_fixtures(team_id, n, now)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+from .object import T_fixture
+from ...util.dt import as_utc
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Generic, Iterable, Optional
+
+
+class FixtureTimeline(Generic[T_fixture]):
+    """Fixtures sorted by kickoff, overall and per team, queried with bisect.
+
+    Fixtures without a kickoff time, such as postponed ones, are left out. Datetimes
+    without a timezone are taken to be in UTC.
+    """
+    __fixtures: list[T_fixture]
+    __kickoffs: list[datetime]
+    __team_fixtures: dict[int, list[T_fixture]]
+    __team_kickoffs: dict[int, list[datetime]]
+
+    def __init__(self, fixtures: Iterable[T_fixture]) -> None:
+        scheduled = [fixture for fixture in fixtures if fixture.value.kickoff_time is not None]
+        self.__fixtures = sorted(scheduled, key=lambda fixture: (fixture.kickoff_time, fixture.id))
+        self.__kickoffs = [fixture.kickoff_time for fixture in self.__fixtures]
+
+        self.__team_fixtures = {}
+        for fixture in self.__fixtures:
+            self.__team_fixtures.setdefault(fixture.value.team_h, []).append(fixture)
+            self.__team_fixtures.setdefault(fixture.value.team_a, []).append(fixture)
+
+        self.__team_kickoffs = {
+            team: [fixture.kickoff_time for fixture in team_fixtures]
+            for team, team_fixtures in self.__team_fixtures.items()
+        }
+
+    def fixtures(self) -> list[T_fixture]:
+        return self.__fixtures.copy()
+
+    def fixtures_in_window(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> list[T_fixture]:
+        """Fixtures kicking off at or after `start` and before `end`, in kickoff order.
+
+        A bound of None leaves that side open.
+        """
+        low = 0 if start is None else bisect_left(self.__kickoffs, as_utc(start))
+        high = len(self.__kickoffs) if end is None else bisect_left(self.__kickoffs, as_utc(end))
+
+        return self.__fixtures[low:high]
+
+    def team_fixtures(self, team_id: int) -> list[T_fixture]:
+        """Home and away fixtures of a team, in kickoff order."""
+        return self.__team_fixtures.get(team_id, []).copy()
+
+    def next_fixtures(self, team_id: int, n: int, now: Optional[datetime] = None) -> list[T_fixture]:
+        """A team's next `n` fixtures kicking off at or after the current time, or `now` if given."""
+        if n < 0:
+            raise ValueError("n must not be negative")
+
+        kickoffs = self.__team_kickoffs.get(team_id, [])
+        i = bisect_left(kickoffs, as_utc(datetime.now(timezone.utc) if now is None else now))
+
+        return self.__team_fixtures.get(team_id, [])[i:i + n]
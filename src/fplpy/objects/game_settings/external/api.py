@@ -1,14 +1,11 @@
-from ..._element.source import APIDataSourceModel
-from ....util.external.api import call_api, get_url
+from ...bootstrap import BootstrapAPIDataSource, BootstrapSnapshot, BootstrapSnapshotProvider
 from ..model import GameSettingsModel
-from typing import Any
+from typing import Optional
 
 
-class GameSettingsAPIDataSource(APIDataSourceModel[GameSettingsModel]):
-    def __init__(self) -> None:
-        super().__init__(GameSettingsModel)
+class GameSettingsAPIDataSource(BootstrapAPIDataSource[GameSettingsModel]):
+    def __init__(self, snapshot_provider: Optional[BootstrapSnapshotProvider] = None) -> None:
+        super().__init__(GameSettingsModel, snapshot_provider)
 
-    def _get_raw_data(self) -> list[dict[str, Any]]:
-        data: dict[str, dict[str, Any]] = call_api(get_url("BOOTSTRAP-STATIC"))
-
-        return [data["game_settings"]]
+    def _select(self, snapshot: BootstrapSnapshot) -> tuple[GameSettingsModel, ...]:
+        return snapshot.game_settings
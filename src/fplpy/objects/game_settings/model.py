@@ -2,7 +2,7 @@ from .._element.model import Model
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class GameSettingsModel(Model):
     league_join_private_max: int
     league_join_public_max: int
@@ -8,6 +8,8 @@ T_GameSettings = TypeVar("T_GameSettings", bound="GameSettings")
 
 
 class GameSettings(Element[GameSettingsModel]):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "GameSettings(...)"
 
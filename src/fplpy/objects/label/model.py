@@ -2,7 +2,7 @@ from .._element.model import Model
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class LabelModel(Model):
     label: str  # Formal
     name: str  # Code
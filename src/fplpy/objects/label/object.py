@@ -8,6 +8,8 @@ T_label = TypeVar("T_label", bound="Label")
 
 
 class Label(Element[LabelModel]):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         fields = [
             f"label='{self.value.label}'",
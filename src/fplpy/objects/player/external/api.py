@@ -1,14 +1,11 @@
-from ..._element.source import APIDataSourceModel
-from ....util.external.api import call_api, get_url
+from ...bootstrap import BootstrapAPIDataSource, BootstrapSnapshot, BootstrapSnapshotProvider
 from ..model import PlayerModel
-from typing import Any
+from typing import Optional
 
 
-class PlayerAPIDataSource(APIDataSourceModel[PlayerModel]):
-    def __init__(self) -> None:
-        super().__init__(PlayerModel)
+class PlayerAPIDataSource(BootstrapAPIDataSource[PlayerModel]):
+    def __init__(self, snapshot_provider: Optional[BootstrapSnapshotProvider] = None) -> None:
+        super().__init__(PlayerModel, snapshot_provider)
 
-    def _get_raw_data(self) -> list[dict[str, Any]]:
-        data: dict[str, list[dict[str, Any]]] = call_api(get_url("BOOTSTRAP-STATIC"))
-
-        return data["elements"]
+    def _select(self, snapshot: BootstrapSnapshot) -> tuple[PlayerModel, ...]:
+        return snapshot.players
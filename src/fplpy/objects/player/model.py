@@ -1,9 +1,10 @@
 from .._element.model import Model
+from .._element.schema import DATETIME
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class PlayerModel(Model):
     id: int
     chance_of_playing_next_round: Optional[int]
@@ -33,7 +34,7 @@ class PlayerModel(Model):
     status: str
     team: int
     team_code: int
-    team_join_date: Optional[str]
+    team_join_date: Optional[str] = field(metadata=DATETIME)
     total_points: int
     transfers_in: int
     transfers_in_event: int
@@ -3,12 +3,16 @@ from .._element.element import ElementWithIDandCode
 from .model import PlayerModel
 from typing import Hashable, TypeVar, Any
 from datetime import datetime
+from ...util.dt import MAX_DATETIME, parse_iso_datetime
 
 
 T_player = TypeVar("T_player", bound="Player")
 
 
 class Player(ElementWithIDandCode[PlayerModel]):
+    __slots__ = ("_team_join_date",)
+    _team_join_date: datetime
+
     def __repr__(self) -> str:
         fields = [
             f"ID={self.id}",
@@ -30,10 +34,16 @@ class Player(ElementWithIDandCode[PlayerModel]):
     
     @property
     def team_join_date(self) -> datetime:
-        if self.value.team_join_date is None:
-            return datetime.max
-
-        return datetime.strptime(self.value.team_join_date, "%Y-%m-%d")
+        """Midnight UTC of the date the player joined their team, parsed once. `MAX_DATETIME` if unknown."""
+        try:
+            return self._team_join_date
+        except AttributeError:
+            if self.value.team_join_date is None:
+                self._team_join_date = MAX_DATETIME
+            else:
+                self._team_join_date = parse_iso_datetime(self.value.team_join_date)
+
+            return self._team_join_date
     
     @property
     def code(self) -> int:
@@ -1,7 +1,7 @@
 from ..._element.source import GitHubDataSourceModel
 from ..model import PlayerHistoryModel
-from ....util.external.github import github_csv_to_dict, get_element_history_url
-from typing import Any
+from ....util.external.github import github_csv_to_dict, iter_github_csv, get_element_history_url
+from typing import Any, Iterator
 
 
 class PlayerHistoryGitHubDataSource(GitHubDataSourceModel[PlayerHistoryModel]):
@@ -20,3 +20,11 @@ class PlayerHistoryGitHubDataSource(GitHubDataSourceModel[PlayerHistoryModel]):
             data = []
 
         return data
+
+    def _iter_raw_data(self) -> Iterator[dict[str, Any]]:
+        url = get_element_history_url(self.season, self.__player_name_formatted)
+
+        try:
+            return iter_github_csv(url)
+        except Exception:
+            return iter(())
@@ -0,0 +1,22 @@
+from ..._element.source import LocalCSVDataSourceModel
+from ..model import PlayerHistoryModel
+from ....util.external.github import get_element_history_url, get_vaastav_path
+from typing import Any, Iterator
+import os
+
+
+class PlayerHistoryLocalDataSource(LocalCSVDataSourceModel[PlayerHistoryModel]):
+    def __init__(self, root: str, season: str, player_name_formatted: str) -> None:
+        super().__init__(PlayerHistoryModel, root, season)
+
+        self.__player_name_formatted = player_name_formatted
+
+    def _csv_path(self) -> str:
+        return get_vaastav_path(self.root, get_element_history_url(self.season, self.__player_name_formatted))
+
+    def _iter_raw_data(self) -> Iterator[dict[str, Any]]:
+        # players new to the league have no history file
+        if not os.path.exists(self._csv_path()):
+            return iter(())
+
+        return super()._iter_raw_data()
@@ -2,7 +2,7 @@ from .._element.model import Model
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class PlayerHistoryModel(Model):
     season_name: str
     element_code: int
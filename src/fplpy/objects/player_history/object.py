@@ -8,6 +8,8 @@ T_player_history = TypeVar("T_player_history", bound="PlayerHistory")
 
 
 class PlayerHistory(Element[PlayerHistoryModel]):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         fields = [
             f"season='{self.value.season_name}'",
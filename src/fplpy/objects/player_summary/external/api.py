@@ -1,17 +1,19 @@
 from ..._element.source import APIDataSourceModel
 from ....util.external.api import call_api, get_element_summary_url
+from ....util.external.transport import Transport
 from ..model import PlayerSummaryModel
-from typing import Any
+from typing import Any, Optional
 
 
 class PlayerSummaryAPIDataSource(APIDataSourceModel[PlayerSummaryModel]):
-    def __init__(self, player_id: int) -> None:
+    def __init__(self, player_id: int, transport: Optional[Transport] = None) -> None:
         super().__init__(PlayerSummaryModel)
         
         self.__player_id = player_id
+        self.__transport = transport
 
     def _get_raw_data(self) -> list[dict[str, Any]]:
         url = get_element_summary_url(self.__player_id)
-        data: dict[str, list[dict[str, Any]]] = call_api(url)
+        data: dict[str, list[dict[str, Any]]] = call_api(url, transport=self.__transport)
 
         return data["history"]
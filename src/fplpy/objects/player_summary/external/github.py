@@ -1,7 +1,7 @@
 from ..._element.source import GitHubDataSourceModel
 from ..model import PlayerSummaryModel
-from ....util.external.github import github_csv_to_dict, get_element_summary_url
-from typing import Any
+from ....util.external.github import github_csv_to_dict, iter_github_csv, get_element_summary_url, get_vaastav_url
+from typing import Any, Iterator
 
 
 class PlayerSummaryGitHubDataSource(GitHubDataSourceModel[PlayerSummaryModel]):
@@ -15,3 +15,22 @@ class PlayerSummaryGitHubDataSource(GitHubDataSourceModel[PlayerSummaryModel]):
         data: list[dict[str, Any]] = github_csv_to_dict(url)
 
         return data
+
+    def _iter_raw_data(self) -> Iterator[dict[str, Any]]:
+        return iter_github_csv(get_element_summary_url(self.season, self.__player_name_formatted))
+
+
+class PlayerSummarySeasonGitHubDataSource(GitHubDataSourceModel[PlayerSummaryModel]):
+    """Every player's summaries for a season, from the single `gws/merged_gw.csv` file."""
+
+    def __init__(self, season: str) -> None:
+        super().__init__(PlayerSummaryModel, season)
+
+    def _get_raw_data(self) -> list[dict[str, Any]]:
+        url = get_vaastav_url("MERGED-GW", self.season)
+        data: list[dict[str, Any]] = github_csv_to_dict(url)
+
+        return data
+
+    def _iter_raw_data(self) -> Iterator[dict[str, Any]]:
+        return iter_github_csv(get_vaastav_url("MERGED-GW", self.season))
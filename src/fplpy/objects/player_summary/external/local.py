@@ -0,0 +1,23 @@
+from ..._element.source import LocalCSVDataSourceModel
+from ..model import PlayerSummaryModel
+from ....util.external.github import get_element_summary_url, get_vaastav_path, get_vaastav_url
+
+
+class PlayerSummaryLocalDataSource(LocalCSVDataSourceModel[PlayerSummaryModel]):
+    def __init__(self, root: str, season: str, player_name_formatted: str) -> None:
+        super().__init__(PlayerSummaryModel, root, season)
+
+        self.__player_name_formatted = player_name_formatted
+
+    def _csv_path(self) -> str:
+        return get_vaastav_path(self.root, get_element_summary_url(self.season, self.__player_name_formatted))
+
+
+class PlayerSummarySeasonLocalDataSource(LocalCSVDataSourceModel[PlayerSummaryModel]):
+    """Every player's summaries for a season, from the mirrored `gws/merged_gw.csv` file."""
+
+    def __init__(self, root: str, season: str) -> None:
+        super().__init__(PlayerSummaryModel, root, season)
+
+    def _csv_path(self) -> str:
+        return get_vaastav_path(self.root, get_vaastav_url("MERGED-GW", self.season))
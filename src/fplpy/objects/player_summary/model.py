@@ -1,15 +1,16 @@
 from .._element.model import Model
-from dataclasses import dataclass
+from .._element.schema import NUMERIC_STR, DATETIME
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True, order=True, kw_only=True)
+@dataclass(frozen=True, order=True, kw_only=True, slots=True)
 class PlayerSummaryModel(Model):
     element: int
     fixture: int
     opponent_team: int
     total_points: int
     was_home: bool
-    kickoff_time: str
+    kickoff_time: str = field(metadata=DATETIME)
     team_h_score: int
     team_a_score: int
     round: int
@@ -27,15 +28,15 @@ class PlayerSummaryModel(Model):
     saves: int
     bonus: int
     bps: int
-    influence: str
-    creativity: str
-    threat: str
-    ict_index: str
+    influence: str = field(metadata=NUMERIC_STR)
+    creativity: str = field(metadata=NUMERIC_STR)
+    threat: str = field(metadata=NUMERIC_STR)
+    ict_index: str = field(metadata=NUMERIC_STR)
     starts: int
-    expected_goals: str
-    expected_assists: str
-    expected_goal_involvements: str
-    expected_goals_conceded: str
+    expected_goals: str = field(metadata=NUMERIC_STR)
+    expected_assists: str = field(metadata=NUMERIC_STR)
+    expected_goal_involvements: str = field(metadata=NUMERIC_STR)
+    expected_goals_conceded: str = field(metadata=NUMERIC_STR)
     mng_win: int
     mng_draw: int
     mng_loss: int
@@ -3,13 +3,16 @@ from .._element.element import Element
 from .model import PlayerSummaryModel
 from typing import TypeVar, Hashable, Any
 from datetime import datetime
-from ...util.dt import string_to_datetime
+from ...util.dt import parse_iso_datetime
 
 
 T_player_summary = TypeVar("T_player_summary", bound="PlayerSummary")
 
 
 class PlayerSummary(Element[PlayerSummaryModel]):
+    __slots__ = ("_kickoff_time",)
+    _kickoff_time: datetime
+
     def __repr__(self) -> str:
         fields = [
             f"element='{self.value.element}'",
@@ -21,7 +24,12 @@ class PlayerSummary(Element[PlayerSummaryModel]):
     
     @property
     def kickoff_time(self) -> datetime:
-        return string_to_datetime(self.value.kickoff_time)
+        """Kickoff in UTC, parsed once."""
+        try:
+            return self._kickoff_time
+        except AttributeError:
+            self._kickoff_time = parse_iso_datetime(self.value.kickoff_time)
+            return self._kickoff_time
 
     def __str__(self) -> str:
         return repr(self)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from .._element.index import HashIndex
+from .._element.source import DataSourceModel
+from .model import PlayerSummaryModel
+from dataclasses import asdict
+from threading import Lock
+from typing import Any, Optional
+
+
+class PlayerSummaryPartition:
+    """A season of summaries read once from a season-level source and partitioned by player.
+
+    The source is read the first time a partition is asked for, after which each
+    player's summaries are a dictionary lookup by `element`.
+    """
+    __index: Optional[HashIndex[PlayerSummaryModel]]
+
+    def __init__(self, source: DataSourceModel[PlayerSummaryModel]) -> None:
+        self.__source = source
+        self.__index = None
+        self.__lock = Lock()
+
+    def for_element(self, element: int) -> list[PlayerSummaryModel]:
+        """Summaries of the player with id `element`, in file order."""
+        return self.__built().get(element).copy()
+
+    def refresh(self) -> None:
+        """Reads the source again."""
+        index = HashIndex(self.__source.get(), lambda x: x.element)
+
+        with self.__lock:
+            self.__index = index
+
+    def __built(self) -> HashIndex[PlayerSummaryModel]:
+        index = self.__index
+        if index is not None:
+            return index
+
+        with self.__lock:
+            if self.__index is None:
+                self.__index = HashIndex(self.__source.get(), lambda x: x.element)
+
+            return self.__index
+
+
+class PlayerSummaryPartitionDataSource(DataSourceModel[PlayerSummaryModel]):
+    """Summaries of one player, served from a `PlayerSummaryPartition`."""
+
+    def __init__(self, partition: PlayerSummaryPartition, element: int) -> None:
+        self.__partition = partition
+        self.__element = element
+
+    def get(self) -> list[PlayerSummaryModel]:
+        return self.__partition.for_element(self.__element)
+
+    def _get_raw_data(self) -> list[dict[str, Any]]:
+        return [asdict(model) for model in self.get()]
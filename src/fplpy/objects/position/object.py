@@ -8,6 +8,8 @@ T_position = TypeVar("T_position", bound="Position")
 
 
 class Position(ElementWithID[PositionModel]):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         fields = [
             f"ID={self.id}",
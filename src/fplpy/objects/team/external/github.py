@@ -1,7 +1,7 @@
 from ..._element.source import GitHubDataSourceModel
 from ..model import TeamModel
-from ....util.external.github import get_vaastav_url, github_csv_to_dict
-from typing import Any
+from ....util.external.github import get_vaastav_url, github_csv_to_dict, iter_github_csv
+from typing import Any, Iterator
 
 
 class TeamGitHubDataSource(GitHubDataSourceModel[TeamModel]):
@@ -13,3 +13,6 @@ class TeamGitHubDataSource(GitHubDataSourceModel[TeamModel]):
         data: list[dict[str, Any]] = github_csv_to_dict(url)
 
         return data
+
+    def _iter_raw_data(self) -> Iterator[dict[str, Any]]:
+        return iter_github_csv(get_vaastav_url("TEAMS", self.season))
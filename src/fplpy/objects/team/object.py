@@ -8,6 +8,8 @@ T_team = TypeVar("T_team", bound="Team")
 
 
 class Team(ElementWithIDandCode[TeamModel]):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         fields = [
             f"ID={self.id}",
@@ -0,0 +1,234 @@
+from __future__ import annotations
+from ..objects.game_settings.model import GameSettingsModel
+from ..objects.position.model import PositionModel
+from ..objects.summary import ObjTypes, RepoTypes
+from ..repository_factory.template import RepositoryFactoryTemplate
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping, Optional, Sequence, Union
+import numpy as np
+import numpy.typing as npt
+import pulp
+
+
+# A player field, e.g. "ep_next", a function of a player, or one score per player
+Objective = Union[str, Callable[[ObjTypes.Player], float], npt.ArrayLike]
+
+
+@dataclass(frozen=True)
+class SquadConstraints:
+    """Squad rules, as in `GameSettingsModel` and `PositionModel`.
+
+    Position limits are keyed by `element_type`. `budget` is in tenths of a million,
+    like `now_cost`.
+    """
+    squad_size: int
+    starting_size: int
+    team_limit: int
+    budget: int
+    squad_select: Mapping[int, int]
+    min_play: Mapping[int, int]
+    max_play: Mapping[int, int]
+
+    @classmethod
+    def from_models(cls, game_settings: GameSettingsModel, positions: Iterable[PositionModel]) -> "SquadConstraints":
+        positions = list(positions)
+
+        return cls(
+            squad_size=game_settings.squad_squadsize,
+            starting_size=game_settings.squad_squadplay,
+            team_limit=game_settings.squad_team_limit,
+            budget=game_settings.squad_total_spend,
+            squad_select={position.id: position.squad_select for position in positions},
+            min_play={position.id: position.squad_min_play for position in positions},
+            max_play={position.id: position.squad_max_play for position in positions},
+        )
+
+    @classmethod
+    def from_repositories(
+        cls,
+        game_settings: RepoTypes.GameSettingsRepo,
+        positions: RepoTypes.PositionRepo
+    ) -> "SquadConstraints":
+        settings = game_settings.get_all()
+        if len(settings) != 1:
+            raise ValueError(f"Expected 1 game settings, obtained {len(settings)}")
+
+        return cls.from_models(settings[0].value, [position.value for position in positions.get_all()])
+
+    @classmethod
+    def from_repo_factory(cls, repo_factory: RepositoryFactoryTemplate) -> "SquadConstraints":
+        return cls.from_repositories(repo_factory.game_settings(), repo_factory.positions())
+
+
+@dataclass(frozen=True)
+class SquadSelection:
+    squad: list[ObjTypes.Player]
+    starting: list[ObjTypes.Player]
+    bench: list[ObjTypes.Player]
+    captain: ObjTypes.Player
+    cost: int
+    score: float
+    status: str
+
+
+def optimize_squad(
+    players: Sequence[ObjTypes.Player],
+    objective: Objective,
+    constraints: SquadConstraints,
+    bench_weight: float = 0.0,
+    captain_multiplier: float = 2.0,
+    initial_squad: Optional[Iterable[ObjTypes.Player]] = None,
+    time_limit: Optional[float] = None,
+    solver: Optional[pulp.LpSolver] = None
+) -> SquadSelection:
+    """Picks the squad, starting players and captain maximising `objective`, with PuLP.
+
+    The score of a selection is the sum of its starting players' scores, plus the
+    captain's score again times `captain_multiplier - 1`, plus the bench players'
+    scores times `bench_weight`. Objective and budget coefficients are NumPy arrays
+    over every player, team and position counts are summed over index arrays, and
+    each player has its own starting and captain constraints.
+
+    Parameters
+    ----------
+    players : Sequence[ObjTypes.Player]
+        Players to choose from, e.g. `players().get_all()` less unavailable ones.
+    objective : Objective
+        Score of each player: the name of a numeric `PlayerModel` field, a function of a
+        player, or an array with one score per player, in order.
+    constraints : SquadConstraints
+        Squad rules, e.g. `SquadConstraints.from_repo_factory()`.
+    bench_weight : float, optional
+        Weight of bench players' scores, by default 0.
+    captain_multiplier : float, optional
+        Multiplier of the captain's score, by default 2.
+    initial_squad : Iterable[ObjTypes.Player], optional
+        Squad to warm start the solver from, such as the current one. Only the squad
+        is given, CBC completes the rest of the starting point.
+    time_limit : float, optional
+        Seconds the solver may take, returning the best selection found so far.
+    solver : pulp.LpSolver, optional
+        Solver to use, by default CBC with `time_limit` and the warm start: an installed
+        CBC through `COIN_CMD` if there is one, else the copy bundled with PuLP.
+
+    Returns
+    -------
+    SquadSelection
+        Players of the squad in the order of `players`, and the selection's cost and score.
+
+    Raises
+    ------
+    ValueError
+        If no squad meets the constraints.
+    """
+    scores = _scores(players, objective)
+    costs = np.fromiter((player.value.now_cost for player in players), dtype=np.int64, count=len(players))
+    teams = np.fromiter((player.value.team for player in players), dtype=np.int64, count=len(players))
+    positions = np.fromiter((player.value.element_type for player in players), dtype=np.int64, count=len(players))
+
+    n = len(players)
+    problem = pulp.LpProblem("squad", pulp.LpMaximize)
+    squad = _binaries(problem, "squad", n)
+    starting = _binaries(problem, "starting", n)
+    captain = _binaries(problem, "captain", n)
+
+    problem += (
+        _weighted(starting, scores * (1 - bench_weight))
+        + _weighted(squad, scores * bench_weight)
+        + _weighted(captain, scores * (captain_multiplier - 1))
+    )
+
+    problem += pulp.lpSum(squad) == constraints.squad_size, "squad_size"
+    problem += pulp.lpSum(starting) == constraints.starting_size, "starting_size"
+    problem += pulp.lpSum(captain) == 1, "one_captain"
+    problem += _weighted(squad, costs) <= constraints.budget, "budget"
+
+    for i in range(n):
+        problem += starting[i] - squad[i] <= 0, f"starts_from_squad_{i}"
+        problem += captain[i] - starting[i] <= 0, f"captain_starts_{i}"
+
+    for team in np.unique(teams):
+        problem += _count(squad, np.flatnonzero(teams == team)) <= constraints.team_limit, f"team_{team}"
+
+    for position, count in constraints.squad_select.items():
+        members = np.flatnonzero(positions == position)
+        in_squad = _count(squad, members)
+        in_team = _count(starting, members)
+
+        problem += in_squad == count, f"position_{position}_squad"
+        problem += in_team >= constraints.min_play.get(position, 0), f"position_{position}_min_play"
+        problem += in_team <= constraints.max_play.get(position, count), f"position_{position}_max_play"
+
+    if initial_squad is not None:
+        initial = {player.id for player in initial_squad}
+        for variable, player in zip(squad, players):
+            variable.setInitialValue(1 if player.id in initial else 0)
+
+    if solver is None:
+        solver = _default_solver(problem, time_limit, warm_start=initial_squad is not None)
+
+    problem.solve(solver)
+    status = pulp.LpStatus[problem.status]
+    if problem.sol_status not in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+        raise ValueError(f"No squad meets the constraints, solver status {status}")
+
+    chosen = [i for i in range(n) if _is_set(squad[i])]
+    starters = [i for i in chosen if _is_set(starting[i])]
+    captain_index = next(i for i in starters if _is_set(captain[i]))
+
+    return SquadSelection(
+        squad=[players[i] for i in chosen],
+        starting=[players[i] for i in starters],
+        bench=[players[i] for i in chosen if not _is_set(starting[i])],
+        captain=players[captain_index],
+        cost=int(costs[chosen].sum()),
+        score=float(pulp.value(problem.objective)),
+        status=status,
+    )
+
+
+def _scores(players: Sequence[ObjTypes.Player], objective: Objective) -> npt.NDArray[np.float64]:
+    if isinstance(objective, str):
+        values = np.fromiter((getattr(player.value, objective) for player in players), dtype=np.float64, count=len(players))
+    elif callable(objective):
+        values = np.fromiter((objective(player) for player in players), dtype=np.float64, count=len(players))
+    else:
+        values = np.asarray(objective, dtype=np.float64)
+
+    if values.shape != (len(players),):
+        raise ValueError(f"Expected one score per player, obtained shape {values.shape}")
+
+    return values
+
+
+def _binaries(problem: pulp.LpProblem, name: str, n: int) -> list[pulp.LpVariable]:
+    if hasattr(problem, "add_variable"):  # from PuLP 3.3, constructing LpVariable directly is deprecated
+        return [problem.add_variable(f"{name}_{i}", cat=pulp.LpBinary) for i in range(n)]
+
+    return [pulp.LpVariable(f"{name}_{i}", cat=pulp.LpBinary) for i in range(n)]
+
+
+def _default_solver(problem: pulp.LpProblem, time_limit: Optional[float], warm_start: bool) -> pulp.LpSolver:
+    if not hasattr(problem, "add_variable"):  # before PuLP 3.3, PULP_CBC_CMD isn't deprecated
+        return pulp.PULP_CBC_CMD(msg=False, timeLimit=time_limit, warmStart=warm_start)
+
+    solver = pulp.COIN_CMD(msg=False, timeLimit=time_limit, warmStart=warm_start)
+    bundled_cbc = getattr(pulp.PULP_CBC_CMD, "pulp_cbc_path", None)
+    if not solver.available() and bundled_cbc is not None:
+        # CBC isn't installed, run the copy bundled with PuLP through COIN_CMD
+        solver = pulp.COIN_CMD(msg=False, timeLimit=time_limit, warmStart=warm_start, path=bundled_cbc)
+
+    return solver
+
+
+def _weighted(variables: Sequence[pulp.LpVariable], coefficients: npt.NDArray[np.generic]) -> pulp.LpAffineExpression:
+    return pulp.LpAffineExpression(zip(variables, coefficients.tolist()))
+
+
+def _count(variables: Sequence[pulp.LpVariable], indexes: npt.NDArray[np.intp]) -> pulp.LpAffineExpression:
+    """Number of `variables` set among those at `indexes`."""
+    return pulp.lpSum([variables[i] for i in indexes.tolist()])
+
+
+def _is_set(variable: pulp.LpVariable) -> bool:
+    return variable.varValue is not None and variable.varValue > 0.5
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from ..objects.summary import ObjTypes, RepoTypes
+from ..objects.player_summary.external.api import PlayerSummaryAPIDataSource
+from ..objects.player_history.external.api import PlayerHistoryAPIDataSource
+from ..util.external.api import call_api, get_element_summary_url
+from ..util.external.rate_limit import RateLimiter
+from ..util.external.transport import Transport
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+
+class ElementSummaryRepositories(NamedTuple):
+    summaries: RepoTypes.PlayerSummaryRepo
+    history: RepoTypes.PlayerHistoryRepo
+
+
+def fetch_all_player_summaries(
+    player_ids: Iterable[int],
+    concurrency: int = 8,
+    rate_limiter: Optional[RateLimiter] = None,
+    transport: Optional[Transport] = None
+) -> dict[int, ElementSummaryRepositories]:
+    """Fetches `element-summary/{id}/` for many players concurrently.
+
+    Each player's endpoint is requested once and serves both the gameweek summaries
+    (`history`) and past season history (`history_past`) repositories. Responses are
+    kept in `call_api`'s cache, which is keyed by URL and transport, so a later
+    `APIRepositoryFactory.player_summary()` or `player_history()` is only served from
+    it when the default transport was used here.
+
+    Parameters
+    ----------
+    player_ids : Iterable[int]
+        Ids of the players to fetch.
+    concurrency : int, optional
+        Number of requests in flight at once, by default 8.
+    rate_limiter : RateLimiter, optional
+        Limiter shared by every request, by default `DEFAULT_REQUESTS_PER_SECOND`.
+    transport : Transport, optional
+        Transport for the requests, by default the shared pooled transport.
+
+    Returns
+    -------
+    dict[int, ElementSummaryRepositories]
+        Repositories, already built, keyed by player id.
+    """
+    if rate_limiter is None:
+        rate_limiter = RateLimiter(DEFAULT_REQUESTS_PER_SECOND)
+    limiter = rate_limiter
+
+    def fetch(player_id: int) -> tuple[int, ElementSummaryRepositories]:
+        limiter.acquire()
+        call_api(get_element_summary_url(player_id), transport=transport)
+
+        repos = ElementSummaryRepositories(
+            summaries=RepoTypes.PlayerSummaryRepo(
+                ObjTypes.PlayerSummary, PlayerSummaryAPIDataSource(player_id, transport=transport)
+            ),
+            history=RepoTypes.PlayerHistoryRepo(
+                ObjTypes.PlayerHistory, PlayerHistoryAPIDataSource(player_id, transport=transport)
+            ),
+        )
+        repos.summaries.refresh()
+        repos.history.refresh()
+
+        return player_id, repos
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return dict(executor.map(fetch, dict.fromkeys(player_ids)))
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Any
+from typing import Any, Optional
 from ..objects.summary import ObjTypes, RepoTypes, ObjNames
+from ..objects._element.identity_map import IdentityMap
 from ..util.external.github import format_player_name
 
 
@@ -22,7 +23,14 @@ from ..objects.team.external.github import TeamGitHubDataSource
 from ..objects.player_summary.external.github import PlayerSummaryGitHubDataSource
 from ..objects.player_history.external.github import PlayerHistoryGitHubDataSource
 
+from ..objects.player_summary.partition import PlayerSummaryPartition, PlayerSummaryPartitionDataSource
+
 from ..objects.event.external.local import EventLocalDataSource
+from ..objects.fixture.external.local import FixtureLocalDataSource
+from ..objects.player.external.local import PlayerLocalDataSource
+from ..objects.team.external.local import TeamLocalDataSource
+from ..objects.player_summary.external.local import PlayerSummaryLocalDataSource
+from ..objects.player_history.external.local import PlayerHistoryLocalDataSource
 
 
 class Source(str, Enum):
@@ -33,27 +41,38 @@ class Source(str, Enum):
 
 class IndividualRepositoryFactories:
     @staticmethod
-    def chips(source: Source) -> RepoTypes.ChipRepo:
+    def chips(source: Source, **kwargs) -> RepoTypes.ChipRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
-            return RepoTypes.ChipRepo(ObjTypes.Chip, ChipAPIDataSource())
+            return RepoTypes.ChipRepo(ObjTypes.Chip, ChipAPIDataSource(snapshot_provider=kwargs.get("snapshot_provider")), identity_map=identity_map)
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.CHIP, source))
 
     @staticmethod
     def players(source: Source, **kwargs) -> RepoTypes.PlayerRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
-            return RepoTypes.PlayerRepo(ObjTypes.Player, PlayerAPIDataSource())
+            return RepoTypes.PlayerRepo(ObjTypes.Player, PlayerAPIDataSource(snapshot_provider=kwargs.get("snapshot_provider")), identity_map=identity_map)
         elif source == Source.GITHUB:
             season = process_season_param(kwargs.get("season"))
 
-            return RepoTypes.PlayerRepo(ObjTypes.Player, PlayerGitHubDataSource(season=season))
+            return RepoTypes.PlayerRepo(ObjTypes.Player, PlayerGitHubDataSource(season=season), identity_map=identity_map)
+        elif source == Source.LOCAL:
+            season = process_season_param(kwargs.get("season"))
+            root = process_root_param(kwargs.get("root"))
+
+            return RepoTypes.PlayerRepo(ObjTypes.Player, PlayerLocalDataSource(root=root, season=season), identity_map=identity_map)
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.PLAYER, source))
 
     @staticmethod
     def events(source: Source, **kwargs) -> RepoTypes.EventRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
-            return RepoTypes.EventRepo(ObjTypes.Event, EventAPIDataSource())
+            return RepoTypes.EventRepo(ObjTypes.Event, EventAPIDataSource(snapshot_provider=kwargs.get("snapshot_provider")), identity_map=identity_map)
         elif source == Source.LOCAL:
             file_path = kwargs.get("file_path")
             if file_path is None:
@@ -62,16 +81,28 @@ class IndividualRepositoryFactories:
             if not isinstance(file_path, str):
                 raise TypeError(f"'file_path' must be a str")
 
-            return RepoTypes.EventRepo(ObjTypes.Event, EventLocalDataSource(file_path=file_path))
+            return RepoTypes.EventRepo(ObjTypes.Event, EventLocalDataSource(file_path=file_path), identity_map=identity_map)
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.EVENT, source))
 
     @staticmethod
     def player_summary(source: Source, player: ObjTypes.Player, **kwargs) -> RepoTypes.PlayerSummaryRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
             player_id = player.value.id
 
-            return RepoTypes.PlayerSummaryRepo(ObjTypes.PlayerSummary, PlayerSummaryAPIDataSource(player_id=player_id))
+            return RepoTypes.PlayerSummaryRepo(ObjTypes.PlayerSummary, PlayerSummaryAPIDataSource(player_id=player_id), identity_map=identity_map)
+
+        elif source in (Source.GITHUB, Source.LOCAL) and kwargs.get("summary_partition") is not None:
+            partition = kwargs["summary_partition"]
+            if not isinstance(partition, PlayerSummaryPartition):
+                raise TypeError(f"'summary_partition' must be a PlayerSummaryPartition")
+
+            return RepoTypes.PlayerSummaryRepo(
+                ObjTypes.PlayerSummary, PlayerSummaryPartitionDataSource(partition, player.value.id),
+                identity_map=identity_map
+            )
 
         elif source == Source.GITHUB:
             season = process_season_param(kwargs.get("season"))
@@ -85,17 +116,38 @@ class IndividualRepositoryFactories:
                 PlayerSummaryGitHubDataSource(
                     season=season,
                     player_name_formatted=name
-                )
+                ),
+                identity_map=identity_map
+            )
+
+        elif source == Source.LOCAL:
+            season = process_season_param(kwargs.get("season"))
+            root = process_root_param(kwargs.get("root"))
+
+            name = format_player_name(
+                player.value.first_name, player.value.second_name, player.value.id
+            )
+
+            return RepoTypes.PlayerSummaryRepo(
+                ObjTypes.PlayerSummary,
+                PlayerSummaryLocalDataSource(
+                    root=root,
+                    season=season,
+                    player_name_formatted=name
+                ),
+                identity_map=identity_map
             )
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.PLAYER_SUMMARY, source))
     
     @staticmethod
     def player_history(source: Source, player: ObjTypes.Player, **kwargs) -> RepoTypes.PlayerHistoryRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
             player_id = player.value.id
 
-            return RepoTypes.PlayerHistoryRepo(ObjTypes.PlayerHistory, PlayerHistoryAPIDataSource(player_id=player_id))
+            return RepoTypes.PlayerHistoryRepo(ObjTypes.PlayerHistory, PlayerHistoryAPIDataSource(player_id=player_id), identity_map=identity_map)
 
         elif source == Source.GITHUB:
             season = process_season_param(kwargs.get("season"))
@@ -109,51 +161,98 @@ class IndividualRepositoryFactories:
                 PlayerHistoryGitHubDataSource(
                     season=season,
                     player_name_formatted=name
-                )
+                ),
+                identity_map=identity_map
+            )
+
+        elif source == Source.LOCAL:
+            season = process_season_param(kwargs.get("season"))
+            root = process_root_param(kwargs.get("root"))
+
+            name = format_player_name(
+                player.value.first_name, player.value.second_name, player.value.id
+            )
+
+            return RepoTypes.PlayerHistoryRepo(
+                ObjTypes.PlayerHistory,
+                PlayerHistoryLocalDataSource(
+                    root=root,
+                    season=season,
+                    player_name_formatted=name
+                ),
+                identity_map=identity_map
             )
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.PLAYER_HISTORY, source))
 
     @staticmethod
     def fixtures(source: Source, **kwargs) -> RepoTypes.FixtureRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
-            return RepoTypes.FixtureRepo(ObjTypes.Fixture, FixtureAPIDataSource())
+            return RepoTypes.FixtureRepo(ObjTypes.Fixture, FixtureAPIDataSource(), identity_map=identity_map)
         elif source == Source.GITHUB:
             season = process_season_param(kwargs.get("season"))
 
-            return RepoTypes.FixtureRepo(ObjTypes.Fixture, FixtureGitHubDataSource(season=season))
+            return RepoTypes.FixtureRepo(ObjTypes.Fixture, FixtureGitHubDataSource(season=season), identity_map=identity_map)
+        elif source == Source.LOCAL:
+            season = process_season_param(kwargs.get("season"))
+            root = process_root_param(kwargs.get("root"))
+
+            return RepoTypes.FixtureRepo(ObjTypes.Fixture, FixtureLocalDataSource(root=root, season=season), identity_map=identity_map)
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.FIXTURE, source))
 
     @staticmethod
     def teams(source: Source, **kwargs) -> RepoTypes.TeamRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
-            return RepoTypes.TeamRepo(ObjTypes.Team, TeamAPIDataSource())
+            return RepoTypes.TeamRepo(ObjTypes.Team, TeamAPIDataSource(snapshot_provider=kwargs.get("snapshot_provider")), identity_map=identity_map)
         elif source == Source.GITHUB:
             season = process_season_param(kwargs.get("season"))
 
-            return RepoTypes.TeamRepo(ObjTypes.Team, TeamGitHubDataSource(season=season))
+            return RepoTypes.TeamRepo(ObjTypes.Team, TeamGitHubDataSource(season=season), identity_map=identity_map)
+        elif source == Source.LOCAL:
+            season = process_season_param(kwargs.get("season"))
+            root = process_root_param(kwargs.get("root"))
+
+            return RepoTypes.TeamRepo(ObjTypes.Team, TeamLocalDataSource(root=root, season=season), identity_map=identity_map)
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.TEAM, source))
 
     @staticmethod
-    def positions(source: Source) -> RepoTypes.PositionRepo:
+    def positions(source: Source, **kwargs) -> RepoTypes.PositionRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
-            return RepoTypes.PositionRepo(ObjTypes.Position, PositionAPIDataSource())
+            return RepoTypes.PositionRepo(
+                ObjTypes.Position,
+                PositionAPIDataSource(snapshot_provider=kwargs.get("snapshot_provider")),
+                identity_map=identity_map
+            )
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.POSITION, source))
 
     @staticmethod
-    def game_settings(source: Source) -> RepoTypes.GameSettingsRepo:
+    def game_settings(source: Source, **kwargs) -> RepoTypes.GameSettingsRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
-            return RepoTypes.GameSettingsRepo(ObjTypes.GameSettings, GameSettingsAPIDataSource())
+            return RepoTypes.GameSettingsRepo(
+                ObjTypes.GameSettings,
+                GameSettingsAPIDataSource(snapshot_provider=kwargs.get("snapshot_provider")),
+                identity_map=identity_map
+            )
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.GAME_SETTINGS, source))
 
     @staticmethod
-    def labels(source: Source) -> RepoTypes.LabelRepo:
+    def labels(source: Source, **kwargs) -> RepoTypes.LabelRepo:
+        identity_map = process_identity_map_param(kwargs.get("identity_map"))
+
         if source == Source.API:
-            return RepoTypes.LabelRepo(ObjTypes.Label, LabelAPIDataSource())
+            return RepoTypes.LabelRepo(ObjTypes.Label, LabelAPIDataSource(snapshot_provider=kwargs.get("snapshot_provider")), identity_map=identity_map)
 
         raise NotImplementedError(_not_implemented_error_msg(ObjNames.LABEL, source))
 
@@ -170,3 +269,20 @@ def process_season_param(season: Any) -> str:
         raise TypeError(f"'season' must be a str")
         
     return season
+
+
+def process_root_param(root: Any) -> str:
+    if root is None:
+        raise ValueError(f"Missing 'root' parameter")
+
+    if not isinstance(root, str):
+        raise TypeError(f"'root' must be a str")
+
+    return root
+
+
+def process_identity_map_param(identity_map: Any) -> Optional[IdentityMap]:
+    if identity_map is not None and not isinstance(identity_map, IdentityMap):
+        raise TypeError(f"'identity_map' must be an IdentityMap")
+
+    return identity_map
@@ -1,74 +1,131 @@
 from .general import IndividualRepositoryFactories, Source
 from .template import RepositoryFactoryTemplate
 from ..objects.summary import RepoTypes, ObjTypes
+from ..objects.bootstrap import BootstrapSnapshotProvider, bootstrap_file_fetcher
+from ..objects._element.identity_map import IdentityMap
+from ..objects.player_summary.external.github import PlayerSummarySeasonGitHubDataSource
+from ..objects.player_summary.external.local import PlayerSummarySeasonLocalDataSource
+from ..objects.player_summary.partition import PlayerSummaryPartition
+from ..util.external.github import get_vaastav_path, get_vaastav_url
+from typing import Optional
 import os
 
 
 class APIRepositoryFactory(RepositoryFactoryTemplate):
+    """Reads the current season from the API.
+
+    Bootstrap-static entities come from the factory's `snapshot_provider`, its own
+    unless one is passed in to share snapshots between factories.
+    """
+
+    def __init__(self, snapshot_provider: Optional[BootstrapSnapshotProvider] = None) -> None:
+        if snapshot_provider is None:
+            snapshot_provider = BootstrapSnapshotProvider()
+        self.__snapshot_provider = snapshot_provider
+        self.__identity_map = IdentityMap()
+
+    @property
+    def snapshot_provider(self) -> BootstrapSnapshotProvider:
+        return self.__snapshot_provider
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Shared by every repository of the factory, so each entity is one instance."""
+        return self.__identity_map
+
+    def refresh(self) -> None:
+        """Fetches a new bootstrap-static snapshot, read by the factory's repositories from then on."""
+        self.__snapshot_provider.refresh()
+
     def chips(self) -> RepoTypes.ChipRepo:
-        return IndividualRepositoryFactories.chips(Source.API)
+        return IndividualRepositoryFactories.chips(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def players(self) -> RepoTypes.PlayerRepo:
-        return IndividualRepositoryFactories.players(Source.API)
+        return IndividualRepositoryFactories.players(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def events(self) -> RepoTypes.EventRepo:
-        return IndividualRepositoryFactories.events(Source.API)
+        return IndividualRepositoryFactories.events(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def player_summary(self, player: ObjTypes.Player) -> RepoTypes.PlayerSummaryRepo:
-        return IndividualRepositoryFactories.player_summary(Source.API, player)
+        return IndividualRepositoryFactories.player_summary(Source.API, player, identity_map=self.__identity_map)
     
     def player_history(self, player: ObjTypes.Player) -> RepoTypes.PlayerHistoryRepo:
-        return IndividualRepositoryFactories.player_history(Source.API, player)
+        return IndividualRepositoryFactories.player_history(Source.API, player, identity_map=self.__identity_map)
     
     def fixtures(self) -> RepoTypes.FixtureRepo:
-        return IndividualRepositoryFactories.fixtures(Source.API)
+        return IndividualRepositoryFactories.fixtures(Source.API, identity_map=self.__identity_map)
     
     def teams(self) -> RepoTypes.TeamRepo:
-        return IndividualRepositoryFactories.teams(Source.API)
+        return IndividualRepositoryFactories.teams(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def positions(self) -> RepoTypes.PositionRepo:
-        return IndividualRepositoryFactories.positions(Source.API)
+        return IndividualRepositoryFactories.positions(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def game_settings(self) -> RepoTypes.GameSettingsRepo:
-        return IndividualRepositoryFactories.game_settings(Source.API)
+        return IndividualRepositoryFactories.game_settings(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def labels(self) -> RepoTypes.LabelRepo:
-        return IndividualRepositoryFactories.labels(Source.API)
+        return IndividualRepositoryFactories.labels(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     
 class GitHubRepositoryFactory(RepositoryFactoryTemplate):
-    def __init__(self, season: str) -> None:
+    """Reads a season from the vaastav GitHub repository.
+
+    Player summaries are read from the season's `gws/merged_gw.csv` the first time
+    one is needed, rather than from each player's `gw.csv`.
+    """
+
+    def __init__(self, season: str, snapshot_provider: Optional[BootstrapSnapshotProvider] = None) -> None:
+        if snapshot_provider is None:
+            snapshot_provider = BootstrapSnapshotProvider()
+
         self.__season = season
+        self.__summary_partition = PlayerSummaryPartition(PlayerSummarySeasonGitHubDataSource(season))
+        self.__snapshot_provider = snapshot_provider
+        self.__identity_map = IdentityMap()
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Shared by every repository of the factory, so each entity is one instance."""
+        return self.__identity_map
+
+    @property
+    def snapshot_provider(self) -> BootstrapSnapshotProvider:
+        """Serves the entities read from the API rather than the vaastav repository."""
+        return self.__snapshot_provider
 
     def chips(self) -> RepoTypes.ChipRepo:
-        return IndividualRepositoryFactories.chips(Source.API)
+        return IndividualRepositoryFactories.chips(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def players(self) -> RepoTypes.PlayerRepo:
-        return IndividualRepositoryFactories.players(Source.GITHUB, season=self.__season)
+        return IndividualRepositoryFactories.players(Source.GITHUB, season=self.__season, identity_map=self.__identity_map)
     
     def events(self) -> RepoTypes.EventRepo:
-        return IndividualRepositoryFactories.events(Source.API)
+        return IndividualRepositoryFactories.events(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def player_summary(self, player: ObjTypes.Player) -> RepoTypes.PlayerSummaryRepo:
-        return IndividualRepositoryFactories.player_summary(Source.GITHUB, player, season=self.__season)
+        return IndividualRepositoryFactories.player_summary(
+            Source.GITHUB, player, season=self.__season, summary_partition=self.__summary_partition,
+            identity_map=self.__identity_map
+        )
     
     def player_history(self, player: ObjTypes.Player) -> RepoTypes.PlayerHistoryRepo:
-        return IndividualRepositoryFactories.player_history(Source.GITHUB, player, season=self.__season)
+        return IndividualRepositoryFactories.player_history(Source.GITHUB, player, season=self.__season, identity_map=self.__identity_map)
     
     def fixtures(self) -> RepoTypes.FixtureRepo:
-        return IndividualRepositoryFactories.fixtures(Source.GITHUB, season=self.__season)
+        return IndividualRepositoryFactories.fixtures(Source.GITHUB, season=self.__season, identity_map=self.__identity_map)
     
     def teams(self) -> RepoTypes.TeamRepo:
-        return IndividualRepositoryFactories.teams(Source.GITHUB, season=self.__season)
+        return IndividualRepositoryFactories.teams(Source.GITHUB, season=self.__season, identity_map=self.__identity_map)
     
     def positions(self) -> RepoTypes.PositionRepo:
-        return IndividualRepositoryFactories.positions(Source.API)
+        return IndividualRepositoryFactories.positions(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def game_settings(self) -> RepoTypes.GameSettingsRepo:
-        return IndividualRepositoryFactories.game_settings(Source.API)
+        return IndividualRepositoryFactories.game_settings(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
     def labels(self) -> RepoTypes.LabelRepo:
-        return IndividualRepositoryFactories.labels(Source.API)
+        return IndividualRepositoryFactories.labels(Source.API, snapshot_provider=self.__snapshot_provider, identity_map=self.__identity_map)
     
 
 class RepositoryFactory202425(GitHubRepositoryFactory):
@@ -78,4 +135,76 @@ class RepositoryFactory202425(GitHubRepositoryFactory):
         self.__event_file_path = event_file_path
         
     def events(self) -> RepoTypes.EventRepo:
-        return IndividualRepositoryFactories.events(Source.LOCAL, file_path=self.__event_file_path)
+        return IndividualRepositoryFactories.events(Source.LOCAL, file_path=self.__event_file_path, identity_map=self.identity_map)
+
+
+class LocalRepositoryFactory(GitHubRepositoryFactory):
+    """Reads a season from a local mirror of the vaastav repository, made with `sync_season()`.
+
+    Nothing is read from the API. Entities not in the vaastav repository (chips,
+    positions, game settings, labels and, without `event_file_path`, events) are read
+    from `bootstrap_file_path`, a saved bootstrap-static response, and raise
+    `NotImplementedError` without one. Events are read from `event_file_path` if given.
+    Player summaries are read from the mirrored `gws/merged_gw.csv` if it is there,
+    otherwise from each player's `gw.csv`.
+    """
+
+    def __init__(self, root: str, season: str, event_file_path: Optional[str] = None, bootstrap_file_path: Optional[str] = None) -> None:
+        snapshot_provider = None
+        if bootstrap_file_path is not None:
+            snapshot_provider = BootstrapSnapshotProvider(bootstrap_file_fetcher(bootstrap_file_path))
+        super().__init__(season, snapshot_provider)
+
+        self.__root = root
+        self.__season = season
+        self.__event_file_path = event_file_path
+        self.__bootstrap_file_path = bootstrap_file_path
+
+        self.__summary_partition: Optional[PlayerSummaryPartition] = None
+        if os.path.exists(get_vaastav_path(root, get_vaastav_url("MERGED-GW", season))):
+            self.__summary_partition = PlayerSummaryPartition(PlayerSummarySeasonLocalDataSource(root, season))
+
+    def players(self) -> RepoTypes.PlayerRepo:
+        return IndividualRepositoryFactories.players(Source.LOCAL, root=self.__root, season=self.__season, identity_map=self.identity_map)
+
+    def chips(self) -> RepoTypes.ChipRepo:
+        self.__require_bootstrap_file("chips")
+        return super().chips()
+
+    def events(self) -> RepoTypes.EventRepo:
+        if self.__event_file_path is None:
+            self.__require_bootstrap_file("events")
+            return super().events()
+
+        return IndividualRepositoryFactories.events(Source.LOCAL, file_path=self.__event_file_path, identity_map=self.identity_map)
+
+    def positions(self) -> RepoTypes.PositionRepo:
+        self.__require_bootstrap_file("positions")
+        return super().positions()
+
+    def game_settings(self) -> RepoTypes.GameSettingsRepo:
+        self.__require_bootstrap_file("game_settings")
+        return super().game_settings()
+
+    def labels(self) -> RepoTypes.LabelRepo:
+        self.__require_bootstrap_file("labels")
+        return super().labels()
+
+    def player_summary(self, player: ObjTypes.Player) -> RepoTypes.PlayerSummaryRepo:
+        return IndividualRepositoryFactories.player_summary(
+            Source.LOCAL, player, root=self.__root, season=self.__season, summary_partition=self.__summary_partition,
+            identity_map=self.identity_map
+        )
+
+    def player_history(self, player: ObjTypes.Player) -> RepoTypes.PlayerHistoryRepo:
+        return IndividualRepositoryFactories.player_history(Source.LOCAL, player, root=self.__root, season=self.__season, identity_map=self.identity_map)
+
+    def fixtures(self) -> RepoTypes.FixtureRepo:
+        return IndividualRepositoryFactories.fixtures(Source.LOCAL, root=self.__root, season=self.__season, identity_map=self.identity_map)
+
+    def teams(self) -> RepoTypes.TeamRepo:
+        return IndividualRepositoryFactories.teams(Source.LOCAL, root=self.__root, season=self.__season, identity_map=self.identity_map)
+
+    def __require_bootstrap_file(self, entity: str) -> None:
+        if self.__bootstrap_file_path is None:
+            raise NotImplementedError(f"{entity} aren't in the vaastav repository, pass bootstrap_file_path to read them locally")
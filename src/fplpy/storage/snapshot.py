@@ -0,0 +1,272 @@
+from __future__ import annotations
+from ..objects._element.columnar import ColumnStore, ColumnStoreDataSource
+from ..objects._element.identity_map import IdentityMap
+from ..objects._element.model import Model
+from ..objects._element.schema import FieldKind, model_schema
+from ..objects.chip.model import ChipModel
+from ..objects.event.model import EventModel
+from ..objects.fixture.model import FixtureModel
+from ..objects.game_settings.model import GameSettingsModel
+from ..objects.label.model import LabelModel
+from ..objects.player.model import PlayerModel
+from ..objects.player_history.model import PlayerHistoryModel
+from ..objects.player_summary.model import PlayerSummaryModel
+from ..objects.position.model import PositionModel
+from ..objects.summary import ObjTypes, RepoTypes
+from ..objects.team.model import TeamModel
+from ..repository_factory.template import RepositoryFactoryTemplate
+from dataclasses import asdict, is_dataclass
+from threading import Lock
+from typing import Any, NamedTuple, Type
+import json
+import numpy as np
+import numpy.typing as npt
+import os
+
+
+SCHEMA_VERSION = 2  # 2: numeric str fields stored as their strings, not as floats
+MANIFEST_FILE = "manifest.json"
+PLAYER_ID_FILE = "__player_id.npy"  # owner of each row of the per-player entities
+
+
+class SnapshotEntity(NamedTuple):
+    model_cls: Type[Model]
+    per_player: bool
+
+
+ENTITIES: dict[str, SnapshotEntity] = {
+    "chips": SnapshotEntity(ChipModel, False),
+    "players": SnapshotEntity(PlayerModel, False),
+    "events": SnapshotEntity(EventModel, False),
+    "fixtures": SnapshotEntity(FixtureModel, False),
+    "teams": SnapshotEntity(TeamModel, False),
+    "positions": SnapshotEntity(PositionModel, False),
+    "game_settings": SnapshotEntity(GameSettingsModel, False),
+    "labels": SnapshotEntity(LabelModel, False),
+    "player_summary": SnapshotEntity(PlayerSummaryModel, True),
+    "player_history": SnapshotEntity(PlayerHistoryModel, True),
+}
+
+
+def save_snapshot(factory: RepositoryFactoryTemplate, path: str, include_players: bool = True) -> None:
+    """Writes every entity `factory` can provide to `path` as columnar files.
+
+    Each entity gets a directory with one `.npy` file per field, laid out as a
+    `ColumnStore`: numbers and bools as typed arrays with a missing value mask,
+    strings dictionary encoded, and lists as JSON. `manifest.json` records the schema
+    version and is written last. Entities the factory doesn't implement are skipped.
+
+    Parameters
+    ----------
+    factory : RepositoryFactoryTemplate
+        Factory to read every entity from.
+    path : str
+        Directory to write to, created if needed.
+    include_players : bool, optional
+        Also write every player's summaries and history, by default True. With the
+        API this is two requests per player, see `fetch_all_player_summaries()`.
+    """
+    os.makedirs(path, exist_ok=True)
+    manifest: dict[str, Any] = {"schema_version": SCHEMA_VERSION, "entities": {}}
+
+    players = factory.players().get_all()
+    for name, entity in ENTITIES.items():
+        if entity.per_player and not include_players:
+            continue
+
+        try:
+            models, player_ids = _read_entity(factory, name, entity, players)
+        except NotImplementedError:
+            continue
+
+        directory = os.path.join(path, name)
+        _write_store(directory, ColumnStore.from_models(entity.model_cls, models))
+        if entity.per_player:
+            np.save(os.path.join(directory, PLAYER_ID_FILE), np.array(player_ids, dtype=np.int64))
+
+        manifest["entities"][name] = {"model": entity.model_cls.__name__, "rows": len(models)}
+
+    with open(os.path.join(path, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def load_snapshot(path: str) -> "SnapshotRepositoryFactory":
+    """Opens a snapshot written by `save_snapshot()`. Entities are read when first used."""
+    return SnapshotRepositoryFactory(path)
+
+
+class SnapshotRepositoryFactory(RepositoryFactoryTemplate):
+    """Repositories over a snapshot written by `save_snapshot()`.
+
+    Column files are memory-mapped the first time an entity is asked for and models
+    are built from them when a repository is read. Entities not in the snapshot
+    raise `NotImplementedError`, like factories not supporting them.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(os.path.join(path, MANIFEST_FILE), "r") as f:
+            manifest: dict[str, Any] = json.load(f)
+
+        if manifest.get("schema_version") != SCHEMA_VERSION:
+            raise ValueError(
+                f"Snapshot schema version {manifest.get('schema_version')} is not supported, expected {SCHEMA_VERSION}"
+            )
+
+        self.__path = path
+        self.__entities: set[str] = set(manifest["entities"])
+        self.__stores: dict[str, ColumnStore[Any]] = {}
+        self.__rows_by_player: dict[str, dict[int, npt.NDArray[np.int64]]] = {}
+        self.__lock = Lock()
+        self.__identity_map = IdentityMap()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Shared by every repository of the factory, so each entity is one instance."""
+        return self.__identity_map
+
+    def chips(self) -> RepoTypes.ChipRepo:
+        return RepoTypes.ChipRepo(ObjTypes.Chip, ColumnStoreDataSource(self.__store("chips")), identity_map=self.__identity_map)
+
+    def players(self) -> RepoTypes.PlayerRepo:
+        return RepoTypes.PlayerRepo(ObjTypes.Player, ColumnStoreDataSource(self.__store("players")), identity_map=self.__identity_map)
+
+    def events(self) -> RepoTypes.EventRepo:
+        return RepoTypes.EventRepo(ObjTypes.Event, ColumnStoreDataSource(self.__store("events")), identity_map=self.__identity_map)
+
+    def player_summary(self, player: ObjTypes.Player) -> RepoTypes.PlayerSummaryRepo:
+        return RepoTypes.PlayerSummaryRepo(
+            ObjTypes.PlayerSummary,
+            ColumnStoreDataSource(self.__store("player_summary"), self.__player_rows("player_summary", player.id)),
+            identity_map=self.__identity_map
+        )
+
+    def player_history(self, player: ObjTypes.Player) -> RepoTypes.PlayerHistoryRepo:
+        return RepoTypes.PlayerHistoryRepo(
+            ObjTypes.PlayerHistory,
+            ColumnStoreDataSource(self.__store("player_history"), self.__player_rows("player_history", player.id)),
+            identity_map=self.__identity_map
+        )
+
+    def fixtures(self) -> RepoTypes.FixtureRepo:
+        return RepoTypes.FixtureRepo(ObjTypes.Fixture, ColumnStoreDataSource(self.__store("fixtures")), identity_map=self.__identity_map)
+
+    def teams(self) -> RepoTypes.TeamRepo:
+        return RepoTypes.TeamRepo(ObjTypes.Team, ColumnStoreDataSource(self.__store("teams")), identity_map=self.__identity_map)
+
+    def positions(self) -> RepoTypes.PositionRepo:
+        return RepoTypes.PositionRepo(ObjTypes.Position, ColumnStoreDataSource(self.__store("positions")), identity_map=self.__identity_map)
+
+    def game_settings(self) -> RepoTypes.GameSettingsRepo:
+        return RepoTypes.GameSettingsRepo(ObjTypes.GameSettings, ColumnStoreDataSource(self.__store("game_settings")), identity_map=self.__identity_map)
+
+    def labels(self) -> RepoTypes.LabelRepo:
+        return RepoTypes.LabelRepo(ObjTypes.Label, ColumnStoreDataSource(self.__store("labels")), identity_map=self.__identity_map)
+
+    def __store(self, name: str) -> ColumnStore[Any]:
+        if name not in self.__entities:
+            raise NotImplementedError(f"{name} is not in the snapshot at {self.__path}")
+
+        with self.__lock:
+            if name not in self.__stores:
+                self.__stores[name] = _read_store(os.path.join(self.__path, name), ENTITIES[name].model_cls)
+
+            return self.__stores[name]
+
+    def __player_rows(self, name: str, player_id: int) -> npt.NDArray[np.int64]:
+        self.__store(name)
+
+        with self.__lock:
+            if name not in self.__rows_by_player:
+                player_ids = np.load(os.path.join(self.__path, name, PLAYER_ID_FILE), mmap_mode="r")
+                self.__rows_by_player[name] = _group_rows(player_ids)
+
+            return self.__rows_by_player[name].get(player_id, np.empty(0, dtype=np.int64))
+
+
+def _read_entity(
+    factory: RepositoryFactoryTemplate,
+    name: str,
+    entity: SnapshotEntity,
+    players: list[ObjTypes.Player]
+) -> tuple[list[Any], list[int]]:
+    if not entity.per_player:
+        return [item.value for item in getattr(factory, name)().get_all()], []
+
+    models: list[Any] = []
+    player_ids: list[int] = []
+    for player in players:
+        rows = [item.value for item in getattr(factory, name)(player).get_all()]
+        models.extend(rows)
+        player_ids.extend([player.id] * len(rows))
+
+    return models, player_ids
+
+
+def _group_rows(player_ids: npt.NDArray[np.int64]) -> dict[int, npt.NDArray[np.int64]]:
+    """Row indexes of each player id, in file order."""
+    order = np.argsort(player_ids, kind="stable")
+    ids, starts = np.unique(player_ids[order], return_index=True)
+
+    return {int(player_id): rows for player_id, rows in zip(ids, np.split(order, starts[1:]))}
+
+
+def _write_store(directory: str, store: ColumnStore[Any]) -> None:
+    os.makedirs(directory, exist_ok=True)
+
+    for spec in model_schema(store.model_cls):
+        stem = os.path.join(directory, spec.name)
+        column = store.column(spec.name)
+
+        if spec.kind == FieldKind.OTHER:
+            with open(stem + ".json", "w") as f:
+                json.dump(column.tolist(), f, default=_to_json)
+            continue
+
+        np.save(stem + ".npy", column)
+
+        mask = store.mask(spec.name)
+        if mask is not None:
+            np.save(stem + ".mask.npy", mask)
+
+        categories = store.categories(spec.name)
+        if categories is not None:
+            with open(stem + ".categories.json", "w") as f:
+                json.dump(categories, f)
+
+
+def _read_store(directory: str, model_cls: Type[Model]) -> ColumnStore[Any]:
+    values: dict[str, npt.NDArray[Any]] = {}
+    masks: dict[str, npt.NDArray[np.bool_]] = {}
+    categories: dict[str, list[str]] = {}
+
+    for spec in model_schema(model_cls):
+        stem = os.path.join(directory, spec.name)
+
+        if spec.kind == FieldKind.OTHER:
+            with open(stem + ".json", "r") as f:
+                items = json.load(f)
+            values[spec.name] = np.empty(len(items), dtype=object)
+            values[spec.name][:] = items
+            continue
+
+        values[spec.name] = np.load(stem + ".npy", mmap_mode="r")
+
+        if os.path.exists(stem + ".mask.npy"):
+            masks[spec.name] = np.load(stem + ".mask.npy", mmap_mode="r")
+
+        if os.path.exists(stem + ".categories.json"):
+            with open(stem + ".categories.json", "r") as f:
+                categories[spec.name] = json.load(f)
+
+    return ColumnStore(model_cls, values, masks, categories)
+
+
+def _to_json(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+
+    raise TypeError(f"{type(value).__name__} is not JSON serialisable")
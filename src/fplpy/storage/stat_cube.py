@@ -0,0 +1,215 @@
+from __future__ import annotations
+from ..objects._element.schema import FieldKind, model_schema
+from ..objects._element.source import SUPPORTED_SEASONS
+from ..objects.player_summary.model import PlayerSummaryModel
+from ..objects.summary import ObjTypes
+from ..repository_factory.presets import GitHubRepositoryFactory
+from ..repository_factory.template import RepositoryFactoryTemplate
+from typing import Any, Iterable, Mapping, Optional, Sequence
+import json
+import numpy as np
+import numpy.typing as npt
+
+
+N_GAMEWEEKS = 38
+# Fields identifying a summary rather than measuring anything
+ID_FIELDS = ("element", "fixture", "opponent_team", "round")
+# Stats describing the player at a point in time, kept from the last fixture of a gameweek rather than summed
+LEVEL_STATS = ("value", "selected", "transfers_balance", "transfers_in", "transfers_out")
+DEFAULT_STATS = tuple(
+    spec.name for spec in model_schema(PlayerSummaryModel)
+    if spec.name not in ID_FIELDS
+    and (spec.kind in (FieldKind.INT, FieldKind.FLOAT, FieldKind.BOOL) or spec.numeric_str)
+)
+
+
+def index_path(path: str) -> str:
+    return path + ".index.json"
+
+
+class StatCube:
+    """Read-only `seasons x players x gameweeks x stats` float32 array of gameweek stats.
+
+    Players are keyed by `code`, which is stable across seasons. Gameweeks a player
+    had no fixture in are NaN, and a gameweek with two fixtures holds the sum of
+    both, except for `LEVEL_STATS` which keep the last fixture's value.
+
+    `open()` memory-maps the file read-only, so processes opening the same cube
+    share its pages through the OS page cache.
+    """
+    __values: npt.NDArray[np.float32]
+
+    def __init__(
+        self,
+        values: npt.NDArray[np.float32],
+        seasons: Sequence[str],
+        player_codes: Sequence[int],
+        stats: Sequence[str]
+    ) -> None:
+        if values.ndim != 4:
+            raise ValueError(f"values must have 4 dimensions (seasons, players, gameweeks, stats), obtained {values.ndim}")
+        if values.shape[:2] != (len(seasons), len(player_codes)) or values.shape[3] != len(stats):
+            raise ValueError("values must have shape (seasons, players, gameweeks, stats)")
+
+        self.__values = values
+        self.__seasons = list(seasons)
+        self.__player_codes = list(player_codes)
+        self.__stats = list(stats)
+
+        self.__season_index = {season: i for i, season in enumerate(self.__seasons)}
+        self.__player_index = {code: i for i, code in enumerate(self.__player_codes)}
+        self.__stat_index = {stat: i for i, stat in enumerate(self.__stats)}
+
+    @classmethod
+    def open(cls, path: str) -> "StatCube":
+        """Opens a cube written by `build_stat_cube()`, memory-mapped read-only."""
+        with open(index_path(path), "r") as f:
+            index: dict[str, Any] = json.load(f)
+
+        values = np.load(path, mmap_mode="r")
+
+        return cls(values, index["seasons"], index["player_codes"], index["stats"])
+
+    @property
+    def values(self) -> npt.NDArray[np.float32]:
+        return self.__values
+
+    @property
+    def seasons(self) -> list[str]:
+        return self.__seasons.copy()
+
+    @property
+    def player_codes(self) -> list[int]:
+        return self.__player_codes.copy()
+
+    @property
+    def stats(self) -> list[str]:
+        return self.__stats.copy()
+
+    def season(self, season: str) -> npt.NDArray[np.float32]:
+        """`players x gameweeks x stats` view of one season."""
+        view: npt.NDArray[np.float32] = self.__values[self.__season_index[season]]
+
+        return view
+
+    def player(self, code: int) -> npt.NDArray[np.float32]:
+        """`seasons x gameweeks x stats` view of one player."""
+        return self.__values[:, self.__player_index[code]]
+
+    def stat(self, name: str) -> npt.NDArray[np.float32]:
+        """`seasons x players x gameweeks` view of one stat."""
+        return self.__values[..., self.__stat_index[name]]
+
+    def get(self, season: str, code: int, gameweek: int, stat: str) -> float:
+        return float(self.__values[
+            self.__season_index[season], self.__player_index[code], gameweek - 1, self.__stat_index[stat]
+        ])
+
+
+def build_stat_cube(
+    path: str,
+    factories: Mapping[str, RepositoryFactoryTemplate],
+    stats: Sequence[str] = DEFAULT_STATS,
+    n_gameweeks: int = N_GAMEWEEKS
+) -> StatCube:
+    """Writes the gameweek stats of every player of every season to a `StatCube` at `path`.
+
+    The cube is written with `np.lib.format.open_memmap` and each season is filled in
+    place in the file, so only one season's summaries are held in memory at once, and `{path}.index.json` records the seasons, player
+    codes and stats along its axes.
+
+    Parameters
+    ----------
+    path : str
+        File to write, conventionally ending in `.npy`.
+    factories : Mapping[str, RepositoryFactoryTemplate]
+        Factory of each season, keyed by season name, in the order of the seasons axis.
+    stats : Sequence[str], optional
+        `PlayerSummaryModel` fields to include, by default every numeric stat.
+    n_gameweeks : int, optional
+        Length of the gameweeks axis, by default 38. Rounds outside it are skipped.
+
+    Returns
+    -------
+    StatCube
+        The cube, opened read-only.
+    """
+    seasons = list(factories)
+    players_by_season = {season: factory.players().get_all() for season, factory in factories.items()}
+    player_codes = sorted({player.code for players in players_by_season.values() for player in players})
+    player_index = {code: i for i, code in enumerate(player_codes)}
+
+    cube = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float32, shape=(len(seasons), len(player_codes), n_gameweeks, len(stats))
+    )
+    level = np.array([stat in LEVEL_STATS for stat in stats])
+
+    for s, season in enumerate(seasons):
+        factory = factories[season]
+        rows, gameweeks, values = _summary_rows(
+            ((player_index[player.code], factory.player_summary(player).get_all()) for player in players_by_season[season]),
+            stats,
+            n_gameweeks
+        )
+
+        # view of the season in the file, which open_memmap creates zeroed
+        season_values = cube[s]
+        played = np.zeros((len(player_codes), n_gameweeks), dtype=bool)
+        played[rows, gameweeks] = True
+        season_values[~played] = np.nan
+
+        np.add.at(season_values, (rows, gameweeks), np.where(level, 0.0, values))
+        season_values[rows, gameweeks, :] = np.where(level, values, season_values[rows, gameweeks, :])
+
+    cube.flush()
+    del cube
+
+    with open(index_path(path), "w") as f:
+        json.dump({"seasons": seasons, "player_codes": player_codes, "stats": list(stats)}, f)
+
+    return StatCube.open(path)
+
+
+def build_github_stat_cube(
+    path: str,
+    seasons: Iterable[str] = SUPPORTED_SEASONS,
+    stats: Sequence[str] = DEFAULT_STATS
+) -> StatCube:
+    """`build_stat_cube()` over every supported season of the vaastav repository, oldest first."""
+    ordered = sorted(seasons)
+
+    return build_stat_cube(path, {season: GitHubRepositoryFactory(season) for season in ordered}, stats)
+
+
+def _summary_rows(
+    player_summaries: Iterable[tuple[int, Sequence[ObjTypes.PlayerSummary]]],
+    stats: Sequence[str],
+    n_gameweeks: int
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+    """Player rows, gameweek columns and stat values of every summary, in summary order."""
+    rows: list[int] = []
+    gameweeks: list[int] = []
+    values: list[list[float]] = []
+
+    for row, summaries in player_summaries:
+        for summary in summaries:
+            gameweek = summary.value.round - 1
+            if not 0 <= gameweek < n_gameweeks:
+                continue
+
+            rows.append(row)
+            gameweeks.append(gameweek)
+            values.append([_to_float(getattr(summary.value, stat)) for stat in stats])
+
+    return (
+        np.array(rows, dtype=np.int64),
+        np.array(gameweeks, dtype=np.int64),
+        np.array(values, dtype=np.float64).reshape(len(values), len(stats)),
+    )
+
+
+def _to_float(value: Optional[Any]) -> float:
+    if value is None or value == "":
+        return np.nan
+
+    return float(value)
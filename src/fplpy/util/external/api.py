@@ -1,24 +1,30 @@
-from typing import Any, Literal
-from json import loads
+from typing import Any, Literal, Optional
 from functools import cache
-from .general import safe_request
+from .http_cache import fetch_content
+from .json_backend import loads_bytes
+from .transport import Transport
+
+
+def __fetch_json(url_link: str, revalidate: bool = False, transport: Optional[Transport] = None) -> Any:
+    return loads_bytes(fetch_content(url_link, revalidate, transport))
 
 
 @cache
-def __call_api(url_link: str) -> Any:
-    response = safe_request(url_link)
-    
-    if response.status_code != 200:
-        raise Exception(f"Failed to query {url_link}. Response Code: {response.status_code}")
+def __call_api(url_link: str, transport: Optional[Transport]) -> Any:
+    return __fetch_json(url_link, transport=transport)
 
-    utf8 = response.text.encode("utf8")
-    json_data = utf8.decode("unicode_escape")
 
-    return loads(json_data)
+def call_api(url_link: str, use_cache: bool = True, transport: Optional[Transport] = None) -> Any:
+    """Queries the FPL API and parses the JSON response.
 
+    Responses are cached per URL for the life of the process, pass `use_cache=False`
+    to always query the API (revalidating any on-disk cache entry). Requests go
+    through `transport`, by default the shared pooled transport.
+    """
+    if not use_cache:
+        return __fetch_json(url_link, revalidate=True, transport=transport)
 
-def call_api(url_link: str) -> Any:
-    return __call_api(url_link)
+    return __call_api(url_link, transport)
 
 
 FPL_URL_STEM = "https://fantasy.premierleague.com/api/"
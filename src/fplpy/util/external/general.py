@@ -1,14 +1,28 @@
+import logging
 import time
-import requests
+from typing import Optional, Mapping
+from .transport import Transport, TransportResponse, get_default_transport
+
+
+logger = logging.getLogger(__name__)
+
+
+def safe_request(
+    url: str,
+    retries: int = 5,
+    headers: Optional[Mapping[str, str]] = None,
+    transport: Optional[Transport] = None
+) -> TransportResponse:
+    if transport is None:
+        transport = get_default_transport()
 
-def safe_request(url: str, retries: int = 5) -> requests.Response:
     for i in range(retries):
-        response = requests.get(url)
+        response = transport.get(url, headers=headers)
         if response.status_code == 429:
             wait = int(response.headers.get("Retry-After", 2 ** i))
-            print(f"Rate limited. Waiting {wait}s...")
+            logger.warning("Rate limited by %s, waiting %ss", url, wait)
             time.sleep(wait)
         else:
             return response
 
-    raise Exception("Max retries exceeded")
\ No newline at end of file
+    raise Exception("Max retries exceeded")
@@ -1,26 +1,37 @@
-from typing import Any, Literal
+from typing import Any, Iterator, Literal, Optional
 import csv
+import io
+import os
 from functools import cache
-from .general import safe_request
+from .http_cache import fetch_content
+from .transport import Transport
 
 
 @cache
-def __github_csv_to_dict(csv_url: str) -> list[dict[Any, Any]]:
+def __github_csv_to_dict(csv_url: str, transport: Optional[Transport]) -> list[dict[Any, Any]]:
     """Fetches a CSV file from GitHub and returns it as a JSON dictionary."""
-    response = safe_request(csv_url)
+    content = fetch_content(csv_url, transport=transport)
 
-    if response.status_code != 200:
-        raise Exception(f"Failed to query {csv_url}. Response Code: {response.status_code}")
-    
-    decoded_content = response.content.decode('utf-8').splitlines()
+    decoded_content = content.decode('utf-8').splitlines()
     reader = csv.DictReader(decoded_content)
     data = [row for row in reader]
 
     return data  # Returning the JSON-like dictionary
 
 
-def github_csv_to_dict(csv_url: str) -> list[dict[Any, Any]]:
-    return __github_csv_to_dict(csv_url)
+def github_csv_to_dict(csv_url: str, transport: Optional[Transport] = None) -> list[dict[Any, Any]]:
+    return __github_csv_to_dict(csv_url, transport)
+
+
+def iter_github_csv(csv_url: str, transport: Optional[Transport] = None) -> Iterator[dict[str, str]]:
+    """Fetches a CSV file from GitHub and returns a reader yielding its rows one at a time.
+
+    The file is fetched straight away, so request errors are raised here. Rows are
+    decoded lazily from the response bytes and aren't kept by the `github_csv_to_dict` cache.
+    """
+    content = fetch_content(csv_url, transport=transport)
+
+    return csv.DictReader(io.TextIOWrapper(io.BytesIO(content), encoding="utf-8", newline=""))
 
 
 VAASTAV_URL_STEM = "https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/refs/heads/master/data/"
@@ -29,7 +40,8 @@ SUB_VAASTAV_URLS = {
     "FIXTURES": "{}/fixtures.csv",
     "PLAYERS": "{}/players_raw.csv",
     "ELEMENT-SUMMARY": "{}/players/{}/gw.csv",
-    "ELEMENT-HISTORY": "{}/players/{}/history.csv"
+    "ELEMENT-HISTORY": "{}/players/{}/history.csv",
+    "MERGED-GW": "{}/gws/merged_gw.csv",
 }
 
 
@@ -45,5 +57,13 @@ def get_element_history_url(season: str, player_name_formatted: str) -> str:
     return VAASTAV_URL_STEM + SUB_VAASTAV_URLS["ELEMENT-HISTORY"].format(season, player_name_formatted)
 
 
-def get_vaastav_url(key: Literal["TEAMS", "FIXTURES", "PLAYERS"], season: str) -> str:
+def get_vaastav_url(key: Literal["TEAMS", "FIXTURES", "PLAYERS", "MERGED-GW"], season: str) -> str:
     return VAASTAV_URL_STEM + SUB_VAASTAV_URLS[key].format(season)
+
+
+def get_vaastav_path(root: str, url: str) -> str:
+    """Path of a vaastav repository file in a local mirror at `root`, laid out as under `data/`."""
+    if not url.startswith(VAASTAV_URL_STEM):
+        raise ValueError(f"{url} is not in the vaastav repository")
+
+    return os.path.join(root, *url[len(VAASTAV_URL_STEM):].split("/"))
@@ -0,0 +1,214 @@
+from __future__ import annotations
+from .general import safe_request
+from .transport import Transport
+from dataclasses import dataclass
+from typing import Optional, Mapping
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+DEFAULT_TTL = 60 * 60
+DEFAULT_TTLS = {
+    "fantasy.premierleague.com/api/bootstrap-static/": 15 * 60,
+    "fantasy.premierleague.com/api/fixtures/": 15 * 60,
+    "fantasy.premierleague.com/api/element-summary/": 60 * 60,
+    "raw.githubusercontent.com/": 24 * 60 * 60,
+}
+
+
+class HTTPStatusError(Exception):
+    """A response other than 200, with its `status_code`, e.g. to tell a missing file (404) from a failure."""
+
+    def __init__(self, url: str, status_code: int) -> None:
+        super().__init__(f"Failed to query {url}. Response Code: {status_code}")
+        self.url = url
+        self.status_code = status_code
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    body: bytes
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class HTTPCache:
+    """On-disk cache of HTTP response bodies, keyed by URL.
+
+    Bodies are stored gzip compressed next to a small JSON file holding the
+    `ETag` and `Last-Modified` headers. Entries older than their TTL are
+    revalidated with a conditional request rather than downloaded again.
+
+    Parameters
+    ----------
+    directory : str
+        Directory holding the cache, created if missing.
+    ttls : Mapping[str, float], optional
+        Seconds an entry stays fresh, keyed by URL substring. The longest matching
+        key wins, by default `DEFAULT_TTLS`.
+    default_ttl : float, optional
+        Seconds an entry stays fresh when no key in `ttls` matches, by default `DEFAULT_TTL`.
+    offline : bool, optional
+        Only serve from the cache and never touch the network, by default False.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        offline: bool = False
+    ) -> None:
+        self.__directory = directory
+        self.__ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.__default_ttl = default_ttl
+        self.__offline = offline
+
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self.__directory
+
+    @property
+    def offline(self) -> bool:
+        return self.__offline
+
+    def ttl_for(self, url: str) -> float:
+        matches = [key for key in self.__ttls if key in url]
+        if not matches:
+            return self.__default_ttl
+
+        return self.__ttls[max(matches, key=len)]
+
+    def load(self, url: str) -> Optional[CacheEntry]:
+        body_path, meta_path = self.__paths(url)
+
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            with gzip.open(body_path, "rb") as g:
+                body = g.read()
+        except (OSError, ValueError, EOFError):  # missing or partially written entry
+            return None
+
+        return CacheEntry(
+            body=body,
+            fetched_at=meta["fetched_at"],
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def store(self, url: str, entry: CacheEntry) -> None:
+        body_path, meta_path = self.__paths(url)
+        meta = {
+            "url": url,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+
+        self.__write_atomic(body_path, gzip.compress(entry.body))
+        self.__write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def fetch(self, url: str, revalidate: bool = False, transport: Optional[Transport] = None) -> bytes:
+        """Returns the body of `url`, from the cache where possible.
+
+        With `revalidate=True` a cached entry is always revalidated, even while fresh.
+        """
+        entry = self.load(url)
+
+        if entry is not None and self.__offline:
+            return entry.body
+
+        if entry is not None and not revalidate and time.time() - entry.fetched_at < self.ttl_for(url):
+            return entry.body
+
+        if self.__offline:
+            raise Exception(f"{url} is not cached and offline mode is enabled")
+
+        headers = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        response = safe_request(url, headers=headers, transport=transport)
+
+        if response.status_code == 304 and entry is not None:
+            entry = CacheEntry(entry.body, time.time(), entry.etag, entry.last_modified)
+            self.store(url, entry)
+
+            return entry.body
+
+        if response.status_code != 200:
+            raise HTTPStatusError(url, response.status_code)
+
+        entry = CacheEntry(
+            body=response.content,
+            fetched_at=time.time(),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        self.store(url, entry)
+
+        return entry.body
+
+    def __paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        stem = os.path.join(self.__directory, key)
+
+        return stem + ".gz", stem + ".json"
+
+    def __write_atomic(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+def __cache_from_env() -> Optional[HTTPCache]:
+    directory = os.environ.get("FPLPY_CACHE_DIR")
+    if not directory:
+        return None
+
+    return HTTPCache(directory, offline=os.environ.get("FPLPY_OFFLINE", "") == "1")
+
+
+__http_cache: Optional[HTTPCache] = __cache_from_env()
+
+
+def set_http_cache(cache: Optional[HTTPCache]) -> None:
+    """Sets the on-disk cache used for every request, or disables it with None.
+
+    Defaults to a cache in `$FPLPY_CACHE_DIR` if set, offline if `$FPLPY_OFFLINE=1`.
+    """
+    global __http_cache
+    __http_cache = cache
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    return __http_cache
+
+
+def fetch_content(url: str, revalidate: bool = False, transport: Optional[Transport] = None) -> bytes:
+    """Returns the body of `url`, through the on-disk cache if one is set."""
+    cache = get_http_cache()
+    if cache is not None:
+        return cache.fetch(url, revalidate, transport)
+
+    response = safe_request(url, transport=transport)
+
+    if response.status_code != 200:
+        raise HTTPStatusError(url, response.status_code)
+
+    return response.content
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional
+import json
+
+
+JSONLoads = Callable[[bytes], Any]
+
+
+def stdlib_loads(content: bytes) -> Any:
+    """Parses UTF-8 JSON bytes with the standard library, without decoding to text first."""
+    return json.loads(content)
+
+
+def orjson_loads(content: bytes) -> Any:
+    """Parses UTF-8 JSON bytes with orjson.
+
+    Requires the optional `orjson` dependency.
+    """
+    try:
+        import orjson
+    except ImportError as e:
+        raise ImportError("orjson_loads requires orjson, install it with `pip install orjson`") from e
+
+    return orjson.loads(content)
+
+
+def _fastest_available() -> JSONLoads:
+    try:
+        import orjson
+    except ImportError:
+        return stdlib_loads
+
+    loads: JSONLoads = orjson.loads
+    return loads
+
+
+__json_backend: Optional[JSONLoads] = None
+
+
+def get_json_backend() -> JSONLoads:
+    """Function parsing API responses, orjson when it is installed, otherwise the standard library."""
+    global __json_backend
+    if __json_backend is None:
+        __json_backend = _fastest_available()
+
+    return __json_backend
+
+
+def set_json_backend(loads: Optional[JSONLoads]) -> None:
+    """Sets the function parsing API responses from bytes, None to go back to the default."""
+    global __json_backend
+    __json_backend = loads
+
+
+def loads_bytes(content: bytes) -> Any:
+    """Parses a JSON response body straight from its bytes with the current backend."""
+    return get_json_backend()(content)
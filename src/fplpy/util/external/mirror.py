@@ -0,0 +1,145 @@
+from __future__ import annotations
+from ..local import read_csv
+from .github import format_player_name, get_element_history_url, get_element_summary_url, get_vaastav_path, \
+    get_vaastav_url
+from .http_cache import HTTPStatusError, fetch_content
+from .rate_limit import RateLimiter
+from .transport import Transport
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+import os
+import tempfile
+
+
+def season_file_urls(season: str) -> list[str]:
+    """Season-wide vaastav files, needed before the per-player files can be listed."""
+    return [get_vaastav_url(key, season) for key in ("TEAMS", "FIXTURES", "PLAYERS")]
+
+
+def optional_season_file_urls(season: str) -> list[str]:
+    """Season-wide vaastav files some seasons lack, which the local data sources can do without."""
+    return [get_vaastav_url("MERGED-GW", season)]
+
+
+def player_file_urls(season: str, player_names: list[str]) -> list[str]:
+    """`gw.csv` and `history.csv` of each player, by `format_player_name()` folder name."""
+    return [
+        url
+        for name in player_names
+        for url in (get_element_summary_url(season, name), get_element_history_url(season, name))
+    ]
+
+
+def sync_season(
+    season: str,
+    dest_dir: str,
+    concurrency: int = 8,
+    rate_limiter: Optional[RateLimiter] = None,
+    transport: Optional[Transport] = None,
+    overwrite: bool = False
+) -> list[str]:
+    """Downloads a season of the vaastav repository to `dest_dir`, for the local data sources.
+
+    Files keep their layout under `data/`, e.g. `dest_dir/2024-25/players/{name}/gw.csv`.
+    Season-wide files are fetched first, then every player's files concurrently. Players
+    without a file, like new players without a `history.csv`, are skipped, as is
+    `merged_gw.csv` for seasons without it: only a 404 counts as a missing file.
+
+    Parameters
+    ----------
+    season : str
+        Season to download, e.g. "2024-25".
+    dest_dir : str
+        Root of the mirror, shared by every season.
+    concurrency : int, optional
+        Number of downloads in flight at once, by default 8.
+    rate_limiter : RateLimiter, optional
+        Limiter shared by every request, by default none.
+    transport : Transport, optional
+        Transport for the requests, by default the shared pooled transport.
+    overwrite : bool, optional
+        Download files already in the mirror again, by default False, so an interrupted
+        sync can be resumed.
+
+    Returns
+    -------
+    list[str]
+        Paths of the files in the mirror, downloaded now or before.
+
+    Raises
+    ------
+    Exception
+        If a season-wide file is missing, or any download failed other than with a 404,
+        e.g. a timeout or a 5xx response. Raised once every other download is done, so
+        syncing again only fetches the files still missing.
+    """
+    def download(url: str) -> Optional[str]:
+        path = get_vaastav_path(dest_dir, url)
+        if not overwrite and os.path.exists(path):
+            return path
+
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        try:
+            content = fetch_content(url, transport=transport)
+        except HTTPStatusError as e:
+            if e.status_code == 404:
+                return None
+            raise
+
+        _write_atomic(path, content)
+        return path
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        season_urls = season_file_urls(season)
+        season_paths = _download_all(executor, download, season_urls)
+        missing = [url for url, path in zip(season_urls, season_paths) if path is None]
+        if missing:
+            raise Exception(f"Failed to download the {season} season files, not found: {missing}")
+
+        players_path = get_vaastav_path(dest_dir, get_vaastav_url("PLAYERS", season))
+        player_names = [
+            format_player_name(row["first_name"], row["second_name"], int(row["id"]))
+            for row in read_csv(players_path)
+        ]
+        other_urls = optional_season_file_urls(season) + player_file_urls(season, player_names)
+        player_paths = _download_all(executor, download, other_urls)
+
+    return [path for path in season_paths + player_paths if path is not None]
+
+
+def _download_all(
+    executor: ThreadPoolExecutor,
+    download: Callable[[str], Optional[str]],
+    urls: list[str]
+) -> list[Optional[str]]:
+    """Runs `download` on every url, raising after they have all finished if any failed."""
+    futures = [executor.submit(download, url) for url in urls]
+
+    paths: list[Optional[str]] = []
+    errors: list[Exception] = []
+    for future in futures:
+        try:
+            paths.append(future.result())
+        except Exception as e:
+            errors.append(e)
+
+    if errors:
+        raise Exception(f"Failed to download {len(errors)} of {len(urls)} files, first error: {errors[0]}") from errors[0]
+
+    return paths
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
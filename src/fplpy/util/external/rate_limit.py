@@ -0,0 +1,30 @@
+from threading import Lock
+import time
+
+
+class RateLimiter:
+    """Spaces out calls to `acquire()` so at most `rate` happen per second, across threads.
+
+    Parameters
+    ----------
+    rate : float
+        Maximum calls per second.
+    """
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.__interval = 1 / rate
+        self.__next_slot = time.monotonic()
+        self.__lock = Lock()
+
+    def acquire(self) -> None:
+        """Blocks until the caller may make its call."""
+        with self.__lock:
+            now = time.monotonic()
+            slot = max(now, self.__next_slot)
+            self.__next_slot = slot + self.__interval
+
+        if slot > now:
+            time.sleep(slot - now)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Optional
+from urllib.parse import urlsplit
+import os
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class TransportResponse:
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
+class Transport(ABC):
+    """Performs GET requests for `safe_request`, so the HTTP client can be swapped out."""
+
+    @abstractmethod
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> TransportResponse: ...
+
+
+class RequestsTransport(Transport):
+    """Transport using one pooled `requests.Session`, so connections are kept alive between requests.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        Connections kept open per host, by default 16.
+    connect_timeout : float, optional
+        Seconds to wait for a connection, by default 5.
+    read_timeout : float, optional
+        Seconds to wait between bytes of the response, by default 30.
+    accept_encoding : str, optional
+        Value of the `Accept-Encoding` header, by default "gzip, deflate".
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 16,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        accept_encoding: str = "gzip, deflate"
+    ) -> None:
+        self.__session = requests.Session()
+        self.__session.headers["Accept-Encoding"] = accept_encoding
+        self.__timeout = (connect_timeout, read_timeout)
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.__session.mount("https://", adapter)
+        self.__session.mount("http://", adapter)
+
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> TransportResponse:
+        response = self.__session.get(url, headers=headers, timeout=self.__timeout)
+
+        return TransportResponse(response.status_code, response.content, response.headers)
+
+    def close(self) -> None:
+        self.__session.close()
+
+
+class HTTPXTransport(Transport):
+    """Transport using a pooled `httpx.Client` with HTTP/2 enabled.
+
+    Requires the optional `httpx[http2]` dependency.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 16,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        accept_encoding: str = "gzip, deflate"
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("HTTPXTransport requires httpx, install it with `pip install httpx[http2]`") from e
+
+        self.__client: Any = httpx.Client(
+            http2=True,
+            headers={"Accept-Encoding": accept_encoding},
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> TransportResponse:
+        response = self.__client.get(url, headers=headers)
+
+        return TransportResponse(response.status_code, response.content, response.headers)
+
+    def close(self) -> None:
+        self.__client.close()
+
+
+def mirror_path(url: str) -> str:
+    """Relative path of `url` in a mirror, e.g. 'host/api/fixtures/' -> 'host/api/fixtures/index'."""
+    parts = urlsplit(url)
+    path = parts.path if not parts.path.endswith("/") else parts.path + "index"
+
+    return parts.netloc + path
+
+
+class LocalFileTransport(Transport):
+    """Transport serving responses from files on disk, answering 404 for missing files.
+
+    Parameters
+    ----------
+    root : str
+        Directory holding the files.
+    path_fn : Callable[[str], str], optional
+        Maps a URL to a path relative to `root`, by default `mirror_path`.
+    """
+
+    def __init__(self, root: str, path_fn: Callable[[str], str] = mirror_path) -> None:
+        self.__root = root
+        self.__path_fn = path_fn
+
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> TransportResponse:
+        path = os.path.join(self.__root, self.__path_fn(url))
+
+        try:
+            with open(path, "rb") as f:
+                return TransportResponse(200, f.read())
+        except FileNotFoundError:
+            return TransportResponse(404, b"")
+
+
+__default_transport: Optional[Transport] = None
+
+
+def get_default_transport() -> Transport:
+    """Transport used when none is passed, a `RequestsTransport` unless changed."""
+    global __default_transport
+    if __default_transport is None:
+        __default_transport = RequestsTransport()
+
+    return __default_transport
+
+
+def set_default_transport(transport: Transport) -> None:
+    global __default_transport
+    __default_transport = transport
@@ -0,0 +1,12 @@
+from typing import Iterator
+import csv
+
+
+def iter_csv(path: str) -> Iterator[dict[str, str]]:
+    """Reads a CSV file with a header row one row at a time, keeping the file open until done."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def read_csv(path: str) -> list[dict[str, str]]:
+    return list(iter_csv(path))
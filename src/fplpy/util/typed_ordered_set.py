@@ -1,6 +1,6 @@
 from __future__ import annotations
 from collections.abc import MutableSequence
-from typing import Generic, Iterable, TypeVar, overload
+from typing import Any, Generic, Iterable, Iterator, Optional, TypeVar, overload
 from random import choice
 
 
@@ -8,22 +8,53 @@ E = TypeVar("E")
 
 
 class TypedOrderedSet(MutableSequence[E], Generic[E]):
+    """List of unique items of one type.
+
+    A set of the items is kept alongside the list, so membership and duplicate
+    checks are O(1). Items must be hashable.
+    """
     __data: list[E]
+    __index: set[E]
     __expected_type: type | None
 
     def __init__(self, iterable: Iterable[E]) -> None:
         self.__data = []
+        self.__index = set()
         self.__expected_type = None
 
-        for item in iterable:
-            self.append(item)
+        self.extend(iterable)
+
+    @classmethod
+    def from_trusted(cls, items: Iterable[E], expected_type: Optional[type] = None) -> TypedOrderedSet[E]:
+        """Builds a set without checking types or duplicates.
+
+        Only for items already known to be unique and of one type, such as the elements of
+        a repository or a slice of another set.
+        """
+        new = cls.__new__(cls)
+        new.__data = list(items)
+        new.__index = set(new.__data)
+        new.__expected_type = expected_type
+        if expected_type is None and new.__data:
+            new.__expected_type = type(new.__data[0])
+
+        return new
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, TypedOrderedSet):
-            return self.__data == other.to_list()
+            return self.__data == other.__data
 
         raise NotImplementedError
 
+    def __contains__(self, value: object) -> bool:
+        try:
+            return value in self.__index
+        except TypeError:  # unhashable, so can't be an item
+            return False
+
+    def __iter__(self) -> Iterator[E]:
+        return iter(self.__data)
+
     @overload
     def __getitem__(self, index: int) -> E: ...
 
@@ -32,7 +63,8 @@ class TypedOrderedSet(MutableSequence[E], Generic[E]):
 
     def __getitem__(self, index: int | slice) -> E | TypedOrderedSet[E]:
         if isinstance(index, slice):
-            return TypedOrderedSet(self.__data[index])
+            # items of a slice are already unique and of the right type
+            return TypedOrderedSet.from_trusted(self.__data[index], self.__expected_type)
 
         return self.__data[index]
 
@@ -49,10 +81,12 @@ class TypedOrderedSet(MutableSequence[E], Generic[E]):
 
             # Checks
             self._check_type(value)
-            if value in self.__data:
+            if value in self.__index:
                 raise ValueError("Duplicates not allowed")
 
+            self.__index.discard(self.__data[index])
             self.__data[index] = value
+            self.__index.add(value)
 
         elif isinstance(index, slice):
             if not isinstance(value, Iterable):  # Ensure iterable for slices
@@ -62,13 +96,17 @@ class TypedOrderedSet(MutableSequence[E], Generic[E]):
             for v in values:
                 self._check_type(v)
 
-            if any(v in self.__data for v in values):  # Prevent duplicates
+            new = set(values)
+            if len(new) != len(values) or not self.__index.isdisjoint(new):  # Prevent duplicates
                 raise ValueError("Duplicates not allowed in slice assignment")
 
-            if len(values) != len(self.__data[index]):  # Enforce length match
+            replaced = self.__data[index]
+            if len(values) != len(replaced):  # Enforce length match
                 raise ValueError("Slice assignment length mismatch")
 
             self.__data[index] = values  # Assign sliced values correctly
+            self.__index.difference_update(replaced)
+            self.__index |= new
 
     @overload
     def __delitem__(self, index: int) -> None: ...
@@ -77,6 +115,11 @@ class TypedOrderedSet(MutableSequence[E], Generic[E]):
     def __delitem__(self, index: slice) -> None: ...
 
     def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            self.__index.difference_update(self.__data[index])
+        else:
+            self.__index.discard(self.__data[index])
+
         del self.__data[index]
 
     def __len__(self) -> int:
@@ -84,13 +127,44 @@ class TypedOrderedSet(MutableSequence[E], Generic[E]):
 
     @property
     def is_empty(self) -> bool:
-        return self.__data == []
+        return not self.__data
 
     def insert(self, index: int, value: E) -> None:
         self._check_type(value)
-        if value in self.__data:
+        if value in self.__index:
             raise ValueError("Duplicates not allowed")
         self.__data.insert(index, value)
+        self.__index.add(value)
+
+    def extend(self, values: Iterable[E]) -> None:
+        """Appends every item of `values`, checking them all before adding any."""
+        items = list(values)
+        if not items:
+            return
+
+        expected_type = self.__expected_type if self.__expected_type is not None else type(items[0])
+        if not all(isinstance(item, expected_type) for item in items):
+            raise TypeError(f"Expected type {expected_type}")
+
+        new = set(items)
+        if len(new) != len(items) or not self.__index.isdisjoint(new):
+            raise ValueError("Duplicates not allowed")
+
+        self.__expected_type = expected_type
+        self.__data.extend(items)
+        self.__index |= new
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        if value not in self:
+            raise ValueError(f"{value!r} is not in the set")
+
+        return self.__data.index(value, start, len(self.__data) if stop is None else stop)
+
+    def count(self, value: Any) -> int:
+        return 1 if value in self else 0
+
+    def reverse(self) -> None:
+        self.__data.reverse()
 
     def _check_type(self, value: E) -> None:
         if self.__expected_type is None:
@@ -101,6 +175,7 @@ class TypedOrderedSet(MutableSequence[E], Generic[E]):
             raise TypeError(f"Expected type {self.__expected_type}")
 
     def to_list(self) -> list[E]:
+        """Copy of the items. Iterate over the set instead to avoid the copy."""
         return self.__data.copy()
 
     def get_random(self) -> E:
@@ -0,0 +1,89 @@
+from dataclasses import replace
+from tests.objects.example_data import team_model, fixture_model, event_model, position_model
+from tests.util.util import InMemoryFactory, make_model
+from fplpy.enrichment.fixture import FixtureEnricher, FixtureEnrichmentOutput
+from fplpy.enrichment.player import PlayerEnricher
+from fplpy.enrichment.player_summary import PlayerSummaryEnricher
+from fplpy.objects.player.model import PlayerModel
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.objects.summary import ObjTypes
+from typing import Iterable
+import pytest
+
+
+def test_fixture_enrich_many() -> None:
+    factory = InMemoryFactory(
+        teams=[replace(team_model(), id=i, code=100 + i, name=f"Team {i}") for i in range(1, 21)],
+        events=[replace(event_model(), id=i, name=f"Gameweek {i}") for i in range(1, 39)],
+    )
+    fixtures = [
+        ObjTypes.Fixture(replace(fixture_model(), id=i, event=i, team_h=i, team_a=i + 1))
+        for i in range(1, 11)
+    ]
+
+    res = FixtureEnricher(factory).enrich_many(fixtures)
+
+    assert factory.calls == ["teams", "events"]
+    assert [(str(x["team_h"]), str(x["team_a"]), str(x["event"])) for x in res[:2]] == [
+        ("Team 1", "Team 2", "Gameweek 1"),
+        ("Team 2", "Team 3", "Gameweek 2"),
+    ]
+    assert FixtureEnricher(factory).enrich(fixtures[0]) == res[0]
+
+
+def test_player_enrich_many() -> None:
+    factory = InMemoryFactory(
+        teams=[replace(team_model(), id=i, code=100 + i, name=f"Team {i}") for i in range(1, 4)],
+        positions=[replace(position_model(), id=i, singular_name_short=f"POS{i}") for i in range(1, 5)],
+    )
+    players = [
+        ObjTypes.Player(make_model(PlayerModel, id=i, team=i % 3 + 1, team_code=100 + i % 3 + 1, element_type=i % 4 + 1))
+        for i in range(1, 13)
+    ]
+
+    res = PlayerEnricher(factory).enrich_many(players)
+
+    assert factory.calls == ["teams", "positions"]
+    assert [(x["team"].id, x["position"].id) for x in res[:3]] == [(2, 2), (3, 3), (1, 4)]
+    assert res == [PlayerEnricher(factory).enrich(player) for player in players]
+
+
+def test_player_summary_enrich_many_dedupes_fixtures(monkeypatch: pytest.MonkeyPatch) -> None:
+    factory = InMemoryFactory(
+        teams=[replace(team_model(), id=i, code=100 + i, name=f"Team {i}") for i in range(1, 5)],
+        events=[replace(event_model(), id=i, name=f"Gameweek {i}") for i in range(1, 3)],
+        fixtures=[
+            replace(fixture_model(), id=1, event=1, team_h=1, team_a=2),
+            replace(fixture_model(), id=2, event=1, team_h=3, team_a=4),
+            replace(fixture_model(), id=3, event=2, team_h=2, team_a=1),
+        ],
+    )
+    # many players' summaries share each fixture
+    summaries = [
+        ObjTypes.PlayerSummary(make_model(PlayerSummaryModel, element=element, fixture=fixture))
+        for fixture in (1, 2, 3) for element in range(1, 6)
+    ]
+    expected = [PlayerSummaryEnricher(factory).enrich(summary) for summary in summaries]
+
+    batches: list[int] = []
+    enrich_fixtures = FixtureEnricher.enrich_many
+
+    def counting_enrich_many(self: FixtureEnricher, objs: Iterable[ObjTypes.Fixture]) -> list[FixtureEnrichmentOutput]:
+        objs = list(objs)
+        batches.append(len(objs))
+        return enrich_fixtures(self, objs)
+
+    monkeypatch.setattr(FixtureEnricher, "enrich_many", counting_enrich_many)
+    res = PlayerSummaryEnricher(factory).enrich_many(summaries)
+
+    assert batches == [3]
+    assert res == expected
+    assert [(x["fixture"].id, x["event"].id) for x in res[::5]] == [(1, 1), (2, 1), (3, 2)]
+
+
+def test_player_summary_enrich_many_missing_fixture() -> None:
+    factory = InMemoryFactory(fixtures=[replace(fixture_model(), id=1)])
+    summary = ObjTypes.PlayerSummary(make_model(PlayerSummaryModel, element=1, fixture=2))
+
+    with pytest.raises(Exception, match="fixture returned None"):
+        PlayerSummaryEnricher(factory).enrich_many([summary])
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from tests.util.util import InMemoryFactory, make_model
+from fplpy.enrichment.fixture_matrix import NO_OPPONENT, FixtureMatrix
+from fplpy.objects.event.model import EventModel
+from fplpy.objects.fixture.model import FixtureModel
+from fplpy.objects.player.model import PlayerModel
+from fplpy.objects.team.model import TeamModel
+
+
+@pytest.fixture
+def factory() -> InMemoryFactory:
+    players = [
+        make_model(PlayerModel, id=1, code=101, team=3),
+        make_model(PlayerModel, id=2, code=102, team=1),
+    ]
+    events = [make_model(EventModel, id=i, name=f"Gameweek {i}") for i in range(1, 5)]
+    teams = [make_model(TeamModel, id=i, code=i) for i in (1, 2, 3)]
+    fixtures = [
+        make_model(FixtureModel, id=11, event=1, team_h=1, team_a=2, team_h_difficulty=2, team_a_difficulty=4),
+        make_model(FixtureModel, id=12, event=2, team_h=3, team_a=1, team_h_difficulty=3, team_a_difficulty=3),
+        make_model(FixtureModel, id=13, event=2, team_h=2, team_a=3, team_h_difficulty=2, team_a_difficulty=5),
+        make_model(FixtureModel, id=14, event=3, team_h=1, team_a=3, team_h_difficulty=4, team_a_difficulty=2),
+        make_model(FixtureModel, id=15, event=None, team_h=2, team_a=1),  # postponed
+    ]
+
+    return InMemoryFactory(players=players, teams=teams, events=events, fixtures=fixtures)
+
+
+def test_from_repo_factory(factory: InMemoryFactory) -> None:
+    matrix = FixtureMatrix.from_repo_factory(factory)
+
+    assert matrix.counts.tolist() == [[1, 1, 1, 0], [1, 1, 0, 0], [0, 2, 1, 0]]
+    assert matrix.difficulty.tolist() == [[2, 3, 4, 0], [4, 2, 0, 0], [0, 8, 2, 0]]
+    assert matrix.home_counts.tolist() == [[1, 0, 1, 0], [0, 1, 0, 0], [0, 1, 0, 0]]
+    assert matrix.away_counts[2, 1] == 1
+    assert matrix.opponents[2, 1].tolist() == [1, 2]
+    assert matrix.opponents[0, 0].tolist() == [2, NO_OPPONENT]
+    assert matrix.doubles[2, 1] and matrix.blanks[2, 0]
+
+
+def test_next_difficulty(factory: InMemoryFactory) -> None:
+    matrix = FixtureMatrix.from_repo_factory(factory)
+
+    assert matrix.next_difficulty(2, 2).tolist() == [7, 2, 10]
+    assert matrix.next_counts(2, 10).tolist() == [2, 1, 3]  # stops at the last event
+    np.testing.assert_allclose(matrix.next_mean_difficulty(3, 2), [4.0, np.nan, 2.0])
+
+
+def test_for_players(factory: InMemoryFactory) -> None:
+    matrix = FixtureMatrix.from_repo_factory(factory)
+    players = factory.players().get_all()
+
+    assert matrix.for_players(players, matrix.next_difficulty(1, 3)).tolist() == [10, 9]
+    with pytest.raises(KeyError):
+        matrix.team_rows([1, 20])
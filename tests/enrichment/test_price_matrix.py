@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from tests.util.util import InMemoryFactory, make_model
+from fplpy.enrichment.player import PlayerCostTracker
+from fplpy.enrichment.price_matrix import PriceMatrix, forward_fill
+from fplpy.objects.event.model import EventModel
+from fplpy.objects.fixture.model import FixtureModel
+from fplpy.objects.player.model import PlayerModel
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.objects.summary import ObjTypes
+from fplpy.objects.team.model import TeamModel
+
+
+def test_forward_fill() -> None:
+    values = np.array([[0, 50, 0, 52], [0, 0, 0, 0]])
+    known = np.array([[False, True, False, True], [False, False, False, False]])
+
+    assert forward_fill(values, known, -1).tolist() == [[-1, 50, 50, 52], [-1, -1, -1, -1]]
+
+
+@pytest.fixture
+def factory() -> InMemoryFactory:
+    players = [
+        make_model(PlayerModel, id=1, code=101, team=1, element_type=3),
+        make_model(PlayerModel, id=2, code=102, team=2, element_type=4),
+    ]
+    events = [make_model(EventModel, id=i, name=f"Gameweek {i}") for i in range(1, 5)]
+    teams = [make_model(TeamModel, id=i, code=i) for i in (1, 2)]
+    fixtures = [make_model(FixtureModel, id=10 + i, event=i, team_h=1, team_a=2) for i in range(1, 5)]
+    summaries = {
+        1: [make_model(PlayerSummaryModel, element=1, fixture=11, value=50),
+            make_model(PlayerSummaryModel, element=1, fixture=13, value=51)],
+        2: [make_model(PlayerSummaryModel, element=2, fixture=12, value=80)],
+    }
+
+    return InMemoryFactory(players=players, teams=teams, events=events, fixtures=fixtures, player_summaries=summaries)
+
+
+def test_from_repo_factory(factory: InMemoryFactory) -> None:
+    matrix = PriceMatrix.from_repo_factory(factory)
+
+    assert matrix.costs.tolist() == [[50, 50, 51, 51], [0, 80, 80, 80]]
+    assert matrix.cost(102, 3) == 80
+    assert matrix.for_team(2).player_codes.tolist() == [102]
+    assert matrix.for_position(3).costs.tolist() == [[50, 50, 51, 51]]
+
+
+def test_matches_cost_tracker(factory: InMemoryFactory) -> None:
+    matrix = PriceMatrix.from_repo_factory(factory)
+    events = factory.events().get_all()
+
+    for player in factory.players().get_all():
+        expected = PlayerCostTracker.from_player(player, factory)
+        actual = matrix.tracker(player, events)
+
+        assert [actual.cost_at_event_begin(e) for e in events] == [expected.cost_at_event_begin(e) for e in events]
+
+
+def test_tracker_keys_events(factory: InMemoryFactory) -> None:
+    matrix = PriceMatrix.from_repo_factory(factory)
+    player = ObjTypes.Player(make_model(PlayerModel, id=1, code=101))
+    event = ObjTypes.Event(make_model(EventModel, id=2, name="Gameweek 2"))
+
+    assert matrix.tracker(player, [event]).cost_at_event_begin(event) == 50
@@ -0,0 +1,72 @@
+from dataclasses import asdict, replace
+from typing import Any
+from .example_data import team_model, label_model, position_model, event_model
+from fplpy.objects.bootstrap import BootstrapSnapshotProvider
+from fplpy.repository_factory.presets import APIRepositoryFactory
+
+
+GAME_SETTINGS = {
+    "league_join_private_max": 30, "league_join_public_max": 5, "league_max_size_public_classic": 20,
+    "league_max_size_public_h2h": 16, "league_max_size_private_h2h": 16, "league_max_ko_rounds_private_h2h": 3,
+    "league_prefix_public": "League", "league_points_h2h_win": 3, "league_points_h2h_lose": 0,
+    "league_points_h2h_draw": 1, "league_ko_first_instead_of_random": False, "element_sell_at_purchase_price": False,
+    "underdog_differential": 40, "squad_squadplay": 11, "squad_squadsize": 15, "squad_team_limit": 3,
+    "squad_total_spend": 1000, "transfers_cap": 20, "transfers_sell_on_fee": 0.5, "max_extra_free_transfers": 4,
+    "timezone": "UTC",
+}
+
+
+class FakeBootstrap:
+    def __init__(self) -> None:
+        self.calls: list[bool] = []
+        self.team_name = "Arsenal"
+
+    def __call__(self, use_cache: bool) -> dict[str, Any]:
+        self.calls.append(use_cache)
+
+        return {
+            "elements": [],
+            "events": [asdict(event_model())],
+            "teams": [asdict(replace(team_model(), name=self.team_name))],
+            "element_types": [asdict(position_model())],
+            "chips": [],
+            "element_stats": [asdict(label_model())],
+            "game_settings": GAME_SETTINGS,
+        }
+
+
+def test_payload_parsed_once() -> None:
+    fetch = FakeBootstrap()
+    factory = APIRepositoryFactory(BootstrapSnapshotProvider(fetch))
+
+    factory.teams().get_all()
+    factory.events().get_all()
+    factory.positions().get_all()
+    factory.labels().get_all()
+
+    assert fetch.calls == [True]
+    assert factory.snapshot_provider.current().teams[0] is factory.teams().get_all()[0].value
+
+
+def test_refresh_swaps_snapshot() -> None:
+    fetch = FakeBootstrap()
+    provider = BootstrapSnapshotProvider(fetch)
+    factory = APIRepositoryFactory(provider)
+    teams = factory.teams()
+    teams.get_all()
+    old_snapshot = provider.current()
+
+    fetch.team_name = "Gunners"
+    factory.refresh()
+
+    assert fetch.calls == [True, False]
+    assert provider.current() is not old_snapshot
+    assert str(teams.get_all()[0]) == "Gunners"
+    assert [str(team) for team in teams.iter_all()] == ["Gunners"]
+
+
+def test_factories_own_their_provider() -> None:
+    first = APIRepositoryFactory()
+    second = APIRepositoryFactory()
+
+    assert first.snapshot_provider is not second.snapshot_provider
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+from dataclasses import asdict
+from ..util.util import NUMERIC_STRS, make_model
+from fplpy.objects._element.columnar import ColumnStore
+from fplpy.objects._element.decoder import model_decoder
+from fplpy.objects.event.model import EventModel
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+
+
+def csv_row(**overrides: object) -> dict[str, str]:
+    """PlayerSummaryModel row as read from a CSV, every value a string."""
+    row = {k: str(v) for k, v in asdict(make_model(PlayerSummaryModel, kickoff_time="2024-08-16T19:00:00Z")).items()}
+    row.update({k: str(v) for k, v in overrides.items()})
+    row["name"] = "ignored"
+
+    return row
+
+
+def test_from_rows_types() -> None:
+    store = ColumnStore.from_rows(PlayerSummaryModel, [
+        csv_row(element=1, influence="12.4", was_home=True),
+        csv_row(element=2, influence="0.0", was_home=False),
+    ])
+
+    assert len(store) == 2
+    assert store.column("element").dtype == np.int64
+    assert store.numbers("influence").tolist() == [12.4, 0.0]
+    assert store.categories("influence") == ["12.4", "0.0"]
+    assert store.column("was_home").tolist() == [True, False]
+    assert store.categories("kickoff_time") == ["2024-08-16T19:00:00Z"]
+    assert store.column("kickoff_time").tolist() == [0, 0]
+
+
+def test_from_rows_missing_strs_match_decoder() -> None:
+    rows = [csv_row(element=1, kickoff_time="None"), csv_row(element=2, kickoff_time="")]
+    store = ColumnStore.from_rows(PlayerSummaryModel, rows)
+
+    assert list(store.rows()) == model_decoder(PlayerSummaryModel).decode_many(rows, from_strings=True)
+    assert store.categories("kickoff_time") == [""]
+
+
+def test_row_round_trip() -> None:
+    models = [
+        make_model(PlayerSummaryModel, **{**NUMERIC_STRS, "element": i, "influence": "1.5", "kickoff_time": "x"})
+        for i in range(3)
+    ]
+    store = ColumnStore.from_models(PlayerSummaryModel, models)
+
+    assert list(store.rows()) == models
+
+
+def test_numeric_strs_round_trip() -> None:
+    models = [
+        make_model(PlayerSummaryModel, **{**NUMERIC_STRS, "element": 1, "influence": "12", "threat": "0.00", "creativity": ""}),
+        make_model(PlayerSummaryModel, **{**NUMERIC_STRS, "element": 2, "influence": "1.5", "threat": "12", "creativity": "0.00"}),
+    ]
+    store = ColumnStore.from_models(PlayerSummaryModel, models)
+
+    assert list(store.rows()) == models
+    assert store.numbers("influence").tolist() == [12.0, 1.5]
+    assert store.numbers("threat").tolist() == [0.0, 12.0]
+    assert np.isnan(store.numbers("creativity")[0])
+    assert store.to_pandas(["influence"])["influence"].dtype == np.float64
+
+
+def test_optional_fields() -> None:
+    models = [
+        make_model(EventModel, id=1, average_entry_score=50, deadline_time="a"),
+        make_model(EventModel, id=2, average_entry_score=None, deadline_time=None),
+    ]
+    store = ColumnStore.from_models(EventModel, models)
+    df = store.to_pandas(["id", "average_entry_score", "deadline_time"])
+
+    assert list(df.columns) == ["id", "average_entry_score", "deadline_time"]
+    assert str(df["average_entry_score"].dtype) == "Int64"
+    assert df["average_entry_score"].isna().tolist() == [False, True]
+    assert isinstance(df["deadline_time"].dtype, pd.CategoricalDtype)
+    assert list(store.rows()) == models
+
+
+def test_datetimes() -> None:
+    models = [
+        make_model(EventModel, id=1, deadline_time="2024-08-16T17:30:00Z"),
+        make_model(EventModel, id=2, deadline_time=None),
+        make_model(EventModel, id=3, deadline_time="2024-08-16T17:30:00Z"),
+    ]
+    store = ColumnStore.from_models(EventModel, models)
+
+    deadlines = store.datetimes("deadline_time")
+
+    assert deadlines.dtype == np.dtype("datetime64[us]")
+    assert deadlines[0] == deadlines[2] == np.datetime64("2024-08-16T17:30:00")
+    assert np.isnat(deadlines[1])
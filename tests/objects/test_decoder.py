@@ -0,0 +1,71 @@
+import pytest
+from dataclasses import asdict
+from ..util.util import make_model
+from fplpy.objects._element.decoder import model_decoder
+from fplpy.objects.event.model import EventModel
+from fplpy.objects.fixture.model import FixtureModel
+
+
+def fixture_csv_row(**overrides: str) -> dict[str, str]:
+    """FixtureModel row as read from a CSV, every value a string."""
+    row = {k: str(v) for k, v in asdict(make_model(FixtureModel)).items()}
+    row.update(overrides)
+    row["not_a_field"] = "ignored"
+
+    return row
+
+
+def test_decode_strings_converts_optional_fields() -> None:
+    fixture = model_decoder(FixtureModel).decode_strings(
+        fixture_csv_row(id="7", team_h_score="2", team_a_score="", finished="True", kickoff_time="None")
+    )
+
+    assert fixture.id == 7
+    assert fixture.team_h_score == 2
+    assert fixture.team_a_score is None
+    assert fixture.finished is True
+    assert fixture.kickoff_time is None
+    assert fixture.stats == []
+
+
+def test_decode_strings_keeps_empty_strs() -> None:
+    fixture = model_decoder(FixtureModel).decode_strings(fixture_csv_row(kickoff_time=""))
+
+    assert fixture.kickoff_time == ""
+
+
+def test_decode_strings_matches_init() -> None:
+    model = make_model(FixtureModel, id=3, team_h_score=1, event=5)
+    row = {k: str(v) for k, v in asdict(model).items()}
+    row["stats"] = "[]"
+
+    assert model_decoder(FixtureModel).decode_strings(row) == model
+
+
+def test_decode_projects_and_keeps_defaults() -> None:
+    row = asdict(make_model(EventModel, id=1, name="Gameweek 1"))
+    row["extra"] = 1
+    del row["chip_plays"]
+
+    event = model_decoder(EventModel).decode(row)
+
+    assert event == make_model(EventModel, id=1, name="Gameweek 1")
+    assert event.chip_plays == []
+
+
+def test_decode_missing_required_field() -> None:
+    row = asdict(make_model(EventModel))
+    del row["name"]
+
+    with pytest.raises(TypeError):
+        model_decoder(EventModel).decode(row)
+
+
+def test_build_trusted() -> None:
+    models = [make_model(EventModel, id=i) for i in range(3)]
+
+    assert model_decoder(EventModel).build_trusted(asdict(model) for model in models) == models
+
+
+def test_decoder_shared_per_class() -> None:
+    assert model_decoder(EventModel) is model_decoder(EventModel)
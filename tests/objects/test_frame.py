@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+from ..util.util import InMemorySource, make_model
+from fplpy.objects.summary import ObjTypes, RepoTypes
+from fplpy.objects.event.model import EventModel
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+
+
+def event_repo() -> RepoTypes.EventRepo:
+    return RepoTypes.EventRepo(ObjTypes.Event, InMemorySource([
+        make_model(EventModel, id=1, name="Gameweek 1", deadline_time="2024-08-16T17:30:00Z", highest_score=98),
+        make_model(EventModel, id=2, name="Gameweek 2", deadline_time="2024-08-24T10:00:00Z"),
+    ]))
+
+
+def test_as_df_dtypes() -> None:
+    df = event_repo().as_df()
+
+    assert df["id"].dtype == np.int64
+    assert df["highest_score"].dtype == "Int64"
+    assert df["highest_score"].isna().tolist() == [False, True]
+    assert df["finished"].dtype == bool
+    assert isinstance(df["deadline_time"].dtype, pd.DatetimeTZDtype)
+    assert str(df["deadline_time"].dtype.tz) == "UTC"
+    assert df["deadline_time"][0] == pd.Timestamp("2024-08-16T17:30:00Z")
+    assert not isinstance(df["name"].dtype, pd.CategoricalDtype)  # every name is distinct
+
+
+def test_as_df_categorical() -> None:
+    repo = RepoTypes.EventRepo(ObjTypes.Event, InMemorySource([
+        make_model(EventModel, id=i, name="Gameweek") for i in range(4)
+    ]))
+
+    assert isinstance(repo.as_df()["name"].dtype, pd.CategoricalDtype)
+
+
+def test_as_df_numeric_str() -> None:
+    repo = RepoTypes.PlayerSummaryRepo(ObjTypes.PlayerSummary, InMemorySource([
+        make_model(PlayerSummaryModel, element=1, fixture=i, influence=f"{i}.5", kickoff_time="2024-08-16T19:00:00Z")
+        for i in range(4)
+    ]))
+    df = repo.as_df()
+
+    assert df["influence"].tolist() == [0.5, 1.5, 2.5, 3.5]
+    assert df["expected_goals"].isna().all()  # "" isn't a number
+    assert isinstance(df["kickoff_time"].dtype, pd.DatetimeTZDtype)
+
+
+def test_as_df_projection() -> None:
+    df = event_repo().as_df(["name", "id"])
+
+    assert list(df.columns) == ["name", "id"]
+    assert df["id"].tolist() == [1, 2]
+
+
+def test_as_df_empty() -> None:
+    repo = RepoTypes.EventRepo(ObjTypes.Event, InMemorySource([]))
+
+    assert repo.as_df(["id"]).empty
+
+
+def test_as_df_empty_has_schema_columns() -> None:
+    repo = RepoTypes.EventRepo(ObjTypes.Event, InMemorySource([]))
+    df = repo.as_df()
+    streamed = repo.as_df(chunk_size=10)
+
+    assert list(df.columns) == list(event_repo().as_df().columns)
+    assert df["id"].dtype == np.int64
+    assert df["highest_score"].dtype == "Int64"
+    assert isinstance(df["deadline_time"].dtype, pd.DatetimeTZDtype)
+    assert list(streamed.columns) == list(df.columns)
+    assert df[["id", "name"]].empty
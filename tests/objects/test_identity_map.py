@@ -0,0 +1,53 @@
+from dataclasses import replace
+from .example_data import team_model
+from ..util.util import InMemorySource, make_model
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.objects.summary import ObjTypes, RepoTypes
+from fplpy.objects._element.identity_map import IdentityMap
+from fplpy.objects.team.object import Team
+from fplpy.objects.team.repository import TeamRepository
+
+
+def test_repositories_share_elements() -> None:
+    identity_map = IdentityMap()
+    models = [replace(team_model(), id=i, code=100 + i) for i in range(1, 4)]
+
+    first = TeamRepository(Team, InMemorySource(models), identity_map=identity_map)
+    second = TeamRepository(Team, InMemorySource(models), identity_map=identity_map)
+
+    assert first.get_by_id(2) is second.get_by_id(2)
+    assert next(second.iter_all()) is first.get_by_id(1)  # iterating the built repository
+    assert len(identity_map) == 3
+
+
+def test_streaming_and_elements_without_id_not_kept() -> None:
+    identity_map = IdentityMap()
+    teams = TeamRepository(Team, InMemorySource([replace(team_model(), id=i, code=100 + i) for i in range(1, 4)]), identity_map=identity_map)
+    summaries = RepoTypes.PlayerSummaryRepo(
+        ObjTypes.PlayerSummary,
+        InMemorySource([make_model(PlayerSummaryModel, element=1, round=gw) for gw in range(1, 39)]),
+        identity_map=identity_map
+    )
+
+    assert len(list(teams.iter_all())) == 3
+    assert sum(len(chunk) for chunk in summaries.stream(10)) == 38
+    assert len(summaries.get_all()) == 38
+    assert len(identity_map) == 0
+
+
+def test_changed_model_replaces_element() -> None:
+    identity_map = IdentityMap()
+    old = identity_map.canonical(Team(replace(team_model(), id=1, name="Old")))
+
+    new = identity_map.canonical(Team(replace(team_model(), id=1, name="New")))
+
+    assert new is not old
+    assert identity_map.canonical(Team(replace(team_model(), id=1, name="New"))) is new
+    assert len(identity_map) == 1
+
+
+def test_without_identity_map() -> None:
+    models = [team_model()]
+
+    assert TeamRepository(Team, InMemorySource(models)).get_all()[0] is not \
+        TeamRepository(Team, InMemorySource(models)).get_all()[0]
@@ -0,0 +1,133 @@
+import pandas as pd
+import pytest
+from dataclasses import replace
+from typing import Iterator
+from .example_data import team_model
+from ..util.util import InMemorySource
+from fplpy.objects.team.model import TeamModel
+from fplpy.objects.team.object import Team
+from fplpy.objects.team.repository import TeamRepository
+
+
+def make_teams(n: int) -> list[TeamModel]:
+    return [replace(team_model(), id=i, code=100 + i, name=f"Team {i}") for i in range(1, n + 1)]
+
+
+@pytest.fixture
+def source() -> InMemorySource[TeamModel]:
+    return InMemorySource(make_teams(5))
+
+
+@pytest.fixture
+def repo(source: InMemorySource[TeamModel]) -> TeamRepository[Team]:
+    return TeamRepository(Team, source)
+
+
+def test_source_read_once(repo: TeamRepository[Team], source: InMemorySource[TeamModel]) -> None:
+    repo.get_all()
+    repo.get_by_id(1)
+    repo.get_by_code(101)
+    repo.get_filtered(lambda x: x.id > 2)
+
+    assert source.calls == 1
+
+
+def test_get_by_id_and_code(repo: TeamRepository[Team]) -> None:
+    team = repo.get_by_id(3)
+
+    assert team is not None and team.value.name == "Team 3"
+    assert repo.get_by_code(103) is team
+    assert repo.get_by_id(99) is None
+    assert repo.get_by_code(99) is None
+
+
+def test_get_many(repo: TeamRepository[Team]) -> None:
+    res = repo.get_many([2, 99, 1])
+
+    assert [None if x is None else x.id for x in res] == [2, None, 1]
+    assert [x.code for x in repo.get_many_by_code([105, 104]) if x is not None] == [105, 104]
+
+
+def test_duplicate_id_raises() -> None:
+    models = make_teams(2) + [replace(team_model(), id=1, code=999)]
+    repo = TeamRepository(Team, InMemorySource(models))
+
+    with pytest.raises(ValueError):
+        repo.get_by_id(1)
+
+    assert repo.get_by_id(2) is not None
+
+
+def test_refresh(repo: TeamRepository[Team], source: InMemorySource[TeamModel]) -> None:
+    assert repo.get_by_id(6) is None
+
+    source.models = make_teams(6)
+    assert repo.get_by_id(6) is None
+
+    repo.refresh()
+    assert repo.get_by_id(6) is not None
+    assert len(repo.get_all()) == 6
+
+
+def test_where(repo: TeamRepository[Team]) -> None:
+    assert [x.id for x in repo.where(name="Team 2")] == [2]
+    assert [x.id for x in repo.where(position=2, strength=5)] == [1, 2, 3, 4, 5]
+    assert repo.where(name="Team 2", id=3) == []
+    assert [x.id for x in repo.where(id=lambda v: v % 2 == 0)] == [2, 4]
+
+
+def test_range(repo: TeamRepository[Team]) -> None:
+    assert [x.id for x in repo.range("code", 102, 104)] == [2, 3, 4]
+    assert [x.id for x in repo.range("code", low=104)] == [4, 5]
+    assert [x.id for x in repo.range("code", high=101)] == [1]
+
+
+def test_queries_follow_refresh(repo: TeamRepository[Team], source: InMemorySource[TeamModel]) -> None:
+    assert repo.where(name="Team 6") == []
+
+    source.models = make_teams(6)
+    repo.refresh()
+
+    assert [x.id for x in repo.where(name="Team 6")] == [6]
+    assert [x.id for x in repo.range("id", 6)] == [6]
+
+
+class StreamingSource(InMemorySource[TeamModel]):
+    """Source recording how many models have been read through `iter()`."""
+
+    def __init__(self, models: list[TeamModel]) -> None:
+        super().__init__(models)
+        self.read = 0
+
+    def iter(self) -> Iterator[TeamModel]:
+        for model in self.models:
+            self.read += 1
+            yield model
+
+
+def test_get_filtered_limit_stops_early() -> None:
+    source = StreamingSource(make_teams(100))
+    repo = TeamRepository(Team, source)
+
+    assert [x.id for x in repo.get_filtered(lambda x: x.id % 2 == 0, limit=3)] == [2, 4, 6]
+    assert source.read == 6
+    assert source.calls == 0
+
+
+def test_stream() -> None:
+    source = StreamingSource(make_teams(5))
+    repo = TeamRepository(Team, source)
+
+    assert [[x.id for x in chunk] for chunk in repo.stream(2)] == [[1, 2], [3, 4], [5]]
+    assert source.calls == 0
+
+    repo.refresh()
+    assert [len(chunk) for chunk in repo.stream(5)] == [5]
+    assert source.read == 5
+
+    with pytest.raises(ValueError):
+        list(repo.stream(0))
+
+
+def test_as_df_chunked(repo: TeamRepository[Team]) -> None:
+    pd.testing.assert_frame_equal(repo.as_df(chunk_size=2), repo.as_df())
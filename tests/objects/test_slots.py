@@ -0,0 +1,55 @@
+import pickle
+from datetime import datetime, timezone
+from dataclasses import asdict
+from ..util.util import make_model
+from fplpy.objects._element.decoder import model_decoder
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.objects.summary import ObjTypes
+
+
+def test_no_instance_dict() -> None:
+    summary = ObjTypes.PlayerSummary(make_model(PlayerSummaryModel, element=1))
+
+    assert not hasattr(summary, "__dict__")
+    assert not hasattr(summary.value, "__dict__")
+
+
+def test_pickle_round_trip() -> None:
+    summary = ObjTypes.PlayerSummary(make_model(PlayerSummaryModel, element=1, kickoff_time="2024-08-16T19:00:00Z"))
+
+    restored = pickle.loads(pickle.dumps(summary))
+
+    assert type(restored) is ObjTypes.PlayerSummary
+    assert restored.value == summary.value
+    assert b"kickoff_time" not in pickle.dumps(summary)  # field values only
+
+
+def test_decoded_strings_interned() -> None:
+    rows = [
+        {k: str(v) for k, v in asdict(make_model(PlayerSummaryModel, kickoff_time="".join(["2024-08-16", "T19:00:00Z"]))).items()}
+        for _ in range(2)
+    ]
+
+    first, second = model_decoder(PlayerSummaryModel).decode_many(rows, from_strings=True)
+
+    assert first.kickoff_time is second.kickoff_time
+
+
+def test_identity_key_cached() -> None:
+    summary = ObjTypes.PlayerSummary(make_model(PlayerSummaryModel, element=1, fixture=2))
+    same = ObjTypes.PlayerSummary(make_model(PlayerSummaryModel, element=1, fixture=2))
+
+    assert summary.identity_key() is summary.identity_key()
+    assert summary == same and hash(summary) == hash(same)
+    assert {summary: 1}[same] == 1
+    assert summary != ObjTypes.PlayerSummary(make_model(PlayerSummaryModel, element=1, fixture=3))
+
+    restored = pickle.loads(pickle.dumps(summary))
+    assert restored == summary and hash(restored) == hash(summary)
+
+
+def test_kickoff_time_parsed_once() -> None:
+    summary = ObjTypes.PlayerSummary(make_model(PlayerSummaryModel, kickoff_time="2024-08-16T19:00:00Z"))
+
+    assert summary.kickoff_time is summary.kickoff_time
+    assert summary.kickoff_time == datetime(2024, 8, 16, 19, tzinfo=timezone.utc)
@@ -0,0 +1,34 @@
+from ..util.util import InMemorySource, make_model
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.objects.player_summary.partition import PlayerSummaryPartition, PlayerSummaryPartitionDataSource
+from fplpy.objects.summary import ObjTypes, RepoTypes
+
+
+def test_partition_reads_source_once() -> None:
+    source = InMemorySource([
+        make_model(PlayerSummaryModel, element=element, round=gw)
+        for gw in (1, 2, 3) for element in (1, 2)
+    ])
+    partition = PlayerSummaryPartition(source)
+
+    repos = {
+        element: RepoTypes.PlayerSummaryRepo(ObjTypes.PlayerSummary, PlayerSummaryPartitionDataSource(partition, element))
+        for element in (1, 2, 3)
+    }
+
+    assert [x.value.round for x in repos[1].get_all()] == [1, 2, 3]
+    assert [x.value.element for x in repos[2].get_all()] == [2, 2, 2]
+    assert repos[3].get_all() == []
+    assert source.calls == 1
+
+
+def test_partition_refresh() -> None:
+    source = InMemorySource([make_model(PlayerSummaryModel, element=1, round=1)])
+    partition = PlayerSummaryPartition(source)
+    assert len(partition.for_element(1)) == 1
+
+    source.models.append(make_model(PlayerSummaryModel, element=1, round=2))
+    assert len(partition.for_element(1)) == 1
+
+    partition.refresh()
+    assert len(partition.for_element(1)) == 2
@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+from ..util.util import InMemorySource, make_model
+from fplpy.objects.event.model import EventModel
+from fplpy.objects.event.object import Event
+from fplpy.objects.event.repository import EventRepository
+from fplpy.objects.fixture.model import FixtureModel
+from fplpy.objects.fixture.object import Fixture
+from fplpy.objects.fixture.repository import FixtureRepository
+
+
+def utc(day: int, hour: int = 0) -> datetime:
+    return datetime(2024, 8, day, hour, tzinfo=timezone.utc)
+
+
+def event_repo() -> EventRepository[Event]:
+    # ids out of deadline order, and an event without a deadline
+    return EventRepository(Event, InMemorySource([
+        make_model(EventModel, id=1, deadline_time="2024-08-16T17:30:00Z"),
+        make_model(EventModel, id=3, deadline_time="2024-08-30T17:30:00Z"),
+        make_model(EventModel, id=2, deadline_time="2024-08-23T17:30:00Z"),
+        make_model(EventModel, id=10, deadline_time=None),
+    ]))
+
+
+def fixture_repo() -> FixtureRepository[Fixture]:
+    return FixtureRepository(Fixture, InMemorySource([
+        make_model(FixtureModel, id=1, code=1, team_h=1, team_a=2, kickoff_time="2024-08-17T14:00:00Z"),
+        make_model(FixtureModel, id=2, code=2, team_h=3, team_a=1, kickoff_time="2024-08-24T14:00:00Z"),
+        make_model(FixtureModel, id=3, code=3, team_h=2, team_a=3, kickoff_time="2024-08-18T16:30:00Z"),
+        make_model(FixtureModel, id=4, code=4, team_h=1, team_a=3, kickoff_time="2024-08-31T14:00:00Z"),
+        make_model(FixtureModel, id=5, code=5, team_h=1, team_a=2, kickoff_time=None),
+    ]))
+
+
+def test_event_at() -> None:
+    repo = event_repo()
+
+    assert repo.event_at(utc(10)) is None
+    assert repo.event_at(datetime(2024, 8, 16, 17, 30)) is repo.get_by_id(1)  # naive taken as UTC
+    assert repo.current_event(utc(25)) is repo.get_by_id(2)
+    assert repo.timeline().next_deadline_event(utc(25)) is repo.get_by_id(3)
+
+
+def test_next_and_previous_follow_deadlines() -> None:
+    repo = event_repo()
+    first, second, third, undated = (repo.get_by_id(i) for i in (1, 2, 3, 10))
+    assert first is not None and third is not None and undated is not None
+
+    assert repo.get_next_event(first) is second
+    assert repo.get_next_event(third) is undated
+    assert repo.get_previous_event(first) is None
+    assert repo.get_next_event(undated) is None
+
+
+def test_fixtures_in_window() -> None:
+    repo = fixture_repo()
+
+    assert [x.id for x in repo.fixtures_in_window(utc(17), utc(24))] == [1, 3]
+    assert [x.id for x in repo.fixtures_in_window(utc(24, 14))] == [2, 4]  # start is inclusive
+    assert [x.id for x in repo.fixtures_in_window()] == [1, 3, 2, 4]  # unscheduled left out
+
+
+def test_next_fixtures() -> None:
+    repo = fixture_repo()
+
+    assert [x.id for x in repo.next_fixtures(1, 2, now=utc(18))] == [2, 4]
+    assert [x.id for x in repo.next_fixtures(3, 5, now=utc(1))] == [3, 2, 4]
+    assert repo.next_fixtures(99, 3, now=utc(1)) == []
+
+
+def test_timeline_rebuilt_on_refresh() -> None:
+    source = InMemorySource([make_model(EventModel, id=1, deadline_time="2024-08-16T17:30:00Z")])
+    repo = EventRepository(Event, source)
+    assert repo.current_event(utc(20)) is repo.get_by_id(1)
+
+    source.models.append(make_model(EventModel, id=2, deadline_time="2024-08-19T17:30:00Z"))
+    repo.refresh()
+
+    assert repo.current_event(utc(20)) is repo.get_by_id(2)
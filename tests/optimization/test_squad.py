@@ -0,0 +1,78 @@
+import pytest
+from collections import Counter
+from dataclasses import replace
+from tests.util.util import InMemoryFactory, make_model
+from fplpy.objects.game_settings.model import GameSettingsModel
+from fplpy.objects.player.model import PlayerModel
+from fplpy.objects.position.model import PositionModel
+from fplpy.objects.summary import ObjTypes
+from fplpy.optimization.squad import SquadConstraints, optimize_squad
+
+
+POSITIONS = [
+    make_model(PositionModel, id=1, squad_select=2, squad_min_play=1, squad_max_play=1),
+    make_model(PositionModel, id=2, squad_select=5, squad_min_play=3, squad_max_play=5),
+    make_model(PositionModel, id=3, squad_select=5, squad_min_play=2, squad_max_play=5),
+    make_model(PositionModel, id=4, squad_select=3, squad_min_play=1, squad_max_play=3),
+]
+GAME_SETTINGS = make_model(
+    GameSettingsModel, squad_squadsize=15, squad_squadplay=11, squad_team_limit=3, squad_total_spend=1000
+)
+
+
+def make_players() -> list[ObjTypes.Player]:
+    # 8 players per position per team, better players cost more
+    return [
+        ObjTypes.Player(make_model(
+            PlayerModel, id=i, code=i, team=team, element_type=position,
+            now_cost=40 + 10 * rank, ep_next=float(rank + team % 3)
+        ))
+        for i, (team, position, rank) in enumerate(
+            ((team, position, rank) for team in range(1, 11) for position in range(1, 5) for rank in range(8)), start=1
+        )
+    ]
+
+
+def test_constraints_from_repo_factory() -> None:
+    factory = InMemoryFactory(positions=POSITIONS, game_settings=[GAME_SETTINGS])
+
+    constraints = SquadConstraints.from_repo_factory(factory)
+
+    assert constraints.squad_size == 15 and constraints.budget == 1000
+    assert constraints.squad_select == {1: 2, 2: 5, 3: 5, 4: 3}
+    assert constraints.min_play[2] == 3
+
+
+def test_optimize_squad() -> None:
+    players = make_players()
+    constraints = SquadConstraints.from_models(GAME_SETTINGS, POSITIONS)
+
+    selection = optimize_squad(players, "ep_next", constraints, bench_weight=0.1)
+
+    assert len(selection.squad) == 15 and len(selection.starting) == 11 and len(selection.bench) == 4
+    assert selection.cost == sum(p.value.now_cost for p in selection.squad) <= 1000
+    assert max(Counter(p.value.team for p in selection.squad).values()) <= 3
+    assert Counter(p.value.element_type for p in selection.squad) == {1: 2, 2: 5, 3: 5, 4: 3}
+    assert Counter(p.value.element_type for p in selection.starting)[1] == 1
+    assert selection.captain.value.ep_next == max(p.value.ep_next for p in selection.starting)
+
+    warm = optimize_squad(players, "ep_next", constraints, bench_weight=0.1, initial_squad=selection.squad, time_limit=10)
+    assert warm.score == pytest.approx(selection.score)
+
+
+def test_infeasible_budget() -> None:
+    constraints = SquadConstraints.from_models(GAME_SETTINGS, POSITIONS)
+    players = make_players()
+
+    with pytest.raises(ValueError):
+        optimize_squad(players, [1.0] * len(players), replace(constraints, budget=100))
+
+
+@pytest.mark.filterwarnings("error::DeprecationWarning")
+def test_default_solver_not_deprecated() -> None:
+    players = make_players()
+    constraints = SquadConstraints.from_models(GAME_SETTINGS, POSITIONS)
+
+    selection = optimize_squad(players, "ep_next", constraints, initial_squad=players[:15], time_limit=10)
+
+    assert len(selection.squad) == 15
@@ -0,0 +1,21 @@
+import json
+import os
+from fplpy.repository_factory.bulk import fetch_all_player_summaries
+from fplpy.util.external.rate_limit import RateLimiter
+from tests.util.util import CountingTransport
+
+
+def test_fetch_all_player_summaries(tmp_path) -> None:
+    for player_id in (1, 2, 3):
+        directory = os.path.join(str(tmp_path), "fantasy.premierleague.com", "api", "element-summary", str(player_id))
+        os.makedirs(directory)
+        with open(os.path.join(directory, "index"), "w") as f:
+            json.dump({"fixtures": [], "history": [], "history_past": []}, f)
+
+    transport = CountingTransport(str(tmp_path))
+    res = fetch_all_player_summaries([1, 2, 3, 2], concurrency=3, rate_limiter=RateLimiter(1000), transport=transport)
+
+    assert sorted(res) == [1, 2, 3]
+    assert len(transport.urls) == 3
+    assert res[1].summaries.get_all() == []
+    assert res[1].history.get_all() == []
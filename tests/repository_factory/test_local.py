@@ -0,0 +1,156 @@
+import csv
+import json
+import os
+import pytest
+from dataclasses import asdict
+from typing import Any, Mapping, Optional, Sequence
+from tests.util.util import NUMERIC_STRS, CountingTransport, make_model
+from fplpy.objects.fixture.model import FixtureModel
+from fplpy.objects.game_settings.model import GameSettingsModel
+from fplpy.objects.player.model import PlayerModel
+from fplpy.objects.player_history.model import PlayerHistoryModel
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.objects.position.model import PositionModel
+from fplpy.objects.team.model import TeamModel
+from fplpy.repository_factory.presets import LocalRepositoryFactory
+from fplpy.util.external.mirror import sync_season
+from fplpy.util.external.transport import TransportResponse, mirror_path
+
+
+SEASON = "2024-25"
+REMOTE = f"https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/refs/heads/master/data/{SEASON}/"
+
+
+def write_csv(root: str, relative_url: str, models: Sequence[Any]) -> None:
+    path = os.path.join(root, mirror_path(REMOTE + relative_url))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    rows = [asdict(model) for model in models]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def make_remote(root: str) -> None:
+    write_csv(root, "teams.csv", [make_model(TeamModel, id=1, code=3, name="Arsenal")])
+    write_csv(root, "fixtures.csv", [make_model(FixtureModel, id=1, code=10, team_h=1, team_a_score=None)])
+    write_csv(root, "players_raw.csv", [
+        make_model(PlayerModel, id=1, code=100, first_name="Martin", second_name="Ødegaard", team=1),
+        make_model(PlayerModel, id=2, code=200, first_name="New", second_name="Signing", team=1),
+    ])
+    for player in ("Martin_Ødegaard_1", "New_Signing_2"):
+        write_csv(root, f"players/{player}/gw.csv", [
+            make_model(PlayerSummaryModel, element=1, fixture=1, round=1, kickoff_time="2024-08-17T14:00:00Z", **NUMERIC_STRS)
+        ])
+    write_csv(root, "gws/merged_gw.csv", [
+        make_model(PlayerSummaryModel, element=element, fixture=1, round=gw, kickoff_time="2024-08-17T14:00:00Z", **NUMERIC_STRS)
+        for gw in (1, 2) for element in (1, 2)
+    ])
+    write_csv(root, "players/Martin_Ødegaard_1/history.csv", [
+        make_model(PlayerHistoryModel, season_name="2023/24", element_code=100, **NUMERIC_STRS)
+    ])
+
+
+def test_sync_season(tmp_path) -> None:
+    remote, mirror = os.path.join(tmp_path, "remote"), os.path.join(tmp_path, "mirror")
+    make_remote(remote)
+    transport = CountingTransport(remote)
+
+    paths = sync_season(SEASON, mirror, concurrency=4, transport=transport)
+
+    assert len(paths) == 7  # new signing has no history.csv
+    assert os.path.exists(os.path.join(mirror, SEASON, "players", "Martin_Ødegaard_1", "gw.csv"))
+    assert len(transport.urls) == 8
+
+    sync_season(SEASON, mirror, transport=transport)
+    assert len(transport.urls) == 9  # only the missing history.csv is asked for again
+
+
+class FailingTransport(CountingTransport):
+    """Answers 500 for URLs containing `failing`."""
+
+    def __init__(self, root: str, failing: str) -> None:
+        super().__init__(root)
+        self.failing = failing
+
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> TransportResponse:
+        if self.failing in url:
+            self.urls.append(url)
+            return TransportResponse(500, b"")
+
+        return super().get(url, headers)
+
+
+def test_sync_season_raises_on_failed_download(tmp_path) -> None:
+    remote, mirror = os.path.join(tmp_path, "remote"), os.path.join(tmp_path, "mirror")
+    make_remote(remote)
+
+    with pytest.raises(Exception, match="1 of 5 files"):
+        sync_season(SEASON, mirror, transport=FailingTransport(remote, "Martin_Ødegaard_1/gw.csv"))
+
+    # the other downloads still finished, so syncing again only fetches the failed file
+    transport = CountingTransport(remote)
+    assert len(sync_season(SEASON, mirror, transport=transport)) == 7
+    assert len(transport.urls) == 2  # the failed gw.csv and the missing history.csv
+
+
+def test_local_repository_factory(tmp_path) -> None:
+    remote, mirror = os.path.join(tmp_path, "remote"), os.path.join(tmp_path, "mirror")
+    make_remote(remote)
+    sync_season(SEASON, mirror, transport=CountingTransport(remote))
+
+    factory = LocalRepositoryFactory(mirror, SEASON)
+    team = factory.teams().get_by_id(1)
+    player = factory.players().get_by_code(100)
+    new_signing = factory.players().get_by_id(2)
+    fixture = factory.fixtures().get_by_id(1)
+
+    assert team is not None and team.value.name == "Arsenal"
+    assert player is not None and player.value.second_name == "Ødegaard"
+    assert fixture is not None and fixture.value.team_a_score is None
+    assert [x.value.round for x in factory.player_summary(player).get_all()] == [1, 2]  # from merged_gw.csv
+    assert all(getattr(x.value, name) == value for x in factory.player_summary(player).get_all() for name, value in NUMERIC_STRS.items())
+    assert [x.value.season_name for x in factory.player_history(player).get_all()] == ["2023/24"]
+    assert new_signing is not None and factory.player_history(new_signing).get_all() == []
+    assert factory.teams().get_by_id(1) is team  # shared through the factory's identity map
+
+
+def test_local_repository_factory_without_merged_gw(tmp_path) -> None:
+    remote, mirror = os.path.join(tmp_path, "remote"), os.path.join(tmp_path, "mirror")
+    make_remote(remote)
+    os.remove(os.path.join(remote, mirror_path(REMOTE + "gws/merged_gw.csv")))
+
+    paths = sync_season(SEASON, mirror, transport=CountingTransport(remote))
+    assert len(paths) == 6  # no merged_gw.csv, as in seasons without one
+
+    factory = LocalRepositoryFactory(mirror, SEASON)
+    player = factory.players().get_by_id(1)
+
+    assert player is not None
+    assert [x.value.round for x in factory.player_summary(player).get_all()] == [1]  # from gw.csv
+
+
+def test_local_repository_factory_reads_bootstrap_file(tmp_path) -> None:
+    path = os.path.join(tmp_path, "bootstrap-static.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "elements": [], "events": [], "teams": [], "chips": [], "element_stats": [],
+            "element_types": [asdict(make_model(PositionModel, id=1))],
+            "game_settings": asdict(make_model(GameSettingsModel)),
+        }, f)
+
+    factory = LocalRepositoryFactory(str(tmp_path), SEASON, bootstrap_file_path=path)
+
+    assert [x.id for x in factory.positions().get_all()] == [1]
+    assert len(factory.game_settings().get_all()) == 1
+    assert factory.chips().get_all() == []
+    assert factory.events().get_all() == []
+
+
+def test_local_repository_factory_without_bootstrap_file(tmp_path) -> None:
+    factory = LocalRepositoryFactory(str(tmp_path), SEASON)
+
+    for repo in (factory.chips, factory.events, factory.positions, factory.game_settings, factory.labels):
+        with pytest.raises(NotImplementedError):
+            repo()
@@ -0,0 +1,82 @@
+import json
+import os
+import pytest
+from dataclasses import replace
+from tests.objects.example_data import team_model, fixture_model, event_model, position_model
+from tests.util.util import NUMERIC_STRS, InMemoryFactory, make_model
+from fplpy.objects.player.model import PlayerModel
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.storage.snapshot import load_snapshot, save_snapshot
+
+
+@pytest.fixture
+def factory() -> InMemoryFactory:
+    players = [make_model(PlayerModel, id=i, code=100 + i, web_name=f"Player {i}", squad_number=i if i > 1 else None) for i in (1, 2, 3)]
+
+    return InMemoryFactory(
+        teams=[replace(team_model(), id=i, code=i, name=f"Team {i}") for i in (1, 2)],
+        events=[replace(event_model(), id=i, name=f"Gameweek {i}") for i in (1, 2)],
+        fixtures=[fixture_model()],
+        players=players,
+        positions=[position_model()],
+        player_summaries={
+            1: [make_model(PlayerSummaryModel, element=1, round=gw, kickoff_time="2024-08-16T19:00:00Z", **NUMERIC_STRS) for gw in (1, 2)],
+            3: [make_model(PlayerSummaryModel, element=3, round=1, kickoff_time="2024-08-16T19:00:00Z", **dict(NUMERIC_STRS, influence="12.4"))],
+        },
+    )
+
+
+def test_round_trip(tmp_path, factory: InMemoryFactory) -> None:
+    save_snapshot(factory, str(tmp_path))
+    loaded = load_snapshot(str(tmp_path))
+
+    for name in ("teams", "events", "fixtures", "players", "positions"):
+        loaded_models = [x.value for x in getattr(loaded, name)().get_all()]
+        assert loaded_models == [x.value for x in getattr(factory, name)().get_all()], name
+
+    players = {player.id: player for player in loaded.players().get_all()}
+    assert [x.value.round for x in loaded.player_summary(players[1]).get_all()] == [1, 2]
+    assert loaded.player_summary(players[2]).get_all() == []
+    assert [x.value.influence for x in loaded.player_summary(players[3]).get_all()] == ["12.4"]
+    assert players[1].value.squad_number is None
+
+
+def test_round_trip_keeps_numeric_strings(tmp_path) -> None:
+    player = make_model(PlayerModel, id=1, code=101)
+    summaries = [
+        make_model(PlayerSummaryModel, element=1, round=1, **dict(NUMERIC_STRS, influence="12", threat="0.00", creativity="")),
+        make_model(PlayerSummaryModel, element=1, round=2, **dict(NUMERIC_STRS, influence="1.5", threat="12", creativity="0.00")),
+    ]
+    save_snapshot(InMemoryFactory(players=[player], player_summaries={1: summaries}), str(tmp_path))
+    loaded = load_snapshot(str(tmp_path))
+
+    loaded_player = loaded.players().get_by_id(1)
+    assert loaded_player is not None
+    assert [x.value for x in loaded.player_summary(loaded_player).get_all()] == summaries
+
+
+def test_unsupported_entities(tmp_path, factory: InMemoryFactory) -> None:
+    save_snapshot(factory, str(tmp_path), include_players=False)
+    loaded = load_snapshot(str(tmp_path))
+    player = loaded.players().get_by_id(1)
+    assert player is not None
+
+    with pytest.raises(NotImplementedError):
+        loaded.chips()
+
+    with pytest.raises(NotImplementedError):
+        loaded.player_summary(player)
+
+
+def test_schema_version_checked(tmp_path, factory: InMemoryFactory) -> None:
+    save_snapshot(factory, str(tmp_path), include_players=False)
+
+    manifest_path = os.path.join(tmp_path, "manifest.json")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    manifest["schema_version"] = 0
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+    with pytest.raises(ValueError):
+        load_snapshot(str(tmp_path))
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from tests.util.util import InMemoryFactory, make_model
+from fplpy.objects.player.model import PlayerModel
+from fplpy.objects.player_summary.model import PlayerSummaryModel
+from fplpy.storage.stat_cube import StatCube, build_stat_cube
+
+
+def summary(element: int, gameweek: int, **overrides: object) -> PlayerSummaryModel:
+    return make_model(PlayerSummaryModel, element=element, round=gameweek, influence="1.5", **overrides)
+
+
+@pytest.fixture
+def factories() -> dict[str, InMemoryFactory]:
+    return {
+        "2023-24": InMemoryFactory(
+            players=[make_model(PlayerModel, id=1, code=500)],
+            player_summaries={1: [summary(1, 1, total_points=2, value=50), summary(1, 2, total_points=6, value=51)]},
+        ),
+        "2024-25": InMemoryFactory(  # same player, new id, and a new player
+            players=[make_model(PlayerModel, id=7, code=500), make_model(PlayerModel, id=1, code=900)],
+            player_summaries={
+                7: [summary(7, 1, total_points=3, value=55), summary(7, 1, total_points=9, value=56)],
+                1: [summary(1, 38, total_points=1, value=45)],
+            },
+        ),
+    }
+
+
+def test_build_and_open(tmp_path, factories: dict[str, InMemoryFactory]) -> None:
+    path = str(tmp_path / "cube.npy")
+    build_stat_cube(path, factories, stats=("total_points", "value", "influence"))
+
+    cube = StatCube.open(path)
+
+    assert cube.values.shape == (2, 2, 38, 3)
+    assert not cube.values.flags.writeable
+    assert cube.player_codes == [500, 900]
+    assert cube.get("2023-24", 500, 2, "total_points") == 6
+    assert cube.get("2023-24", 500, 2, "influence") == 1.5
+    assert cube.get("2024-25", 500, 1, "total_points") == 12  # double gameweek summed
+    assert cube.get("2024-25", 500, 1, "value") == 56  # level stats keep the last fixture
+    assert cube.get("2024-25", 900, 38, "value") == 45
+    assert np.isnan(cube.get("2023-24", 900, 1, "total_points"))
+    assert np.isnan(cube.get("2023-24", 500, 3, "total_points"))
+
+
+def test_views(tmp_path, factories: dict[str, InMemoryFactory]) -> None:
+    cube = build_stat_cube(str(tmp_path / "cube.npy"), factories, stats=("total_points", "value"))
+
+    assert cube.player(500).shape == (2, 38, 2)
+    assert cube.season("2024-25").shape == (2, 38, 2)
+    assert np.nansum(cube.stat("total_points")[0]) == 8
+
+
+def test_values_must_be_4d() -> None:
+    with pytest.raises(ValueError, match="4 dimensions"):
+        StatCube(np.zeros((1, 2, 38), dtype=np.float32), ["2024-25"], [500, 900], ["total_points"])
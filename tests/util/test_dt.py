@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
-from datetime import datetime
-from fplpy.util.dt import string_to_datetime, datetime_to_string, date_to_string, time_to_string
+from datetime import datetime, timezone
+from fplpy.util.dt import string_to_datetime, datetime_to_string, date_to_string, time_to_string, \
+    parse_iso_datetime, parse_iso_datetimes
 
 @pytest.mark.parametrize("input_date,expected", [(datetime(2000, 2, 10, 9, 30, 00), "09:30 - Thu 10 February 2000")])
 def test_datetime_to_string(input_date: datetime, expected: str) -> None:
@@ -19,4 +21,24 @@ def test_date_to_string(input_date: datetime, expected: str) -> None:
 
 @pytest.mark.parametrize("input_date,expected", [(datetime(2000, 2, 10, 9, 30, 00), "09:30")])
 def test_time_to_string(input_date: datetime, expected: str) -> None:
-    assert time_to_string(input_date) == expected
\ No newline at end of file
+    assert time_to_string(input_date) == expected
+
+
+@pytest.mark.parametrize("input_str,expected", [
+    ("2000-02-10T09:30:00Z", datetime(2000, 2, 10, 9, 30, 00, tzinfo=timezone.utc)),
+    ("2000-02-10", datetime(2000, 2, 10, tzinfo=timezone.utc)),
+    ("2000-02-10T10:30:00+01:00", datetime(2000, 2, 10, 9, 30, 00, tzinfo=timezone.utc)),
+])
+def test_parse_iso_datetime(input_str: str, expected: datetime) -> None:
+    parsed = parse_iso_datetime(input_str)
+
+    assert parsed == expected
+    assert parsed.tzinfo == timezone.utc
+
+
+def test_parse_iso_datetimes() -> None:
+    parsed = parse_iso_datetimes(["2000-02-10T09:30:00Z", None, "not a date", "2000-02-10T09:30:00Z"])
+
+    assert parsed.dtype == np.dtype("datetime64[us]")
+    assert parsed[0] == parsed[3] == np.datetime64("2000-02-10T09:30:00")
+    assert np.isnat(parsed[1]) and np.isnat(parsed[2])
@@ -0,0 +1,74 @@
+import pytest
+from typing import Optional
+from fplpy.util.external import http_cache
+from fplpy.util.external.http_cache import HTTPCache
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: Optional[dict[str, str]] = None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class FakeServer:
+    def __init__(self) -> None:
+        self.requests: list[Optional[dict[str, str]]] = []
+        self.body = b'{"a": 1}'
+
+    def __call__(self, url: str, retries: int = 5, headers: Optional[dict[str, str]] = None, transport: object = None) -> FakeResponse:
+        self.requests.append(headers)
+
+        if headers and headers.get("If-None-Match") == '"v1"' and self.body == b'{"a": 1}':
+            return FakeResponse(304)
+
+        return FakeResponse(200, self.body, {"ETag": '"v1"', "Last-Modified": "Sat, 01 Jan 2000 00:00:00 GMT"})
+
+
+URL = "https://fantasy.premierleague.com/api/bootstrap-static/"
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> FakeServer:
+    fake = FakeServer()
+    monkeypatch.setattr(http_cache, "safe_request", fake)
+
+    return fake
+
+
+def test_fresh_entry_served_from_disk(tmp_path, server: FakeServer) -> None:
+    cache = HTTPCache(str(tmp_path))
+
+    assert cache.fetch(URL) == b'{"a": 1}'
+    assert HTTPCache(str(tmp_path)).fetch(URL) == b'{"a": 1}'
+    assert len(server.requests) == 1
+
+
+def test_stale_entry_revalidated(tmp_path, server: FakeServer) -> None:
+    cache = HTTPCache(str(tmp_path), ttls={}, default_ttl=0)
+    cache.fetch(URL)
+
+    assert cache.fetch(URL) == b'{"a": 1}'
+    assert server.requests[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Sat, 01 Jan 2000 00:00:00 GMT"}
+
+    server.body = b'{"a": 2}'
+    assert cache.fetch(URL) == b'{"a": 2}'
+
+
+def test_ttl_longest_match(tmp_path) -> None:
+    cache = HTTPCache(str(tmp_path), ttls={"example.com/": 10, "example.com/api/": 20}, default_ttl=5)
+
+    assert cache.ttl_for("https://example.com/api/x") == 20
+    assert cache.ttl_for("https://example.com/x") == 10
+    assert cache.ttl_for("https://other.com/x") == 5
+
+
+def test_offline(tmp_path, server: FakeServer) -> None:
+    HTTPCache(str(tmp_path)).fetch(URL)
+    offline = HTTPCache(str(tmp_path), ttls={}, default_ttl=0, offline=True)
+
+    assert offline.fetch(URL) == b'{"a": 1}'
+    assert len(server.requests) == 1
+
+    with pytest.raises(Exception):
+        offline.fetch(URL + "other/")
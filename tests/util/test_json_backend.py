@@ -0,0 +1,50 @@
+import os
+import pytest
+from fplpy.util.external.api import call_api
+from fplpy.util.external.json_backend import get_json_backend, loads_bytes, orjson_loads, set_json_backend, stdlib_loads
+from fplpy.util.external.transport import LocalFileTransport
+
+
+PAYLOAD = '{"web_name": "Ødegaard", "first_name": "Gabriel dos Santos Magalh\\u00e3es", "now_cost": 85}'.encode("utf8")
+EXPECTED = {"web_name": "Ødegaard", "first_name": "Gabriel dos Santos Magalhães", "now_cost": 85}
+
+
+@pytest.fixture
+def restore_backend():
+    yield
+    set_json_backend(None)
+
+
+def test_stdlib_loads() -> None:
+    assert stdlib_loads(PAYLOAD) == EXPECTED
+
+
+def test_orjson_loads() -> None:
+    pytest.importorskip("orjson")
+
+    assert orjson_loads(PAYLOAD) == EXPECTED
+
+
+def test_call_api_keeps_non_ascii(tmp_path) -> None:
+    path = os.path.join(tmp_path, "example.com/api/players/index")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as f:
+        f.write(PAYLOAD)
+
+    assert call_api("https://example.com/api/players/", transport=LocalFileTransport(str(tmp_path))) == EXPECTED
+
+
+def test_set_json_backend(restore_backend) -> None:
+    calls = []
+
+    def loads(content: bytes) -> object:
+        calls.append(content)
+        return stdlib_loads(content)
+
+    set_json_backend(loads)
+
+    assert loads_bytes(PAYLOAD) == EXPECTED
+    assert calls == [PAYLOAD]
+
+    set_json_backend(None)
+    assert get_json_backend() is not loads
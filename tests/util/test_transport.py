@@ -0,0 +1,58 @@
+import logging
+import os
+from typing import Mapping, Optional
+from fplpy.util.external import general
+from fplpy.util.external.api import call_api
+from fplpy.util.external.general import safe_request
+from fplpy.util.external.github import github_csv_to_dict, iter_github_csv
+from fplpy.util.external.transport import LocalFileTransport, Transport, TransportResponse, mirror_path
+
+
+def write(root: str, relative_path: str, content: bytes) -> None:
+    path = os.path.join(root, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def test_mirror_path() -> None:
+    assert mirror_path("https://example.com/api/fixtures/") == "example.com/api/fixtures/index"
+    assert mirror_path("https://example.com/data/teams.csv") == "example.com/data/teams.csv"
+
+
+def test_local_file_transport(tmp_path) -> None:
+    root = str(tmp_path)
+    write(root, "example.com/api/fixtures/index", b'[{"id": 1}]')
+    write(root, "example.com/data/teams.csv", b"id,name\n1,Arsenal\n")
+    transport = LocalFileTransport(root)
+
+    assert call_api("https://example.com/api/fixtures/", transport=transport) == [{"id": 1}]
+    assert github_csv_to_dict("https://example.com/data/teams.csv", transport=transport) == [{"id": "1", "name": "Arsenal"}]
+    assert list(iter_github_csv("https://example.com/data/teams.csv", transport=transport)) == [{"id": "1", "name": "Arsenal"}]
+    assert transport.get("https://example.com/missing.csv").status_code == 404
+
+
+class RateLimitedTransport(Transport):
+    """Answers 429 once, then 200."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> TransportResponse:
+        self.calls += 1
+        if self.calls == 1:
+            return TransportResponse(429, b"", {"Retry-After": "3"})
+
+        return TransportResponse(200, b"[]")
+
+
+def test_safe_request_logs_rate_limit(monkeypatch, caplog) -> None:
+    waits: list[float] = []
+    monkeypatch.setattr(general.time, "sleep", waits.append)
+
+    with caplog.at_level(logging.WARNING, logger=general.__name__):
+        response = safe_request("https://example.com/api/", transport=RateLimitedTransport())
+
+    assert response.status_code == 200
+    assert waits == [3]
+    assert "Rate limited" in caplog.text
@@ -6,31 +6,38 @@ from fplpy.util.typed_ordered_set import TypedOrderedSet  # Update this with the
 
 E = TypeVar("E")
 
+
 @pytest.fixture
 def sample_data() -> list[int]:
     return [1, 2, 3]
 
+
 @pytest.fixture
 def set_instance(sample_data: list[int]) -> TypedOrderedSet:
     return TypedOrderedSet(sample_data)
 
+
 def test_creation(set_instance: TypedOrderedSet) -> None:
     assert isinstance(set_instance, MutableSequence)
     assert len(set_instance) == 3
 
+
 def test_type_enforcement() -> None:
     with pytest.raises(TypeError):
         TypedOrderedSet(["a", 1])  # Mixed types should fail
 
+
 def test_uniqueness_enforced() -> None:
     with pytest.raises(ValueError):
         s = TypedOrderedSet([1, 2, 3])
         s.insert(1, 2)  # Inserting duplicate should fail
 
+
 def test_order_preserved(sample_data: list[int]) -> None:
     s = TypedOrderedSet(sample_data)
     assert s.to_list() == sample_data  # Ensure same order
 
+
 def test_equality_check() -> None:
     s1 = TypedOrderedSet([1, 2, 3])
     s2 = TypedOrderedSet([1, 2, 3])
@@ -39,19 +46,57 @@ def test_equality_check() -> None:
     assert s1 == s2  # Exact match
     assert s1 != s3  # Order matters
 
+
 def test_get_random(set_instance: TypedOrderedSet) -> None:
     assert set_instance.get_random() in set_instance.to_list()  # Should always be a valid element
 
+
 def test_empty_detection() -> None:
     s = TypedOrderedSet([])
     assert s.is_empty
 
+
 def test_deletion(set_instance: TypedOrderedSet) -> None:
     del set_instance[1]  # Remove second item
     assert len(set_instance) == 2
     assert set_instance.to_list() == [1, 3]  # Item 2 should be gone
 
+
 def test_insert() -> None:
     s = TypedOrderedSet([1, 2])
     s.insert(1, 3)
-    assert s.to_list() == [1, 3, 2]  # Insert at index 1
\ No newline at end of file
+    assert s.to_list() == [1, 3, 2]  # Insert at index 1
+
+
+def test_membership_after_changes() -> None:
+    s = TypedOrderedSet([1, 2, 3, 4])
+    s[0] = 5
+    del s[1:3]
+    s[1:2] = [6]
+
+    assert s.to_list() == [5, 6]
+    assert 5 in s and 6 in s
+    assert not any(x in s for x in (1, 2, 3, 4))
+    assert [] not in s  # unhashable
+
+
+def test_extend_checks_before_adding() -> None:
+    s = TypedOrderedSet([1, 2])
+
+    with pytest.raises(ValueError):
+        s.extend([3, 1])
+    with pytest.raises(TypeError):
+        s.extend([3, "a"])
+
+    s.extend([3, 4])
+    assert s.to_list() == [1, 2, 3, 4]
+
+
+def test_slice_and_from_trusted() -> None:
+    s = TypedOrderedSet.from_trusted([1, 2, 3, 4])
+    part = s[1:3]
+
+    assert isinstance(part, TypedOrderedSet)
+    assert part.to_list() == [2, 3] and 2 in part
+    with pytest.raises(TypeError):
+        part.append("a")  # type carried over to the slice
@@ -1,5 +1,122 @@
-from fplpy.objects._element.model import Model
+from dataclasses import fields
+from typing import Any, Mapping, Optional, Sequence, Type
+from fplpy.objects._element.model import Model, T_model
+from fplpy.objects._element.source import DataSourceModel
+from fplpy.objects.summary import ObjTypes, RepoTypes
+from fplpy.repository_factory.template import RepositoryFactoryTemplate
+from fplpy.util.external.transport import LocalFileTransport, TransportResponse
 
 
 def wrap_argument(model: Model) -> dict[str, Model]:
     return {"attributes": model}
+
+
+__DEFAULTS = {int: 0, float: 0.0, bool: False, str: ""}
+
+# `NUMERIC_STR` fields of summaries and histories, in the mixed forms the sources use
+NUMERIC_STRS = {
+    "influence": "12", "creativity": "0.00", "threat": "1.5", "ict_index": "1.4",
+    "expected_goals": "0.00", "expected_assists": "0.12", "expected_goal_involvements": "0.12", "expected_goals_conceded": "1.50",
+}
+
+
+def make_model(model_cls: Type[T_model], **overrides: Any) -> T_model:
+    """Builds a model with zero/empty values for every field not given in `overrides`."""
+    values: dict[str, Any] = {}
+    for f in fields(model_cls):
+        if f.name in overrides:
+            values[f.name] = overrides[f.name]
+        elif f.type in __DEFAULTS:
+            values[f.name] = __DEFAULTS[f.type]
+        elif str(f.type).startswith("list"):
+            values[f.name] = []
+        else:  # Optional[...]
+            values[f.name] = None
+
+    return model_cls(**values)
+
+
+class InMemorySource(DataSourceModel[T_model]):
+    def __init__(self, models: Sequence[T_model]) -> None:
+        self.models = list(models)
+        self.calls = 0
+
+    def get(self) -> list[T_model]:
+        self.calls += 1
+        return list(self.models)
+
+    def _get_raw_data(self) -> list[dict[str, Any]]:
+        return []
+
+
+class InMemoryFactory(RepositoryFactoryTemplate):
+    """Factory over fixed lists of models, recording which repositories were requested."""
+
+    def __init__(
+        self,
+        teams: Sequence[Any] = (),
+        events: Sequence[Any] = (),
+        fixtures: Sequence[Any] = (),
+        players: Sequence[Any] = (),
+        positions: Sequence[Any] = (),
+        game_settings: Sequence[Any] = (),
+        player_summaries: Optional[dict[int, Sequence[Any]]] = None,
+    ) -> None:
+        self.calls: list[str] = []
+        self.__teams = teams
+        self.__events = events
+        self.__fixtures = fixtures
+        self.__players = players
+        self.__positions = positions
+        self.__game_settings = game_settings
+        self.__player_summaries = player_summaries or {}
+
+    def teams(self) -> RepoTypes.TeamRepo:
+        self.calls.append("teams")
+        return RepoTypes.TeamRepo(ObjTypes.Team, InMemorySource(self.__teams))
+
+    def events(self) -> RepoTypes.EventRepo:
+        self.calls.append("events")
+        return RepoTypes.EventRepo(ObjTypes.Event, InMemorySource(self.__events))
+
+    def fixtures(self) -> RepoTypes.FixtureRepo:
+        self.calls.append("fixtures")
+        return RepoTypes.FixtureRepo(ObjTypes.Fixture, InMemorySource(self.__fixtures))
+
+    def players(self) -> RepoTypes.PlayerRepo:
+        self.calls.append("players")
+        return RepoTypes.PlayerRepo(ObjTypes.Player, InMemorySource(self.__players))
+
+    def positions(self) -> RepoTypes.PositionRepo:
+        self.calls.append("positions")
+        return RepoTypes.PositionRepo(ObjTypes.Position, InMemorySource(self.__positions))
+
+    def game_settings(self) -> RepoTypes.GameSettingsRepo:
+        self.calls.append("game_settings")
+        return RepoTypes.GameSettingsRepo(ObjTypes.GameSettings, InMemorySource(self.__game_settings))
+
+    def player_summary(self, player: ObjTypes.Player) -> RepoTypes.PlayerSummaryRepo:
+        self.calls.append("player_summary")
+        models = self.__player_summaries.get(player.id, [])
+        return RepoTypes.PlayerSummaryRepo(ObjTypes.PlayerSummary, InMemorySource(models))
+
+    def player_history(self, player: ObjTypes.Player) -> RepoTypes.PlayerHistoryRepo:
+        raise NotImplementedError
+
+    def chips(self) -> RepoTypes.ChipRepo:
+        raise NotImplementedError
+
+    def labels(self) -> RepoTypes.LabelRepo:
+        raise NotImplementedError
+
+
+class CountingTransport(LocalFileTransport):
+    """Serves files under `root`, recording every URL asked for."""
+
+    def __init__(self, root: str) -> None:
+        super().__init__(root)
+        self.urls: list[str] = []
+
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None) -> TransportResponse:
+        self.urls.append(url)
+        return super().get(url, headers)